@@ -10,11 +10,37 @@ import textwrap
 # https://www.elastic.co/guide/en/elasticsearch/reference/current/analysis-simple-analyzer.html
 # Standard Analyzer is used for all text fields that don't explicitly specify an analyzer
 # https://www.elastic.co/guide/en/elasticsearch/reference/current/analysis-standard-analyzer.html
+# The "prefix" subfields index the edge n-grams of every term (up to 20 characters) of name-like fields,
+# so that search can match the prefixes of their terms without leading wildcard queries
+# https://www.elastic.co/guide/en/elasticsearch/reference/current/analysis-edgengram-tokenfilter.html
 TABLE_INDEX_MAP = textwrap.dedent(
     """
     {
     "settings": {
       "analysis": {
+        "filter": {
+          "prefix_filter": {
+            "type": "edge_ngram",
+            "min_gram": 1,
+            "max_gram": 20
+          },
+          "prefix_truncate_filter": {
+            "type": "truncate",
+            "length": 20
+          }
+        },
+        "analyzer": {
+          "prefix_analyzer": {
+            "type": "custom",
+            "tokenizer": "lowercase",
+            "filter": ["prefix_filter"]
+          },
+          "prefix_search_analyzer": {
+            "type": "custom",
+            "tokenizer": "lowercase",
+            "filter": ["prefix_truncate_filter"]
+          }
+        },
         "normalizer": {
           "column_names_normalizer": {
             "type": "custom",
@@ -30,6 +56,11 @@ TABLE_INDEX_MAP = textwrap.dedent(
               "type":"text",
               "analyzer": "simple",
               "fields": {
+                "prefix": {
+                  "type": "text",
+                  "analyzer": "prefix_analyzer",
+                  "search_analyzer": "prefix_search_analyzer"
+                },
                 "raw": {
                   "type": "keyword"
                 }
@@ -39,6 +70,11 @@ TABLE_INDEX_MAP = textwrap.dedent(
               "type":"text",
               "analyzer": "simple",
               "fields": {
+                "prefix": {
+                  "type": "text",
+                  "analyzer": "prefix_analyzer",
+                  "search_analyzer": "prefix_search_analyzer"
+                },
                 "raw": {
                   "type": "keyword"
                 }
@@ -59,6 +95,11 @@ TABLE_INDEX_MAP = textwrap.dedent(
               "type":"text",
               "analyzer": "simple",
               "fields": {
+                "prefix": {
+                  "type": "text",
+                  "analyzer": "prefix_analyzer",
+                  "search_analyzer": "prefix_search_analyzer"
+                },
                 "raw": {
                   "type": "keyword",
                   "normalizer": "column_names_normalizer"
@@ -118,6 +159,29 @@ DASHBOARD_ELASTICSEARCH_INDEX_MAPPING = textwrap.dedent(
     {
         "settings": {
           "analysis": {
+            "filter": {
+              "prefix_filter": {
+                "type": "edge_ngram",
+                "min_gram": 1,
+                "max_gram": 20
+              },
+              "prefix_truncate_filter": {
+                "type": "truncate",
+                "length": 20
+              }
+            },
+            "analyzer": {
+              "prefix_analyzer": {
+                "type": "custom",
+                "tokenizer": "lowercase",
+                "filter": ["prefix_filter"]
+              },
+              "prefix_search_analyzer": {
+                "type": "custom",
+                "tokenizer": "lowercase",
+                "filter": ["prefix_truncate_filter"]
+              }
+            },
             "normalizer": {
               "lowercase_normalizer": {
                 "type": "custom",
@@ -134,6 +198,11 @@ DASHBOARD_ELASTICSEARCH_INDEX_MAPPING = textwrap.dedent(
                   "type":"text",
                   "analyzer": "simple",
                   "fields": {
+                    "prefix": {
+                      "type": "text",
+                      "analyzer": "prefix_analyzer",
+                      "search_analyzer": "prefix_search_analyzer"
+                    },
                     "raw": {
                       "type": "keyword",
                       "normalizer": "lowercase_normalizer"
@@ -144,6 +213,11 @@ DASHBOARD_ELASTICSEARCH_INDEX_MAPPING = textwrap.dedent(
                   "type":"text",
                   "analyzer": "simple",
                   "fields": {
+                    "prefix": {
+                      "type": "text",
+                      "analyzer": "prefix_analyzer",
+                      "search_analyzer": "prefix_search_analyzer"
+                    },
                     "raw": {
                       "type": "keyword",
                       "normalizer": "lowercase_normalizer"
@@ -172,6 +246,11 @@ DASHBOARD_ELASTICSEARCH_INDEX_MAPPING = textwrap.dedent(
                   "type":"text",
                   "analyzer": "simple",
                   "fields": {
+                    "prefix": {
+                      "type": "text",
+                      "analyzer": "prefix_analyzer",
+                      "search_analyzer": "prefix_search_analyzer"
+                    },
                     "raw": {
                       "type": "keyword"
                     }
@@ -202,6 +281,33 @@ DASHBOARD_ELASTICSEARCH_INDEX_MAPPING = textwrap.dedent(
 USER_INDEX_MAP = textwrap.dedent(
     """
     {
+    "settings": {
+      "analysis": {
+        "filter": {
+          "prefix_filter": {
+            "type": "edge_ngram",
+            "min_gram": 1,
+            "max_gram": 20
+          },
+          "prefix_truncate_filter": {
+            "type": "truncate",
+            "length": 20
+          }
+        },
+        "analyzer": {
+          "prefix_analyzer": {
+            "type": "custom",
+            "tokenizer": "lowercase",
+            "filter": ["prefix_filter"]
+          },
+          "prefix_search_analyzer": {
+            "type": "custom",
+            "tokenizer": "lowercase",
+            "filter": ["prefix_truncate_filter"]
+          }
+        }
+      }
+    },
     "mappings":{
         "user":{
           "properties": {
@@ -209,6 +315,11 @@ USER_INDEX_MAP = textwrap.dedent(
               "type":"text",
               "analyzer": "simple",
               "fields": {
+                "prefix": {
+                  "type": "text",
+                  "analyzer": "prefix_analyzer",
+                  "search_analyzer": "prefix_search_analyzer"
+                },
                 "raw": {
                   "type": "keyword"
                 }
@@ -218,6 +329,11 @@ USER_INDEX_MAP = textwrap.dedent(
               "type":"text",
               "analyzer": "simple",
               "fields": {
+                "prefix": {
+                  "type": "text",
+                  "analyzer": "prefix_analyzer",
+                  "search_analyzer": "prefix_search_analyzer"
+                },
                 "raw": {
                   "type": "keyword"
                 }
@@ -227,6 +343,11 @@ USER_INDEX_MAP = textwrap.dedent(
               "type":"text",
               "analyzer": "simple",
               "fields": {
+                "prefix": {
+                  "type": "text",
+                  "analyzer": "prefix_analyzer",
+                  "search_analyzer": "prefix_search_analyzer"
+                },
                 "raw": {
                   "type": "keyword"
                 }
@@ -236,6 +357,11 @@ USER_INDEX_MAP = textwrap.dedent(
               "type":"text",
               "analyzer": "simple",
               "fields": {
+                "prefix": {
+                  "type": "text",
+                  "analyzer": "prefix_analyzer",
+                  "search_analyzer": "prefix_search_analyzer"
+                },
                 "raw": {
                   "type": "keyword"
                 }
@@ -262,6 +388,29 @@ FEATURE_INDEX_MAP = textwrap.dedent(
     {
     "settings": {
       "analysis": {
+        "filter": {
+          "prefix_filter": {
+            "type": "edge_ngram",
+            "min_gram": 1,
+            "max_gram": 20
+          },
+          "prefix_truncate_filter": {
+            "type": "truncate",
+            "length": 20
+          }
+        },
+        "analyzer": {
+          "prefix_analyzer": {
+            "type": "custom",
+            "tokenizer": "lowercase",
+            "filter": ["prefix_filter"]
+          },
+          "prefix_search_analyzer": {
+            "type": "custom",
+            "tokenizer": "lowercase",
+            "filter": ["prefix_truncate_filter"]
+          }
+        },
         "normalizer": {
           "lowercase_normalizer": {
             "type": "custom",
@@ -277,6 +426,11 @@ FEATURE_INDEX_MAP = textwrap.dedent(
               "type":"text",
               "analyzer": "simple",
               "fields": {
+                "prefix": {
+                  "type": "text",
+                  "analyzer": "prefix_analyzer",
+                  "search_analyzer": "prefix_search_analyzer"
+                },
                 "raw": {
                   "type": "keyword",
                   "normalizer": "lowercase_normalizer"
@@ -287,6 +441,11 @@ FEATURE_INDEX_MAP = textwrap.dedent(
               "type":"text",
               "analyzer": "simple",
               "fields": {
+                "prefix": {
+                  "type": "text",
+                  "analyzer": "prefix_analyzer",
+                  "search_analyzer": "prefix_search_analyzer"
+                },
                 "raw": {
                   "type": "keyword",
                   "normalizer": "lowercase_normalizer"
@@ -16,6 +16,13 @@ class SQLAlchemyExtractor(Extractor):
     CONN_STRING = 'conn_string'
     EXTRACT_SQL = 'extract_sql'
     CONNECT_ARGS = 'connect_args'
+    # Uses a server side cursor, on databases that support it, so that the result set is not loaded in memory at once
+    STREAM_RESULTS = 'stream_results'
+    # Number of rows buffered at a time when streaming results
+    FETCH_SIZE = 'fetch_size'
+
+    DEFAULT_CONFIG = ConfigFactory.from_dict({STREAM_RESULTS: True,
+                                              FETCH_SIZE: 1000})
     """
     An Extractor that extracts records via SQLAlchemy. Database that supports SQLAlchemy can use this extractor
     """
@@ -25,7 +32,7 @@ class SQLAlchemyExtractor(Extractor):
         Establish connections and import data model class if provided
         :param conf:
         """
-        self.conf = conf
+        self.conf = conf.with_fallback(SQLAlchemyExtractor.DEFAULT_CONFIG)
         self.conn_string = conf.get_string(SQLAlchemyExtractor.CONN_STRING)
 
         self.connection = self._get_connection()
@@ -54,7 +61,10 @@ class SQLAlchemyExtractor(Extractor):
             ).items()
         }
         engine = create_engine(self.conn_string, connect_args=connect_args)
-        conn = engine.connect()
+        # max_row_buffer caps the rows fetched from the server side cursor at a time
+        conn = engine.connect().execution_options(
+            stream_results=self.conf.get_bool(SQLAlchemyExtractor.STREAM_RESULTS),
+            max_row_buffer=self.conf.get_int(SQLAlchemyExtractor.FETCH_SIZE))
         return conn
 
     def _execute_query(self) -> None:
@@ -65,8 +75,9 @@ class SQLAlchemyExtractor(Extractor):
             self.results = self.connection.execute(self.extract_sql)
 
         if hasattr(self, 'model_class'):
-            results = [self.model_class(**result)
-                       for result in self.results]
+            # Lazily converts the result to model one row at a time
+            results = (self.model_class(**result)
+                       for result in self.results)
         else:
             results = self.results
         self.iter = iter(results)
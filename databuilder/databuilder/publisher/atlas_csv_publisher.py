@@ -1,13 +1,13 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 import logging
+from itertools import islice
 from os import listdir
 from os.path import isfile, join
 from typing import (
     Any, Dict, Iterator, List, Tuple,
 )
 
-import pandas
 from amundsen_common.utils.atlas import AtlasCommonParams, AtlasCommonTypes
 from apache_atlas.exceptions import AtlasServiceException
 from apache_atlas.model.glossary import (
@@ -21,6 +21,7 @@ from apache_atlas.model.typedef import AtlasClassificationDef, AtlasTypesDef
 from pyhocon import ConfigTree
 
 from databuilder.publisher.base_publisher import Publisher
+from databuilder.publisher.csv_record_reader import read_csv_records
 from databuilder.types.atlas import AtlasEntityInitializer
 from databuilder.utils.atlas import (
     AtlasRelationshipTypes, AtlasSerializedEntityFields, AtlasSerializedEntityOperation,
@@ -83,12 +84,12 @@ class AtlasCSVPublisher(Publisher):
         """
         LOGGER.info('Creating entities using Entity files: %s', self._entity_files)
         for entity_file in self._entity_files:
-            entities_to_create, entities_to_update, \
-                glossary_terms_create, classifications_create = self._create_entity_instances(entity_file=entity_file)
-            self._sync_entities_to_atlas(entities_to_create)
-            self._update_entities(entities_to_update)
-            self._create_glossary_terms(glossary_terms_create)
-            self._create_classifications(classifications_create)
+            for entities_to_create, entities_to_update, glossary_terms_create, classifications_create in \
+                    self._create_entity_instances(entity_file=entity_file):
+                self._sync_entities_to_atlas(entities_to_create)
+                self._update_entities(entities_to_update)
+                self._create_glossary_terms(glossary_terms_create)
+                self._create_classifications(classifications_create)
 
         LOGGER.info('Creating relations using relation files: %s', self._relationship_files)
         for relation_file in self._relationship_files:
@@ -118,22 +119,21 @@ class AtlasCSVPublisher(Publisher):
         :return:
         """
 
-        with open(relation_file, encoding='utf8') as relation_csv:
-            for relation_record in pandas.read_csv(relation_csv, na_filter=False).to_dict(orient='records'):
-                if relation_record[AtlasSerializedRelationshipFields.relation_type] == AtlasRelationshipTypes.tag:
-                    self._assign_glossary_term(relation_record)
-                    continue
-                elif relation_record[AtlasSerializedRelationshipFields.relation_type] == AtlasRelationshipTypes.badge:
-                    self._assign_classification(relation_record)
-                    continue
+        for relation_record in read_csv_records(relation_file):
+            if relation_record[AtlasSerializedRelationshipFields.relation_type] == AtlasRelationshipTypes.tag:
+                self._assign_glossary_term(relation_record)
+                continue
+            elif relation_record[AtlasSerializedRelationshipFields.relation_type] == AtlasRelationshipTypes.badge:
+                self._assign_classification(relation_record)
+                continue
 
-                relation = self._create_relation(relation_record)
-                try:
-                    self._atlas_client.relationship.create_relationship(relation)
-                except AtlasServiceException:
-                    LOGGER.error('Fail to create atlas relationship', exc_info=True)
-                except Exception as e:
-                    LOGGER.error(e)
+            relation = self._create_relation(relation_record)
+            try:
+                self._atlas_client.relationship.create_relationship(relation)
+            except AtlasServiceException:
+                LOGGER.error('Fail to create atlas relationship', exc_info=True)
+            except Exception as e:
+                LOGGER.error(e)
 
     def _render_unique_attributes(self, entity_type: str, qualified_name: str) -> Dict[Any, Any]:
         """
@@ -176,19 +176,26 @@ class AtlasCSVPublisher(Publisher):
 
         return relation
 
-    def _create_entity_instances(self, entity_file: str) -> Tuple[List[AtlasEntity], List[AtlasEntity],
-                                                                  List[Dict], List[Dict]]:
+    def _create_entity_instances(self, entity_file: str) -> Iterator[Tuple[List[AtlasEntity], List[AtlasEntity],
+                                                                           List[Dict], List[Dict]]]:
         """
-        Go over the entities file and try creating instances
+        Go over the entities file and try creating instances, ATLAS_ENTITY_CREATE_BATCH_SIZE records at a time so that
+        the memory used doesn't grow with the size of the file
         :param entity_file:
-        :return:
+        :return: the instances of every batch of records
         """
-        entities_to_create = []
-        entities_to_update = []
-        glossary_terms_to_create = []
-        classifications_to_create = []
-        with open(entity_file, encoding='utf8') as entity_csv:
-            for entity_record in pandas.read_csv(entity_csv, na_filter=False).to_dict(orient='records'):
+        batch_size = self._config.get_int(AtlasCSVPublisher.ATLAS_ENTITY_CREATE_BATCH_SIZE)
+        entity_records = read_csv_records(entity_file)
+        while True:
+            entity_batch = list(islice(entity_records, batch_size))
+            if not entity_batch:
+                return
+
+            entities_to_create = []
+            entities_to_update = []
+            glossary_terms_to_create = []
+            classifications_to_create = []
+            for entity_record in entity_batch:
                 if entity_record[AtlasSerializedEntityFields.type_name] == AtlasCommonTypes.tag:
                     glossary_terms_to_create.append(entity_record)
                     continue
@@ -201,7 +208,7 @@ class AtlasCSVPublisher(Publisher):
                     entities_to_create.append(self._create_entity_from_dict(entity_record))
                 if entity_record[AtlasSerializedEntityFields.operation] == AtlasSerializedEntityOperation.UPDATE:
                     entities_to_update.append(self._create_entity_from_dict(entity_record))
-        return entities_to_create, entities_to_update, glossary_terms_to_create, classifications_to_create
+            yield entities_to_create, entities_to_update, glossary_terms_to_create, classifications_to_create
 
     def _extract_entity_relations_details(self, relation_details: str) -> Iterator[Tuple]:
         """
@@ -0,0 +1,75 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+from io import open
+from typing import (
+    Any, Dict, Iterator, Optional, Set,
+)
+
+import pandas
+
+# Number of CSV rows parsed into memory at once
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def read_csv_records(file_path: str,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     consistent_dtypes: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily iterates over the records of a CSV file produced by one of the file system loaders.
+    The file is parsed chunk by chunk so that only chunk_size rows are held in memory at a time, while values are
+    converted the same way as pandas.read_csv(csv_file, na_filter=False).to_dict(orient='records') does.
+    pandas infers the dtype of every chunk on its own though, so a column changing type after the first chunk
+    (e.g: '1', '2', then 'abc') is only read as a single read would with consistent_dtypes.
+    :param file_path:
+    :param chunk_size:
+    :param consistent_dtypes: whether to parse the file an extra time first, to give every column the same dtype in
+    all the chunks
+    :return: Iterator of dict where the key is the CSV header and the value is the row's value
+    """
+    dtypes = _infer_column_dtypes(file_path, chunk_size) if consistent_dtypes else None
+    with open(file_path, 'r', encoding='utf8') as csv_file:
+        for chunk in pandas.read_csv(csv_file, na_filter=False, chunksize=chunk_size, dtype=dtypes):
+            yield from chunk.to_dict(orient='records')
+
+
+def _infer_column_dtypes(file_path: str, chunk_size: int) -> Optional[Dict[str, Any]]:
+    """
+    pandas infers the dtype of a column separately for every chunk, e.g. a column of '1', '2', 'abc' is read as
+    1, 2 in a chunk and as '2', 'abc' in the next one when it changes type across chunks. This first pass
+    reconciles the dtypes of the chunks into the dtype a single read of the whole file gives the column:
+    integers and floats make floats, any other mix makes strings.
+    :return: the dtype of every column, None when the file fits in one chunk
+    """
+    chunk_dtypes: Dict[str, Set[str]] = {}
+    num_chunks = 0
+    with open(file_path, 'r', encoding='utf8') as csv_file:
+        for chunk in pandas.read_csv(csv_file, na_filter=False, chunksize=chunk_size):
+            num_chunks += 1
+            for column, dtype in chunk.dtypes.items():
+                chunk_dtypes.setdefault(column, set()).add(dtype.name)
+
+    if num_chunks <= 1:
+        return None
+
+    dtypes: Dict[str, Any] = {}
+    for column, names in chunk_dtypes.items():
+        if len(names) == 1:
+            dtypes[column] = names.pop()
+        elif names <= {'int64', 'float64'}:
+            dtypes[column] = 'float64'
+        else:
+            dtypes[column] = str
+    return dtypes
+
+
+def read_csv_first_record(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Parses only the header and the first row of a CSV file.
+    Useful to discover what a file contains (e.g: the label of a node file) without parsing the whole file.
+    :param file_path:
+    :return: The first record, or None if the file only has a header
+    """
+    with open(file_path, 'r', encoding='utf8') as csv_file:
+        records = pandas.read_csv(csv_file, na_filter=False, nrows=1).to_dict(orient='records')
+    return records[0] if records else None
@@ -1,12 +1,20 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import hashlib
+import itertools
 import json
 import logging
-from typing import List
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any, Deque, Dict, Iterable, Iterator, List, Optional,
+)
 
 from amundsen_common.models.index_map import TABLE_INDEX_MAP
-from elasticsearch.exceptions import NotFoundError
+from elasticsearch.exceptions import NotFoundError, TransportError
 from pyhocon import ConfigTree
 
 from databuilder.publisher.base_publisher import Publisher
@@ -22,6 +30,17 @@ class ElasticsearchPublisher(Publisher):
     and traffic is routed to new index.
 
     Old index is deleted after the alias swap is complete
+
+    In streaming mode, the file is read lazily and its lines are sent as they are, without being parsed, by
+    thread_count concurrent bulk requests of at most batch_size documents and max_chunk_bytes bytes.
+    Documents rejected with a retryable status (e.g: 429 when the bulk queue is full) are retried with an exponential
+    backoff. If any document still fails, the publish fails before the alias swap.
+
+    In incremental mode, a hash of every document (the line written by ElasticsearchDocument.to_json) is kept in a
+    local manifest keyed by document key. Only new and changed documents are indexed and removed documents deleted,
+    directly in the index behind the alias. The index is fully rebuilt, as in streaming mode, when there is no
+    manifest for the live index or the last full rebuild is older than full_rebuild_interval_seconds.
+    Documents are indexed with the document key as _id in this mode.
     """
     FILE_PATH_CONFIG_KEY = 'file_path'
     FILE_MODE_CONFIG_KEY = 'mode'
@@ -35,6 +54,26 @@ class ElasticsearchPublisher(Publisher):
     # config to control how many max documents to publish at a time
     ELASTICSEARCH_PUBLISHER_BATCH_SIZE = 'batch_size'
 
+    # streaming mode configs
+    ELASTICSEARCH_PUBLISHER_STREAMING = 'streaming'
+    # number of bulk requests sent concurrently
+    ELASTICSEARCH_PUBLISHER_THREAD_COUNT = 'thread_count'
+    # max size in bytes of a bulk request body
+    ELASTICSEARCH_PUBLISHER_MAX_CHUNK_BYTES = 'max_chunk_bytes'
+    # how many times rejected documents are retried, waiting initial_backoff seconds and twice as long on each retry
+    ELASTICSEARCH_PUBLISHER_MAX_RETRIES = 'max_retries'
+    ELASTICSEARCH_PUBLISHER_INITIAL_BACKOFF = 'initial_backoff'
+
+    # incremental mode configs
+    ELASTICSEARCH_PUBLISHER_INCREMENTAL = 'incremental'
+    # local file keeping the hash of every published document
+    ELASTICSEARCH_PUBLISHER_HASH_MANIFEST_PATH = 'hash_manifest_path'
+    # document field used as document key and _id, e.g: key for tables, email for users, uri for dashboards
+    ELASTICSEARCH_PUBLISHER_DOCUMENT_KEY_FIELD = 'document_key_field'
+    ELASTICSEARCH_PUBLISHER_FULL_REBUILD_INTERVAL_SECONDS = 'full_rebuild_interval_seconds'
+
+    RETRYABLE_STATUSES = (429, 502, 503, 504)
+
     DEFAULT_ELASTICSEARCH_INDEX_MAPPING = TABLE_INDEX_MAP
 
     def __init__(self) -> None:
@@ -55,6 +94,26 @@ class ElasticsearchPublisher(Publisher):
                                                    ElasticsearchPublisher.DEFAULT_ELASTICSEARCH_INDEX_MAPPING)
         self.elasticsearch_batch_size = self.conf.get(ElasticsearchPublisher.ELASTICSEARCH_PUBLISHER_BATCH_SIZE,
                                                       10000)
+        self.elasticsearch_streaming = self.conf.get_bool(ElasticsearchPublisher.ELASTICSEARCH_PUBLISHER_STREAMING,
+                                                          False)
+        self.elasticsearch_thread_count = self.conf.get_int(
+            ElasticsearchPublisher.ELASTICSEARCH_PUBLISHER_THREAD_COUNT, 4)
+        self.elasticsearch_max_chunk_bytes = self.conf.get_int(
+            ElasticsearchPublisher.ELASTICSEARCH_PUBLISHER_MAX_CHUNK_BYTES, 10 * 1024 * 1024)
+        self.elasticsearch_max_retries = self.conf.get_int(ElasticsearchPublisher.ELASTICSEARCH_PUBLISHER_MAX_RETRIES,
+                                                           3)
+        self.elasticsearch_initial_backoff = self.conf.get_float(
+            ElasticsearchPublisher.ELASTICSEARCH_PUBLISHER_INITIAL_BACKOFF, 2.0)
+
+        self.elasticsearch_incremental = self.conf.get_bool(
+            ElasticsearchPublisher.ELASTICSEARCH_PUBLISHER_INCREMENTAL, False)
+        if self.elasticsearch_incremental:
+            self.hash_manifest_path = self.conf.get_string(
+                ElasticsearchPublisher.ELASTICSEARCH_PUBLISHER_HASH_MANIFEST_PATH)
+        self.document_key_field = self.conf.get_string(
+            ElasticsearchPublisher.ELASTICSEARCH_PUBLISHER_DOCUMENT_KEY_FIELD, 'key')
+        self.full_rebuild_interval_seconds = self.conf.get_int(
+            ElasticsearchPublisher.ELASTICSEARCH_PUBLISHER_FULL_REBUILD_INTERVAL_SECONDS, 7 * 24 * 60 * 60)
         self.file_handler = open(self.file_path, self.file_mode)
 
     def _fetch_old_index(self) -> List[str]:
@@ -77,6 +136,14 @@ class ElasticsearchPublisher(Publisher):
         After upload, swap alias from {old_index} to {new_index} in a atomic operation
         to route traffic to {new_index}
         """
+        if self.elasticsearch_incremental:
+            self._publish_incremental()
+            return
+
+        if self.elasticsearch_streaming:
+            self._publish_streaming()
+            return
+
         actions = [json.loads(line) for line in self.file_handler.readlines()]
         # ensure new data exists
         if not actions:
@@ -108,6 +175,12 @@ class ElasticsearchPublisher(Publisher):
         if bulk_actions:
             self.elasticsearch_client.bulk(bulk_actions)
 
+        self._update_alias()
+
+    def _update_alias(self) -> None:
+        """
+        Swap alias from {old_index} to {new_index} and delete {old_index} in a atomic operation
+        """
         # fetch indices that have {elasticsearch_alias} as alias
         elasticsearch_old_indices = self._fetch_old_index()
 
@@ -123,5 +196,176 @@ class ElasticsearchPublisher(Publisher):
         # perform alias update and index delete in single atomic operation
         self.elasticsearch_client.indices.update_aliases(update_action)
 
+    def _read_documents(self) -> Optional[Iterator[str]]:
+        """
+        Lazily read the file's non empty lines
+        :return: Iterator of documents, or None if the file has no document
+        """
+        documents = (line.rstrip('\n') for line in self.file_handler if line.strip())
+        first_document = next(documents, None)
+        if first_document is None:
+            return None
+        return itertools.chain([first_document], documents)
+
+    def _publish_streaming(self) -> None:
+        """
+        Stream the file's lines to {new_index} with concurrent bulk requests, then swap the alias.
+        """
+        documents = self._read_documents()
+        # ensure new data exists
+        if documents is None:
+            LOGGER.warning("received no data to upload to Elasticsearch!")
+            return
+
+        self.elasticsearch_client.indices.create(index=self.elasticsearch_new_index, body=self.elasticsearch_mapping,
+                                                 params={'include_type_name': 'true'})
+
+        action_line = json.dumps(dict(index=dict(_index=self.elasticsearch_new_index,
+                                                 _type=self.elasticsearch_type)))
+        self._send_bulk(f'{action_line}\n{document}\n' for document in documents)
+
+        self._update_alias()
+
+    def _publish_incremental(self) -> None:
+        """
+        Index new and changed documents and delete removed ones in the live index, or rebuild a new index with all
+        documents and swap the alias when a full rebuild is due. The hash manifest is saved once the bulk requests
+        succeeded.
+        """
+        documents = self._read_documents()
+        # ensure new data exists, an empty file would otherwise delete every document
+        if documents is None:
+            LOGGER.warning("received no data to upload to Elasticsearch!")
+            return
+
+        manifest = self._load_hash_manifest()
+        live_indices = list(self._fetch_old_index())
+        full_rebuild = not manifest or live_indices != [manifest.get('index')] or \
+            time.time() - manifest.get('built_at', 0) > self.full_rebuild_interval_seconds
+
+        if full_rebuild:
+            LOGGER.info('Rebuilding index %s', self.elasticsearch_new_index)
+            target_index = self.elasticsearch_new_index
+            old_hashes: Dict[str, str] = {}
+            self.elasticsearch_client.indices.create(index=target_index, body=self.elasticsearch_mapping,
+                                                     params={'include_type_name': 'true'})
+        else:
+            target_index = manifest['index']
+            old_hashes = manifest['hashes']
+            LOGGER.info('Updating index %s incrementally', target_index)
+
+        new_hashes: Dict[str, str] = {}
+
+        def bulk_entries() -> Iterator[str]:
+            for document in documents:
+                key = json.loads(document)[self.document_key_field]
+                document_hash = hashlib.sha1(document.encode('utf-8')).hexdigest()
+                new_hashes[key] = document_hash
+                if old_hashes.get(key) != document_hash:
+                    action = dict(index=dict(_index=target_index, _type=self.elasticsearch_type, _id=key))
+                    yield f'{json.dumps(action)}\n{document}\n'
+
+            for key in old_hashes.keys() - new_hashes.keys():
+                action = dict(delete=dict(_index=target_index, _type=self.elasticsearch_type, _id=key))
+                yield f'{json.dumps(action)}\n'
+
+        self._send_bulk(bulk_entries())
+
+        if full_rebuild:
+            self._update_alias()
+            manifest = dict(index=target_index, built_at=time.time())
+        manifest['hashes'] = new_hashes
+        self._save_hash_manifest(manifest)
+
+    def _load_hash_manifest(self) -> Dict[str, Any]:
+        if not os.path.isfile(self.hash_manifest_path):
+            return {}
+        with open(self.hash_manifest_path, 'r') as manifest_file:
+            return json.load(manifest_file)
+
+    def _save_hash_manifest(self, manifest: Dict[str, Any]) -> None:
+        tmp_path = f'{self.hash_manifest_path}.tmp'
+        with open(tmp_path, 'w') as manifest_file:
+            json.dump(manifest, manifest_file)
+        os.replace(tmp_path, self.hash_manifest_path)
+
+    def _send_bulk(self, entries: Iterable[str]) -> None:
+        """
+        Send bulk entries (an action line, followed by a source line unless it is a delete) with thread_count
+        concurrent bulk requests. At most 2 * thread_count bulk requests are held in memory at a time.
+        Raises if any entry failed.
+        """
+        errors: List[Dict[str, Any]] = []
+        cnt = 0
+        with ThreadPoolExecutor(max_workers=self.elasticsearch_thread_count) as executor:
+            pending: Deque[Future] = deque()
+            for chunk in self._chunk_entries(entries):
+                pending.append(executor.submit(self._bulk_with_retry, chunk))
+                cnt += len(chunk)
+                if len(pending) >= 2 * self.elasticsearch_thread_count:
+                    errors.extend(pending.popleft().result())
+            while pending:
+                errors.extend(pending.popleft().result())
+
+        LOGGER.info('Published %i records to ES, %i failed', cnt, len(errors))
+        if errors:
+            for error in errors[:10]:
+                LOGGER.error('Failed to index document: %s', error)
+            raise RuntimeError(f'{len(errors)} documents failed to be published to Elasticsearch')
+
+    def _chunk_entries(self, entries: Iterable[str]) -> Iterator[List[str]]:
+        """
+        Group bulk entries into chunks of at most batch_size entries and max_chunk_bytes bytes of request body
+        """
+        chunk: List[str] = []
+        chunk_bytes = 0
+        for entry in entries:
+            entry_size = len(entry.encode('utf-8'))
+            is_full = len(chunk) >= self.elasticsearch_batch_size or \
+                chunk_bytes + entry_size > self.elasticsearch_max_chunk_bytes
+            if chunk and is_full:
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+            chunk.append(entry)
+            chunk_bytes += entry_size
+        if chunk:
+            yield chunk
+
+    def _bulk_with_retry(self, entries: List[str]) -> List[Dict[str, Any]]:
+        """
+        Send entries with one bulk request, and retry the ones rejected with a retryable status
+        :return: errors of the entries that could not be published
+        """
+        errors: List[Dict[str, Any]] = []
+        attempt = 0
+        while entries:
+            retry_entries = []
+            try:
+                response = self.elasticsearch_client.bulk(''.join(entries))
+            except TransportError as e:
+                if e.status_code not in ElasticsearchPublisher.RETRYABLE_STATUSES or \
+                        attempt >= self.elasticsearch_max_retries:
+                    raise
+                retry_entries = entries
+            else:
+                items = response.get('items', []) if response.get('errors') else []
+                for entry, item in zip(entries, items):
+                    result = next(iter(item.values()))
+                    if 'error' not in result:
+                        continue
+                    if result.get('status') in ElasticsearchPublisher.RETRYABLE_STATUSES and \
+                            attempt < self.elasticsearch_max_retries:
+                        retry_entries.append(entry)
+                    else:
+                        errors.append(result)
+
+            entries = retry_entries
+            if entries:
+                LOGGER.info('Retrying %i rejected documents', len(entries))
+                time.sleep(self.elasticsearch_initial_backoff * 2 ** attempt)
+                attempt += 1
+        return errors
+
     def get_scope(self) -> str:
         return 'publisher.elasticsearch'
@@ -8,17 +8,23 @@ from os.path import (
     basename, isfile, join, splitext,
 )
 from typing import (
-    Dict, List, Optional, Type,
+    Dict, Iterator, List, Optional, Tuple, Type,
 )
 
-import pandas
 from amundsen_rds.models import RDSModel
 from amundsen_rds.models.base import Base
 from pyhocon import ConfigFactory, ConfigTree
-from sqlalchemy import create_engine
+from sqlalchemy import (
+    Table, create_engine, text,
+)
+from sqlalchemy.dialects import (
+    mysql, postgresql, sqlite,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.expression import Executable
 
 from databuilder.publisher.base_publisher import Publisher
+from databuilder.publisher.csv_record_reader import read_csv_records
 
 LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +38,11 @@ class MySQLCSVPublisher(Publisher):
     For more information:
     rds models: https://github.com/amundsen-io/amundsenrds
     SQLAlchemy ORM: https://docs.sqlalchemy.org/en/13/orm/
+
+    When bulk_upsert_chunk_size is set, records are upserted with multi-row INSERT ... ON DUPLICATE KEY UPDATE
+    (MySQL) or INSERT ... ON CONFLICT DO UPDATE (PostgreSQL) statements of that many rows through SQLAlchemy Core,
+    instead of a SELECT and an INSERT or UPDATE per record by session.merge. Other dialects than the ones of
+    BULK_UPSERT_DIALECTS keep using session.merge.
     """
     # Config keys
     # A directory that contains CSV files for records
@@ -49,10 +60,16 @@ class MySQLCSVPublisher(Publisher):
     TRANSACTION_SIZE = 'transaction_size'
     # A progress report frequency that determines how often it report the progress.
     PROGRESS_REPORT_FREQUENCY = 'progress_report_frequency'
+    # Number of records upserted by a single statement. 0 (default) merges records one by one with the ORM.
+    BULK_UPSERT_CHUNK_SIZE = 'bulk_upsert_chunk_size'
+
+    # Dialects _create_upsert_statement can build a statement for
+    BULK_UPSERT_DIALECTS = ('mysql', 'postgresql', 'sqlite')
 
     _DEFAULT_CONFIG = ConfigFactory.from_dict({TRANSACTION_SIZE: 500,
                                                PROGRESS_REPORT_FREQUENCY: 500,
-                                               ENGINE_ECHO: False})
+                                               ENGINE_ECHO: False,
+                                               BULK_UPSERT_CHUNK_SIZE: 0})
 
     def __init__(self) -> None:
         super(MySQLCSVPublisher, self).__init__()
@@ -73,6 +90,11 @@ class MySQLCSVPublisher(Publisher):
                                      connect_args=connect_args)
         self._session_factory = sessionmaker(bind=self._engine)
         self._transaction_size = conf.get_int(MySQLCSVPublisher.TRANSACTION_SIZE)
+        self._bulk_upsert_chunk_size = conf.get_int(MySQLCSVPublisher.BULK_UPSERT_CHUNK_SIZE)
+        if self._bulk_upsert_chunk_size > 0 and self._engine.dialect.name not in self.BULK_UPSERT_DIALECTS:
+            LOGGER.warning(f'Bulk upsert is not supported for {self._engine.dialect.name}, '
+                           f'records are merged one by one instead')
+            self._bulk_upsert_chunk_size = 0
 
         self._publish_tag: str = conf.get_string(MySQLCSVPublisher.JOB_PUBLISH_TAG)
         if not self._publish_tag:
@@ -148,17 +170,73 @@ class MySQLCSVPublisher(Publisher):
         :param session:
         :return:
         """
-        with open(record_file, 'r', encoding='utf8') as record_csv:
-            table_name = self._get_table_name_from_file(record_file)
-            table_model = self._get_model_from_table_name(table_name)
-            if not table_model:
-                raise RuntimeError(f'Failed to get model for table: {table_name}')
+        table_name = self._get_table_name_from_file(record_file)
+        table_model = self._get_model_from_table_name(table_name)
+        if not table_model:
+            raise RuntimeError(f'Failed to get model for table: {table_name}')
 
-            for record_dict in pandas.read_csv(record_csv, na_filter=False).to_dict(orient='records'):
+        if self._bulk_upsert_chunk_size > 0:
+            for records in self._chunks(read_csv_records(record_file)):
+                stmt, params = self._create_upsert_statement(table=table_model.__table__, records=records)
+                session.execute(stmt, params)
+                self._execute(session, record_count=len(records))
+        else:
+            for record_dict in read_csv_records(record_file):
                 record = self._create_record(model=table_model, record_dict=record_dict)
                 session.merge(record)
                 self._execute(session)
-            session.commit()
+        session.commit()
+
+    def _chunks(self, record_dicts: Iterator[Dict]) -> Iterator[List[Dict]]:
+        """
+        Group record dicts into lists of bulk_upsert_chunk_size records
+        :param record_dicts:
+        :return:
+        """
+        records: List[Dict] = []
+        for record_dict in record_dicts:
+            records.append(record_dict)
+            if len(records) >= self._bulk_upsert_chunk_size:
+                yield records
+                records = []
+        if records:
+            yield records
+
+    def _create_upsert_statement(self, table: Table, records: List[Dict]) -> Tuple[Executable, Optional[List[Dict]]]:
+        """
+        Create a statement inserting the records, or updating them if their primary key exists, for the engine's
+        dialect, one of BULK_UPSERT_DIALECTS. Records of a chunk come from the same csv file, hence share the same
+        columns.
+        :param table:
+        :param records:
+        :return: The statement and, if the statement is to be executed once per record, the records
+        """
+        publisher_last_updated_epoch_ms = int(time.time() * 1000)
+        records = [dict(record_dict,
+                        published_tag=self._publish_tag,
+                        publisher_last_updated_epoch_ms=publisher_last_updated_epoch_ms)
+                   for record_dict in records]
+
+        primary_keys = [column.name for column in table.primary_key.columns]
+        update_columns = [column for column in records[0].keys() if column not in primary_keys]
+
+        dialect = self._engine.dialect.name
+        if dialect == 'mysql':
+            mysql_stmt = mysql.insert(table).values(records)
+            return mysql_stmt.on_duplicate_key_update(
+                {column: mysql_stmt.inserted[column] for column in update_columns}), None
+        if dialect == 'postgresql':
+            postgresql_stmt = postgresql.insert(table).values(records)
+            return postgresql_stmt.on_conflict_do_update(
+                index_elements=primary_keys,
+                set_={column: postgresql_stmt.excluded[column] for column in update_columns}), None
+        # sqlite: SQLAlchemy 1.3 can't render ON CONFLICT for SQLite (3.24+), so it is appended to the insert
+        insert = table.insert().values(records).compile(dialect=sqlite.dialect(paramstyle='named'))
+        quote = self._engine.dialect.identifier_preparer.quote
+        conflict_target = ', '.join(quote(column) for column in primary_keys)
+        update = ', '.join(f'{quote(column)} = excluded.{quote(column)}' for column in update_columns)
+        on_conflict = f'ON CONFLICT ({conflict_target}) DO UPDATE SET {update}' if update else 'ON CONFLICT DO NOTHING'
+        return text(f'{insert} {on_conflict}').bindparams(**insert.params), None
 
     def _get_model_from_table_name(self, table_name: str) -> Optional[Type[RDSModel]]:
         """
@@ -184,19 +262,22 @@ class MySQLCSVPublisher(Publisher):
         record.publisher_last_updated_epoch_ms = int(time.time() * 1000)
         return record
 
-    def _execute(self, session: Session) -> None:
+    def _execute(self, session: Session, record_count: int = 1) -> None:
         """
         Commit pending record changes
         :param session:
+        :param record_count: Number of records changed since the last call
         :return:
         """
         try:
-            self._count += 1
-            if self._count > 1 and self._count % self._transaction_size == 0:
+            previous_count = self._count
+            self._count += record_count
+            if self._count > 1 and self._count // self._transaction_size > previous_count // self._transaction_size:
                 session.commit()
                 LOGGER.info(f'Committed {self._count} records so far')
 
-            if self._count > 1 and self._count % self._progress_report_frequency == 0:
+            if self._count > 1 and \
+                    self._count // self._progress_report_frequency > previous_count // self._progress_report_frequency:
                 LOGGER.info(f'Processed {self._count} records so far')
 
         except Exception as e:
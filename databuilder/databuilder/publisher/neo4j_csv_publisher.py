@@ -1,23 +1,29 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import copy
 import csv
 import ctypes
 import logging
+import threading
 import time
-from io import open
+from concurrent.futures import (
+    FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait,
+)
 from os import listdir
 from os.path import isfile, join
-from typing import List, Set
+from typing import (
+    Dict, List, Set, Tuple,
+)
 
 import neo4j
-import pandas
 from jinja2 import Template
 from neo4j import GraphDatabase, Transaction
 from neo4j.exceptions import CypherError, TransientError
 from pyhocon import ConfigFactory, ConfigTree
 
 from databuilder.publisher.base_publisher import Publisher
+from databuilder.publisher.csv_record_reader import read_csv_first_record, read_csv_records
 from databuilder.publisher.neo4j_preprocessor import NoopRelationPreprocessor
 
 # Setting field_size_limit to solve the error below
@@ -47,6 +53,14 @@ NEO4J_CREATE_ONLY_NODES = 'neo4j_create_only_nodes'
 # list of node labels that could attempt to be accessed simultaneously
 NEO4J_DEADLOCK_NODE_LABELS = 'neo4j_deadlock_node_labels'
 
+# Number of CSV rows sent in a single parameterized UNWIND statement.
+# 0 (default) keeps publishing one MERGE statement per CSV row.
+NEO4J_UNWIND_BATCH_SIZE = 'neo4j_unwind_batch_size'
+
+# Number of files published concurrently, each on its own session. 1 (default) publishes all files sequentially
+# on a single session.
+NEO4J_PUBLISH_WORKERS = 'neo4j_publish_workers'
+
 NEO4J_USER = 'neo4j_user'
 NEO4J_PASSWORD = 'neo4j_password'
 NEO4J_ENCRYPTED = 'neo4j_encrypted'
@@ -99,8 +113,45 @@ DEFAULT_CONFIG = ConfigFactory.from_dict({NEO4J_TRANSACTION_SIZE: 500,
                                           NEO4J_MAX_CONN_LIFE_TIME_SEC: 50,
                                           NEO4J_ENCRYPTED: True,
                                           NEO4J_VALIDATE_SSL: False,
+                                          NEO4J_UNWIND_BATCH_SIZE: 0,
+                                          NEO4J_PUBLISH_WORKERS: 1,
                                           RELATION_PREPROCESSOR: NoopRelationPreprocessor()})
 
+# Cypher templates, rendered once per label (or relation types) and set of columns by the publisher
+NODE_MERGE_TEMPLATE = Template("""
+    MERGE (node:{{ LABEL }} {key: $KEY})
+    ON CREATE SET {{ PROP_BODY }}
+    {% if update %} ON MATCH SET {{ PROP_BODY }} {% endif %}
+""")
+
+NODE_UNWIND_TEMPLATE = Template("""
+    UNWIND $batch AS row
+    MERGE (node:{{ LABEL }} {key: row.KEY})
+    ON CREATE SET {{ PROP_BODY }}
+    {% if update %} ON MATCH SET {{ PROP_BODY }} {% endif %}
+""")
+
+RELATION_MERGE_TEMPLATE = Template("""
+    MATCH (n1:{{ START_LABEL }} {key: $START_KEY}), (n2:{{ END_LABEL }} {key: $END_KEY})
+    MERGE (n1)-[r1:{{ TYPE }}]->(n2)-[r2:{{ REVERSE_TYPE }}]->(n1)
+    {% if update_prop_body %}
+    ON CREATE SET {{ prop_body }}
+    ON MATCH SET {{ prop_body }}
+    {% endif %}
+    RETURN n1.key, n2.key
+""")
+
+RELATION_UNWIND_TEMPLATE = Template("""
+    UNWIND $batch AS row
+    MATCH (n1:{{ START_LABEL }} {key: row.START_KEY}), (n2:{{ END_LABEL }} {key: row.END_KEY})
+    MERGE (n1)-[r1:{{ TYPE }}]->(n2)-[r2:{{ REVERSE_TYPE }}]->(n1)
+    {% if update_prop_body %}
+    ON CREATE SET {{ prop_body }}
+    ON MATCH SET {{ prop_body }}
+    {% endif %}
+    RETURN n1.key, n2.key
+""")
+
 # transient error retries and sleep time
 RETRIES_NUMBER = 5
 SLEEP_TIME = 2
@@ -116,11 +167,19 @@ class Neo4jCsvPublisher(Publisher):
     Neo4j follows Label Node properties Graph and more information about this is in:
     https://neo4j.com/docs/developer-manual/current/introduction/graphdb-concepts/
 
-    #TODO User UNWIND batch operation for better performance
+    When neo4j_unwind_batch_size is set, rows sharing the same label (or relation types) and the same set of columns
+    are grouped and sent as a single parameterized UNWIND statement instead of one MERGE statement per row.
+    neo4j_transaction_size still counts CSV rows in that mode.
+
+    When neo4j_publish_workers is greater than 1, Node files and then Relation files are published concurrently,
+    see _publish_concurrently.
     """
 
     def __init__(self) -> None:
         super(Neo4jCsvPublisher, self).__init__()
+        # Rendered statements keyed by statement template, label or relation types, set of columns, create-only flag
+        # and publish tag, which the statements embed
+        self._statement_cache: Dict[Tuple, str] = {}
 
     def init(self, conf: ConfigTree) -> None:
         conf = conf.with_fallback(DEFAULT_CONFIG)
@@ -142,6 +201,9 @@ class Neo4jCsvPublisher(Publisher):
                                  encrypted=conf.get_bool(NEO4J_ENCRYPTED),
                                  trust=trust)
         self._transaction_size = conf.get_int(NEO4J_TRANSACTION_SIZE)
+        self._unwind_batch_size = conf.get_int(NEO4J_UNWIND_BATCH_SIZE)
+        self._publish_workers = conf.get_int(NEO4J_PUBLISH_WORKERS)
+        self._count_lock = threading.Lock()
         self._session = self._driver.session()
         self._confirm_rel_created = conf.get_bool(NEO4J_RELATIONSHIP_CREATION_CONFIRM)
 
@@ -153,6 +215,7 @@ class Neo4jCsvPublisher(Publisher):
         self.publish_tag: str = conf.get_string(JOB_PUBLISH_TAG)
         if not self.publish_tag:
             raise Exception(f'{JOB_PUBLISH_TAG} should not be empty')
+        self._statement_cache = {}
 
         self._relation_preprocessor = conf.get(RELATION_PREPROCESSOR)
 
@@ -183,6 +246,11 @@ class Neo4jCsvPublisher(Publisher):
         for node_file in self._node_files:
             self._create_indices(node_file=node_file)
 
+        if self._publish_workers > 1:
+            self._publish_concurrently()
+            LOGGER.info('Successfully published. Elapsed: %i seconds', time.time() - start)
+            return
+
         LOGGER.info('Publishing Node files: %s', self._node_files)
         try:
             tx = self._session.begin_transaction()
@@ -212,23 +280,121 @@ class Neo4jCsvPublisher(Publisher):
                 tx.rollback()
             raise e
 
+    def _publish_concurrently(self) -> None:
+        """
+        Publishes Node files on a pool of neo4j_publish_workers workers and then Relation files the same way.
+        Each file is published on its own session and committed on its own, every neo4j_transaction_size rows.
+        Relation files touching a common label of neo4j_deadlock_node_labels are published one after another.
+        :return:
+        """
+        with ThreadPoolExecutor(max_workers=self._publish_workers) as executor:
+            LOGGER.info('Publishing Node files with %i workers: %s', self._publish_workers, self._node_files)
+            self._wait_all([executor.submit(self._publish_files, [node_file], '_publish_node')
+                            for node_file in self._node_files])
+
+            relation_file_groups = self._group_relation_files(self._relation_files)
+            LOGGER.info('Publishing Relationship files with %i workers: %s', self._publish_workers,
+                        relation_file_groups)
+            self._wait_all([executor.submit(self._publish_files, relation_files, '_publish_relation')
+                            for relation_files in relation_file_groups])
+
+        LOGGER.info('Committed total %i statements', self._count)
+
+    def _wait_all(self, futures: List[Future]) -> None:
+        """
+        Waits for all futures and raises the first failure, cancelling the ones that have not started yet.
+        :param futures:
+        :return:
+        """
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in not_done:
+            future.cancel()
+        for future in done:
+            future.result()
+
+    def _group_relation_files(self, relation_files: List[str]) -> List[List[str]]:
+        """
+        Groups relation files that need to be published one after another: files touching a common label of
+        neo4j_deadlock_node_labels end up in the same group, any other file is in a group of its own.
+        Labels are read from the first row, as relation files hold a single start and end label.
+        :param relation_files:
+        :return: List of groups of relation files
+        """
+        groups: List[Tuple[Set[str], List[str]]] = []
+        for relation_file in relation_files:
+            rel_record = read_csv_first_record(relation_file)
+            labels = {rel_record[RELATION_START_LABEL], rel_record[RELATION_END_LABEL]} \
+                & self.deadlock_node_labels if rel_record else set()
+
+            group_labels, group_files = set(labels), [relation_file]
+            for other_labels, other_files in [group for group in groups if group[0] & labels]:
+                groups.remove((other_labels, other_files))
+                group_labels |= other_labels
+                group_files = other_files + group_files
+            groups.append((group_labels, group_files))
+
+        return [group_files for _, group_files in groups]
+
+    def _publish_files(self, files: List[str], publish_method: str) -> None:
+        """
+        Publishes files one after another on a new session, using a copy of this publisher so that the session,
+        the transaction and the statement count are not shared with the other workers.
+        A TransientError (e.g: a deadlock with another worker) rolls back the transaction, so the whole file is
+        published again, up to RETRIES_NUMBER times. Merge statements are idempotent, which makes it safe.
+        :param files:
+        :param publish_method: '_publish_node' or '_publish_relation'
+        :return:
+        """
+        for file in files:
+            start = time.time()
+            retries = 0
+            while True:
+                worker = copy.copy(self)
+                worker._count = 0
+                # Statements are not retried individually as their transaction is already rolled back
+                worker.deadlock_node_labels = set()
+                worker._session = self._driver.session()
+                tx = worker._session.begin_transaction()
+                try:
+                    tx = getattr(worker, publish_method)(file, tx=tx)
+                    tx.commit()
+                    break
+                except TransientError:
+                    if not tx.closed():
+                        tx.rollback()
+                    retries += 1
+                    if retries >= RETRIES_NUMBER:
+                        raise
+                    LOGGER.warning('Transient error while publishing %s. Retrying %i/%i', file, retries,
+                                   RETRIES_NUMBER - 1)
+                    time.sleep(SLEEP_TIME)
+                finally:
+                    worker._session.close()
+
+            elapsed = time.time() - start
+            with self._count_lock:
+                self._count += worker._count
+            LOGGER.info('Published %s: %i statements in %.1f seconds (%.0f statements/sec), %i retries',
+                        file, worker._count, elapsed, worker._count / elapsed if elapsed else 0, retries)
+
     def get_scope(self) -> str:
         return 'publisher.neo4j'
 
     def _create_indices(self, node_file: str) -> None:
         """
-        Go over the node file and try creating unique index
+        Read the label from the first row of the node file and try creating unique index.
+        Node files hold a single label, as written by FsNeo4jCSVLoader, so the rest of the file is not parsed.
         :param node_file:
         :return:
         """
         LOGGER.info('Creating indices. (Existing indices will be ignored)')
 
-        with open(node_file, 'r', encoding='utf8') as node_csv:
-            for node_record in pandas.read_csv(node_csv, na_filter=False).to_dict(orient='records'):
-                label = node_record[NODE_LABEL_KEY]
-                if label not in self.labels:
-                    self._try_create_index(label)
-                    self.labels.add(label)
+        node_record = read_csv_first_record(node_file)
+        if node_record:
+            label = node_record[NODE_LABEL_KEY]
+            if label not in self.labels:
+                self._try_create_index(label)
+                self.labels.add(label)
 
         LOGGER.info('Indices have been created.')
 
@@ -249,14 +415,52 @@ class Neo4jCsvPublisher(Publisher):
         :param node_file:
         :return:
         """
+        if self._unwind_batch_size > 0:
+            return self._publish_node_batches(node_file, tx=tx)
 
-        with open(node_file, 'r', encoding='utf8') as node_csv:
-            for node_record in pandas.read_csv(node_csv, na_filter=False).to_dict(orient="records"):
-                stmt = self.create_node_merge_statement(node_record=node_record)
-                params = self._create_props_param(node_record)
-                tx = self._execute_statement(stmt, tx, params)
+        for node_record in read_csv_records(node_file):
+            stmt = self.create_node_merge_statement(node_record=node_record)
+            params = self._create_props_param(node_record)
+            tx = self._execute_statement(stmt, tx, params)
         return tx
 
+    def _publish_node_batches(self, node_file: str, tx: Transaction) -> Transaction:
+        """
+        Groups the csv records of a file by label and column set and publishes each group with an UNWIND statement
+        of at most neo4j_unwind_batch_size rows.
+        Example of Cypher query executed by this method:
+        UNWIND $batch AS row
+        MERGE (node:Column {key: row.KEY})
+        ON CREATE SET node.name = row.name,
+                      node.order_pos = row.order_pos,
+                      node.type = row.type
+        ON MATCH SET node.name = row.name,
+                     node.order_pos = row.order_pos,
+                     node.type = row.type
+
+        :param node_file:
+        :param tx:
+        :return:
+        """
+        batches: Dict[Tuple, List[dict]] = {}
+        for node_record in read_csv_records(node_file):
+            group = (node_record[NODE_LABEL_KEY], frozenset(node_record.keys()))
+            batch = batches.setdefault(group, [])
+            batch.append(node_record)
+            if len(batch) >= self._unwind_batch_size:
+                tx = self._execute_node_batch(batch, tx=tx)
+                batches[group] = []
+
+        for batch in batches.values():
+            if batch:
+                tx = self._execute_node_batch(batch, tx=tx)
+        return tx
+
+    def _execute_node_batch(self, batch: List[dict], tx: Transaction) -> Transaction:
+        stmt = self.create_node_unwind_statement(node_record=batch[0])
+        params = {'batch': [self._create_props_param(node_record) for node_record in batch]}
+        return self._execute_statement(stmt, tx, params, record_count=len(batch))
+
     def is_create_only_node(self, node_record: dict) -> bool:
         """
         Check if node can be updated
@@ -274,17 +478,36 @@ class Neo4jCsvPublisher(Publisher):
         :param node_record:
         :return:
         """
-        template = Template("""
-            MERGE (node:{{ LABEL }} {key: $KEY})
-            ON CREATE SET {{ PROP_BODY }}
-            {% if update %} ON MATCH SET {{ PROP_BODY }} {% endif %}
-        """)
+        return self._get_node_statement(NODE_MERGE_TEMPLATE, node_record, value_prefix='$')
 
-        prop_body = self._create_props_body(node_record, NODE_REQUIRED_KEYS, 'node')
+    def create_node_unwind_statement(self, node_record: dict) -> str:
+        """
+        Creates node merge statement that merges every row of the $batch parameter.
+        All rows of the batch are expected to share node_record's label and columns.
+        :param node_record:
+        :return:
+        """
+        return self._get_node_statement(NODE_UNWIND_TEMPLATE, node_record, value_prefix='row.')
 
-        return template.render(LABEL=node_record["LABEL"],
-                               PROP_BODY=prop_body,
-                               update=(not self.is_create_only_node(node_record)))
+    def _get_node_statement(self, template: Template, node_record: dict, value_prefix: str) -> str:
+        """
+        Renders the node template once per label, set of columns, create-only flag and publish tag, and returns the
+        cached statement afterwards. Sending the same statement text also lets Neo4j reuse its query plan.
+        :param template:
+        :param node_record:
+        :param value_prefix:
+        :return:
+        """
+        update = not self.is_create_only_node(node_record)
+        key = (template, node_record[NODE_LABEL_KEY], frozenset(node_record.keys()), update, self.publish_tag)
+        stmt = self._statement_cache.get(key)
+        if stmt is None:
+            prop_body = self._create_props_body(node_record, NODE_REQUIRED_KEYS, 'node', value_prefix=value_prefix)
+            stmt = template.render(LABEL=node_record["LABEL"],
+                                   PROP_BODY=prop_body,
+                                   update=update)
+            self._statement_cache[key] = stmt
+        return stmt
 
     def _publish_relation(self, relation_file: str, tx: Transaction) -> Transaction:
         """
@@ -305,70 +528,138 @@ class Neo4jCsvPublisher(Publisher):
             LOGGER.info('Pre-processing relation with %s', self._relation_preprocessor)
 
             count = 0
-            with open(relation_file, 'r', encoding='utf8') as relation_csv:
-                for rel_record in pandas.read_csv(relation_csv, na_filter=False).to_dict(orient="records"):
-                    # TODO not sure if deadlock on badge node arises in preporcessing or not
-                    stmt, params = self._relation_preprocessor.preprocess_cypher(
-                        start_label=rel_record[RELATION_START_LABEL],
-                        end_label=rel_record[RELATION_END_LABEL],
-                        start_key=rel_record[RELATION_START_KEY],
-                        end_key=rel_record[RELATION_END_KEY],
-                        relation=rel_record[RELATION_TYPE],
-                        reverse_relation=rel_record[RELATION_REVERSE_TYPE])
-
-                    if stmt:
-                        tx = self._execute_statement(stmt, tx=tx, params=params)
-                        count += 1
+            for rel_record in read_csv_records(relation_file):
+                # TODO not sure if deadlock on badge node arises in preporcessing or not
+                stmt, params = self._relation_preprocessor.preprocess_cypher(
+                    start_label=rel_record[RELATION_START_LABEL],
+                    end_label=rel_record[RELATION_END_LABEL],
+                    start_key=rel_record[RELATION_START_KEY],
+                    end_key=rel_record[RELATION_END_KEY],
+                    relation=rel_record[RELATION_TYPE],
+                    reverse_relation=rel_record[RELATION_REVERSE_TYPE])
+
+                if stmt:
+                    tx = self._execute_statement(stmt, tx=tx, params=params)
+                    count += 1
 
             LOGGER.info('Executed pre-processing Cypher statement %i times', count)
 
-        with open(relation_file, 'r', encoding='utf8') as relation_csv:
-            for rel_record in pandas.read_csv(relation_csv, na_filter=False).to_dict(orient="records"):
-                exception_exists = True
-                retries_for_exception = RETRIES_NUMBER
-                while exception_exists and retries_for_exception > 0:
-                    try:
-                        stmt = self.create_relationship_merge_statement(rel_record=rel_record)
-                        params = self._create_props_param(rel_record)
-                        tx = self._execute_statement(stmt, tx, params,
-                                                     expect_result=self._confirm_rel_created)
-                        exception_exists = False
-                    except TransientError as e:
-                        if rel_record[RELATION_START_LABEL] in self.deadlock_node_labels \
-                                or rel_record[RELATION_END_LABEL] in self.deadlock_node_labels:
-                            time.sleep(SLEEP_TIME)
-                            retries_for_exception -= 1
-                        else:
-                            raise e
+        if self._unwind_batch_size > 0:
+            return self._publish_relation_batches(relation_file, tx=tx)
+
+        for rel_record in read_csv_records(relation_file):
+            exception_exists = True
+            retries_for_exception = RETRIES_NUMBER
+            while exception_exists and retries_for_exception > 0:
+                try:
+                    stmt = self.create_relationship_merge_statement(rel_record=rel_record)
+                    params = self._create_props_param(rel_record)
+                    tx = self._execute_statement(stmt, tx, params,
+                                                 expect_result=self._confirm_rel_created)
+                    exception_exists = False
+                except TransientError as e:
+                    if rel_record[RELATION_START_LABEL] in self.deadlock_node_labels \
+                            or rel_record[RELATION_END_LABEL] in self.deadlock_node_labels:
+                        time.sleep(SLEEP_TIME)
+                        retries_for_exception -= 1
+                    else:
+                        raise e
+
+        return tx
+
+    def _publish_relation_batches(self, relation_file: str, tx: Transaction) -> Transaction:
+        """
+        Groups the csv records of a file by start label, end label, relation types and column set and publishes each
+        group with an UNWIND statement of at most neo4j_unwind_batch_size rows.
+        Example of Cypher query executed by this method:
+        UNWIND $batch AS row
+        MATCH (n1:Table {key: row.START_KEY}), (n2:Column {key: row.END_KEY})
+        MERGE (n1)-[r1:COLUMN]->(n2)-[r2:BELONG_TO_TABLE]->(n1)
+        RETURN n1.key, n2.key
 
+        :param relation_file:
+        :param tx:
+        :return:
+        """
+        batches: Dict[Tuple, List[dict]] = {}
+        for rel_record in read_csv_records(relation_file):
+            group = (rel_record[RELATION_START_LABEL], rel_record[RELATION_END_LABEL],
+                     rel_record[RELATION_TYPE], rel_record[RELATION_REVERSE_TYPE],
+                     frozenset(rel_record.keys()))
+            batch = batches.setdefault(group, [])
+            batch.append(rel_record)
+            if len(batch) >= self._unwind_batch_size:
+                tx = self._execute_relation_batch(batch, tx=tx)
+                batches[group] = []
+
+        for batch in batches.values():
+            if batch:
+                tx = self._execute_relation_batch(batch, tx=tx)
         return tx
 
+    def _execute_relation_batch(self, batch: List[dict], tx: Transaction) -> Transaction:
+        rel_record = batch[0]
+        stmt = self.create_relationship_unwind_statement(rel_record=rel_record)
+        params = {'batch': [self._create_props_param(record) for record in batch]}
+
+        retries_for_exception = RETRIES_NUMBER
+        while True:
+            try:
+                return self._execute_statement(stmt, tx, params,
+                                               expect_result=self._confirm_rel_created,
+                                               record_count=len(batch))
+            except TransientError as e:
+                retries_for_exception -= 1
+                is_deadlock_label = rel_record[RELATION_START_LABEL] in self.deadlock_node_labels or \
+                    rel_record[RELATION_END_LABEL] in self.deadlock_node_labels
+                if is_deadlock_label and retries_for_exception > 0:
+                    time.sleep(SLEEP_TIME)
+                else:
+                    raise e
+
     def create_relationship_merge_statement(self, rel_record: dict) -> str:
         """
         Creates relationship merge statement
         :param rel_record:
         :return:
         """
-        template = Template("""
-            MATCH (n1:{{ START_LABEL }} {key: $START_KEY}), (n2:{{ END_LABEL }} {key: $END_KEY})
-            MERGE (n1)-[r1:{{ TYPE }}]->(n2)-[r2:{{ REVERSE_TYPE }}]->(n1)
-            {% if update_prop_body %}
-            ON CREATE SET {{ prop_body }}
-            ON MATCH SET {{ prop_body }}
-            {% endif %}
-            RETURN n1.key, n2.key
-        """)
-
-        prop_body_r1 = self._create_props_body(rel_record, RELATION_REQUIRED_KEYS, 'r1')
-        prop_body_r2 = self._create_props_body(rel_record, RELATION_REQUIRED_KEYS, 'r2')
-        prop_body = ' , '.join([prop_body_r1, prop_body_r2])
-
-        return template.render(START_LABEL=rel_record["START_LABEL"],
-                               END_LABEL=rel_record["END_LABEL"],
-                               TYPE=rel_record["TYPE"],
-                               REVERSE_TYPE=rel_record["REVERSE_TYPE"],
-                               update_prop_body=prop_body_r1,
-                               prop_body=prop_body)
+        return self._get_relationship_statement(RELATION_MERGE_TEMPLATE, rel_record, value_prefix='$')
+
+    def create_relationship_unwind_statement(self, rel_record: dict) -> str:
+        """
+        Creates relationship merge statement that merges every row of the $batch parameter.
+        All rows of the batch are expected to share rel_record's labels, relation types and columns.
+        :param rel_record:
+        :return:
+        """
+        return self._get_relationship_statement(RELATION_UNWIND_TEMPLATE, rel_record, value_prefix='row.')
+
+    def _get_relationship_statement(self, template: Template, rel_record: dict, value_prefix: str) -> str:
+        """
+        Renders the relationship template once per labels, relation types, set of columns and publish tag, and returns
+        the cached statement afterwards.
+        :param template:
+        :param rel_record:
+        :param value_prefix:
+        :return:
+        """
+        key = (template, rel_record[RELATION_START_LABEL], rel_record[RELATION_END_LABEL],
+               rel_record[RELATION_TYPE], rel_record[RELATION_REVERSE_TYPE], frozenset(rel_record.keys()),
+               self.publish_tag)
+        stmt = self._statement_cache.get(key)
+        if stmt is None:
+            prop_body_r1 = self._create_props_body(rel_record, RELATION_REQUIRED_KEYS, 'r1', value_prefix=value_prefix)
+            prop_body_r2 = self._create_props_body(rel_record, RELATION_REQUIRED_KEYS, 'r2', value_prefix=value_prefix)
+            prop_body = ' , '.join([prop_body_r1, prop_body_r2])
+
+            stmt = template.render(START_LABEL=rel_record["START_LABEL"],
+                                   END_LABEL=rel_record["END_LABEL"],
+                                   TYPE=rel_record["TYPE"],
+                                   REVERSE_TYPE=rel_record["REVERSE_TYPE"],
+                                   update_prop_body=prop_body_r1,
+                                   prop_body=prop_body)
+            self._statement_cache[key] = stmt
+        return stmt
 
     def _create_props_param(self, record_dict: dict) -> dict:
         params = {}
@@ -382,7 +673,8 @@ class Neo4jCsvPublisher(Publisher):
     def _create_props_body(self,
                            record_dict: dict,
                            excludes: Set,
-                           identifier: str) -> str:
+                           identifier: str,
+                           value_prefix: str = '$') -> str:
         """
         Creates properties body with params required for resolving template.
 
@@ -392,6 +684,7 @@ class Neo4jCsvPublisher(Publisher):
         :param record_dict: A dict represents CSV row
         :param excludes: set of excluded columns that does not need to be in properties (e.g: KEY, LABEL ...)
         :param identifier: identifier that will be used in CYPHER query as shown on above example
+        :param value_prefix: prefix of the property values, '$' for statement parameters or e.g 'row.' for UNWIND rows
         :return: Properties body for Cypher statement
         """
         props = []
@@ -402,7 +695,7 @@ class Neo4jCsvPublisher(Publisher):
             if k.endswith(UNQUOTED_SUFFIX):
                 k = k[:-len(UNQUOTED_SUFFIX)]
 
-            props.append(f'{identifier}.{k} = ${k}')
+            props.append(f'{identifier}.{k} = {value_prefix}{k}')
 
         props.append(f"{identifier}.{PUBLISHED_TAG_PROPERTY_NAME} = '{self.publish_tag}'")
         props.append(f"{identifier}.{LAST_UPDATED_EPOCH_MS} = timestamp()")
@@ -413,7 +706,8 @@ class Neo4jCsvPublisher(Publisher):
                            stmt: str,
                            tx: Transaction,
                            params: dict = None,
-                           expect_result: bool = False) -> Transaction:
+                           expect_result: bool = False,
+                           record_count: int = 1) -> Transaction:
         """
         Executes statement against Neo4j. If execution fails, it rollsback and raise exception.
         If 'expect_result' flag is True, it confirms if result object is not null.
@@ -421,22 +715,26 @@ class Neo4jCsvPublisher(Publisher):
         :param tx:
         :param count:
         :param expect_result: By having this True, it will validate if result object is not None.
+        :param record_count: Number of CSV rows the statement publishes. With expect_result, it validates that the
+        result has at least this many records.
         :return:
         """
         try:
             LOGGER.debug('Executing statement: %s with params %s', stmt, params)
 
             result = tx.run(str(stmt).encode('utf-8', 'ignore'), parameters=params)
-            if expect_result and not result.single():
+            if expect_result and sum(1 for _ in result) < record_count:
                 raise RuntimeError(f'Failed to executed statement: {stmt}')
 
-            self._count += 1
-            if self._count > 1 and self._count % self._transaction_size == 0:
+            previous_count = self._count
+            self._count += record_count
+            if self._count > 1 and self._count // self._transaction_size > previous_count // self._transaction_size:
                 tx.commit()
                 LOGGER.info(f'Committed {self._count} statements so far')
                 return self._session.begin_transaction()
 
-            if self._count > 1 and self._count % self._progress_report_frequency == 0:
+            if self._count > 1 and \
+                    self._count // self._progress_report_frequency > previous_count // self._progress_report_frequency:
                 LOGGER.info(f'Processed {self._count} statements so far')
 
             return tx
@@ -2,14 +2,21 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import datetime
+import hashlib
+import json
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from os import listdir
 from os.path import isfile, join
-from typing import List, Tuple
+from typing import (
+    Any, Dict, List, Optional, Tuple,
+)
 
 from amundsen_gremlin.neptune_bulk_loader.api import NeptuneBulkLoaderApi, NeptuneBulkLoaderLoadStatusErrorLogEntry
+from boto3.s3.transfer import TransferConfig
 from boto3.session import Session
 from pyhocon import ConfigTree
 
@@ -29,6 +36,10 @@ class NeptuneCSVPublisher(Publisher):
     which is a client for the the api found
     https://docs.aws.amazon.com/neptune/latest/userguide/bulk-load.html
     https://docs.aws.amazon.com/neptune/latest/userguide/bulk-load-tutorial-format-gremlin.html
+
+    Files are uploaded to S3 by upload_concurrency threads, large files being uploaded in parts.
+    When upload_manifest_path is set, the checksum of every uploaded file is recorded there, so that a job that failed
+    before its bulk load completed resumes in the same S3 folder and only uploads the files that changed.
     """
 
     # A directory that contains CSV files for nodes
@@ -53,6 +64,17 @@ class NeptuneCSVPublisher(Publisher):
     AWS_STS_ENDPOINT_URL = 'aws_sts_endpoint_url'
     FAIL_ON_ERROR = "fail_on_error"
     STATUS_POLLING_PERIOD = "status_polling_period"
+    # Polling period doubles on every status check, up to this many seconds
+    STATUS_POLLING_MAX_PERIOD = "status_polling_max_period"
+
+    # --- UPLOAD CONFIGURATION ---
+    # Number of files uploaded concurrently
+    UPLOAD_CONCURRENCY = "upload_concurrency"
+    # Files larger than this many MB are uploaded in parts, with multipart_concurrency threads per file
+    MULTIPART_THRESHOLD_MB = "multipart_threshold_mb"
+    MULTIPART_CONCURRENCY = "multipart_concurrency"
+    # Local file recording the S3 folder and the checksum of the uploaded files of an unfinished bulk load
+    UPLOAD_MANIFEST_PATH = "upload_manifest_path"
 
     def __init__(self) -> None:
         super(NeptuneCSVPublisher, self).__init__()
@@ -86,16 +108,33 @@ class NeptuneCSVPublisher(Publisher):
         self.base_amundsen_data_path = conf.get_string(NeptuneCSVPublisher.AWS_BASE_S3_DATA_PATH)
         self.fail_on_error = conf.get_bool(NeptuneCSVPublisher.FAIL_ON_ERROR, default=False)
         self.status_polling_period = conf.get_int(NeptuneCSVPublisher.STATUS_POLLING_PERIOD, default=5)
+        self.status_polling_max_period = conf.get_int(NeptuneCSVPublisher.STATUS_POLLING_MAX_PERIOD, default=60)
+
+        self.upload_concurrency = conf.get_int(NeptuneCSVPublisher.UPLOAD_CONCURRENCY, default=1)
+        self._s3_transfer_config = TransferConfig(
+            multipart_threshold=conf.get_int(NeptuneCSVPublisher.MULTIPART_THRESHOLD_MB, default=100) * (2 ** 20),
+            max_concurrency=conf.get_int(NeptuneCSVPublisher.MULTIPART_CONCURRENCY, default=5)
+        )
+        self.upload_manifest_path: Optional[str] = conf.get_string(NeptuneCSVPublisher.UPLOAD_MANIFEST_PATH,
+                                                                   default=None)
+        self._upload_manifest: Dict[str, Any] = {}
+        self._upload_manifest_lock = threading.Lock()
 
     def publish_impl(self) -> None:
         if not self._is_upload_required():
             return
 
-        datetime_portion = datetime.datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-        s3_folder_location = "{base_directory}/{datetime_portion}".format(
-            base_directory=self.base_amundsen_data_path,
-            datetime_portion=datetime_portion,
-        )
+        self._upload_manifest = self._load_upload_manifest()
+        if self._upload_manifest:
+            s3_folder_location = self._upload_manifest['s3_folder_location']
+            LOGGER.info("Resuming upload to {0}".format(s3_folder_location))
+        else:
+            datetime_portion = datetime.datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+            s3_folder_location = "{base_directory}/{datetime_portion}".format(
+                base_directory=self.base_amundsen_data_path,
+                datetime_portion=datetime_portion,
+            )
+            self._upload_manifest = {'s3_folder_location': s3_folder_location, 'uploaded_files': {}}
 
         self.upload_files(s3_folder_location)
 
@@ -111,11 +150,16 @@ class NeptuneCSVPublisher(Publisher):
 
         load_status = "LOAD_NOT_STARTED"
         all_errors: List[NeptuneBulkLoaderLoadStatusErrorLogEntry] = []
+        polling_period = self.status_polling_period
         while load_status in ("LOAD_IN_PROGRESS", "LOAD_NOT_STARTED", "LOAD_IN_QUEUE"):
-            time.sleep(self.status_polling_period)
+            time.sleep(polling_period)
+            polling_period = min(polling_period * 2, max(self.status_polling_max_period, self.status_polling_period))
             load_status, errors = self._poll_status(load_id)
             all_errors.extend(errors)
 
+        if load_status == "LOAD_COMPLETED":
+            self._remove_upload_manifest()
+
         for error in all_errors:
             exception_message = """
             Error Code: {error_code}
@@ -160,17 +204,70 @@ class NeptuneCSVPublisher(Publisher):
 
     def upload_files(self, s3_folder_location: str) -> None:
         file_paths = self._get_file_paths()
-        for file_location in file_paths:
-            with open(file_location, 'rb') as file_csv:
-                file_name = os.path.basename(file_location)
-                s3_object_key = "{s3_folder_location}/{file_name}".format(
-                    s3_folder_location=s3_folder_location,
-                    file_name=file_name
-                )
-                self.neptune_api_client.upload(
-                    f=file_csv,
-                    s3_object_key=s3_object_key
-                )
+        # boto3 clients are thread safe, unlike the session creating them
+        s3_client = self._boto_session.client('s3')
+        with ThreadPoolExecutor(max_workers=self.upload_concurrency) as executor:
+            futures = [
+                executor.submit(self._upload_file, s3_client, file_location, s3_folder_location)
+                for file_location in file_paths
+            ]
+            for future in futures:
+                future.result()
+
+    def _upload_file(self, s3_client: Any, file_location: str, s3_folder_location: str) -> None:
+        file_name = os.path.basename(file_location)
+        checksum = self._get_checksum(file_location)
+        if self._upload_manifest.get('uploaded_files', {}).get(file_name) == checksum:
+            LOGGER.info("Skipping {0}, already uploaded".format(file_name))
+            return
+
+        s3_object_key = "{s3_folder_location}/{file_name}".format(
+            s3_folder_location=s3_folder_location,
+            file_name=file_name
+        )
+        s3_client.upload_file(file_location, self.bucket_name, s3_object_key, Config=self._s3_transfer_config)
+
+        with self._upload_manifest_lock:
+            self._upload_manifest.setdefault('uploaded_files', {})[file_name] = checksum
+            self._save_upload_manifest()
+
+    @staticmethod
+    def _get_checksum(file_location: str) -> str:
+        md5 = hashlib.md5()
+        with open(file_location, 'rb') as f:
+            for chunk in iter(lambda: f.read(2 ** 20), b''):
+                md5.update(chunk)
+        return md5.hexdigest()
+
+    def _load_upload_manifest(self) -> Dict[str, Any]:
+        """
+        Loads the manifest of a previous job whose bulk load did not complete. The manifest is ignored if it records
+        files that are not part of this job, as Neptune would load them too from the S3 folder.
+        """
+        if not self.upload_manifest_path or not os.path.isfile(self.upload_manifest_path):
+            return {}
+
+        with open(self.upload_manifest_path, 'r') as manifest_file:
+            manifest = json.load(manifest_file)
+
+        file_names = {os.path.basename(file_location) for file_location in self._get_file_paths()}
+        if not set(manifest.get('uploaded_files', {})).issubset(file_names):
+            LOGGER.info("Ignoring upload manifest {0} of a different set of files".format(self.upload_manifest_path))
+            return {}
+        return manifest
+
+    def _save_upload_manifest(self) -> None:
+        if not self.upload_manifest_path:
+            return
+
+        tmp_path = "{0}.tmp".format(self.upload_manifest_path)
+        with open(tmp_path, 'w') as manifest_file:
+            json.dump(self._upload_manifest, manifest_file)
+        os.replace(tmp_path, self.upload_manifest_path)
+
+    def _remove_upload_manifest(self) -> None:
+        if self.upload_manifest_path and os.path.isfile(self.upload_manifest_path):
+            os.remove(self.upload_manifest_path)
 
     def get_scope(self) -> str:
         return 'publisher.neptune_csv_publisher'
@@ -0,0 +1,193 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import textwrap
+import time
+from typing import (
+    Any, Dict, Iterable,
+)
+
+import neo4j
+from neo4j import GraphDatabase
+from neo4j.exceptions import CypherError
+from pyhocon import ConfigFactory, ConfigTree
+
+from databuilder import Scoped
+from databuilder.task.base_task import Task
+
+# A end point for Neo4j e.g: bolt://localhost:9999
+NEO4J_END_POINT_KEY = 'neo4j_endpoint'
+NEO4J_MAX_CONN_LIFE_TIME_SEC = 'neo4j_max_conn_life_time_sec'
+NEO4J_USER = 'neo4j_user'
+NEO4J_PASSWORD = 'neo4j_password'
+NEO4J_ENCRYPTED = 'neo4j_encrypted'
+"""NEO4J_ENCRYPTED is a boolean indicating whether to use SSL/TLS when connecting."""
+NEO4J_VALIDATE_SSL = 'neo4j_validate_ssl'
+"""NEO4J_VALIDATE_SSL is a boolean indicating whether to validate the server's SSL/TLS cert against system CAs."""
+
+# Labels of the resources (read by users through READ_BY relations) to score e.g: ['Table', 'Dashboard']
+RESOURCE_TYPES = 'resource_types'
+# Minimum number of co-readers for a resource to be in a user's popular resources. Global scores are computed for
+# every resource, along with its number of readers so that the metadata service can apply its own minimum.
+MINIMUM_READER_COUNT = 'minimum_reader_count'
+# Number of popular resources kept per user
+NUM_PERSONAL_ENTRIES = 'num_personal_entries'
+# Number of users whose popular resources are computed per query
+USER_BATCH_SIZE = 'user_batch_size'
+
+DEFAULT_CONFIG = ConfigFactory.from_dict({NEO4J_MAX_CONN_LIFE_TIME_SEC: 50,
+                                          NEO4J_ENCRYPTED: True,
+                                          NEO4J_VALIDATE_SSL: False,
+                                          RESOURCE_TYPES: ['Table', 'Dashboard'],
+                                          MINIMUM_READER_COUNT: 10,
+                                          NUM_PERSONAL_ENTRIES: 50,
+                                          USER_BATCH_SIZE: 100})
+
+LOGGER = logging.getLogger(__name__)
+
+
+def personal_popular_resources_property(resource_type: str) -> str:
+    """
+    :return: the User property listing the keys of the popular resource_type resources for the user e.g:
+    popular_table_keys
+    """
+    return f'popular_{resource_type.lower()}_keys'
+
+
+class Neo4jPopularityScoreTask(Task):
+    """
+    A task that precomputes popularity scores from the READ_BY relations of every resource type, so that the metadata
+    service serves popular resources with an indexed lookup instead of scanning every READ_BY relation on request.
+    Run it after usage is published.
+
+    Popularity score = number of distinct readers * log(total number of reads), set as popularity_score (indexed) and
+    popularity_readers on every read resource.
+    The personal popular resources of a user are ranked the same way, from the reads of the users who read a resource
+    of the same type as the user (co-readers), and are set on the user as an ordered list of resource keys.
+    Scores and lists from previous runs that weren't updated (e.g: resources no longer read) are removed.
+    """
+
+    create_score_index_statement = 'CREATE INDEX ON :{type}(popularity_score)'
+    set_global_scores_statement = textwrap.dedent("""
+        MATCH (resource:{type})-[r:READ_BY]->(u:User)
+        WITH resource, count(distinct u) as readers, sum(r.read_count) as total_reads
+        SET resource.popularity_readers = readers, resource.popularity_score = readers * log(total_reads),
+            resource.popularity_run = $run
+        RETURN count(*) as count
+        """)
+    remove_stale_global_scores_statement = textwrap.dedent("""
+        MATCH (resource:{type})
+        WHERE resource.popularity_run IS NOT NULL AND resource.popularity_run <> $run
+        REMOVE resource.popularity_readers, resource.popularity_score, resource.popularity_run
+        RETURN count(*) as count
+        """)
+    get_readers_statement = textwrap.dedent("""
+        MATCH (u:User)<-[:READ_BY]-(:{type})
+        RETURN DISTINCT u.key as user_key
+        """)
+    set_personal_resources_statement = textwrap.dedent("""
+        UNWIND $user_keys as user_key
+        MATCH (u:User {{key: user_key}})<-[:READ_BY]-(:{type})-[:READ_BY]->
+              (coUser:User)<-[coRead:READ_BY]-(resource:{type})
+        WITH u, resource.key as resource_key, count(DISTINCT coUser) as co_readers,
+             sum(coRead.read_count) as total_co_reads
+        WHERE co_readers >= $num_readers
+        WITH u, resource_key, co_readers * log(total_co_reads) as score
+        ORDER BY score DESC
+        WITH u, collect(resource_key)[..$num_entries] as resource_keys
+        SET u.{property_name} = resource_keys, u.{property_name}_run = $run
+        RETURN count(*) as count
+        """)
+    remove_stale_personal_resources_statement = textwrap.dedent("""
+        MATCH (u:User)
+        WHERE u.{property_name}_run IS NOT NULL AND u.{property_name}_run <> $run
+        REMOVE u.{property_name}, u.{property_name}_run
+        RETURN count(*) as count
+        """)
+
+    def __init__(self) -> None:
+        pass
+
+    def get_scope(self) -> str:
+        return 'task.popularity_score'
+
+    def init(self, conf: ConfigTree) -> None:
+        conf = Scoped.get_scoped_conf(conf, self.get_scope()) \
+            .with_fallback(conf) \
+            .with_fallback(DEFAULT_CONFIG)
+        self.resource_types = conf.get_list(RESOURCE_TYPES)
+        self.minimum_reader_count = conf.get_int(MINIMUM_READER_COUNT)
+        self.num_personal_entries = conf.get_int(NUM_PERSONAL_ENTRIES)
+        self.user_batch_size = conf.get_int(USER_BATCH_SIZE)
+
+        trust = neo4j.TRUST_SYSTEM_CA_SIGNED_CERTIFICATES if conf.get_bool(NEO4J_VALIDATE_SSL) \
+            else neo4j.TRUST_ALL_CERTIFICATES
+        self._driver = \
+            GraphDatabase.driver(conf.get_string(NEO4J_END_POINT_KEY),
+                                 max_connection_life_time=conf.get_int(NEO4J_MAX_CONN_LIFE_TIME_SEC),
+                                 auth=(conf.get_string(NEO4J_USER), conf.get_string(NEO4J_PASSWORD)),
+                                 encrypted=conf.get_bool(NEO4J_ENCRYPTED),
+                                 trust=trust)
+
+    def run(self) -> None:
+        # Identifies what this run updated, anything else is stale
+        run = int(time.time() * 1000)
+        for resource_type in self.resource_types:
+            self._set_global_scores(resource_type=resource_type, run=run)
+            self._set_personal_resources(resource_type=resource_type, run=run)
+
+    def _set_global_scores(self, resource_type: str, run: int) -> None:
+        self._try_create_score_index(resource_type)
+
+        count = self._get_count(self.set_global_scores_statement.format(type=resource_type), {'run': run})
+        LOGGER.info('Set popularity score of %i %s nodes', count, resource_type)
+
+        count = self._get_count(self.remove_stale_global_scores_statement.format(type=resource_type), {'run': run})
+        LOGGER.info('Removed stale popularity score of %i %s nodes', count, resource_type)
+
+    def _try_create_score_index(self, resource_type: str) -> None:
+        """
+        Neo4j ignores a second creation of the index in 3.x, but raises an error in 4.x.
+        """
+        try:
+            self._execute_cypher_query(self.create_score_index_statement.format(type=resource_type))
+        except CypherError as e:
+            if 'An equivalent index already exists' not in e.__str__():
+                raise
+            # Else, swallow the exception, to make this function idempotent.
+
+    def _set_personal_resources(self, resource_type: str, run: int) -> None:
+        property_name = personal_popular_resources_property(resource_type)
+        user_keys = [record['user_key'] for record in
+                     self._execute_cypher_query(self.get_readers_statement.format(type=resource_type))]
+
+        statement = self.set_personal_resources_statement.format(type=resource_type, property_name=property_name)
+        count = 0
+        for i in range(0, len(user_keys), self.user_batch_size):
+            count += self._get_count(statement, {'user_keys': user_keys[i:i + self.user_batch_size],
+                                                 'num_readers': self.minimum_reader_count,
+                                                 'num_entries': self.num_personal_entries,
+                                                 'run': run})
+        LOGGER.info('Set popular %s nodes of %i users', resource_type, count)
+
+        count = self._get_count(self.remove_stale_personal_resources_statement.format(property_name=property_name),
+                                {'run': run})
+        LOGGER.info('Removed stale popular %s nodes of %i users', resource_type, count)
+
+    def _get_count(self, statement: str, param_dict: Dict[str, Any]) -> int:
+        return sum(record['count'] for record in self._execute_cypher_query(statement, param_dict))
+
+    def _execute_cypher_query(self,
+                              statement: str,
+                              param_dict: Dict[str, Any] = {}
+                              ) -> Iterable[Dict[str, Any]]:
+        LOGGER.info('Executing Cypher query: %s with params %s: ', statement, param_dict)
+
+        start = time.time()
+        try:
+            with self._driver.session() as session:
+                return list(session.run(statement, **param_dict))
+
+        finally:
+            LOGGER.debug('Cypher query execution elapsed for %i seconds', time.time() - start)
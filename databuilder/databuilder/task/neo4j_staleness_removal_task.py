@@ -4,13 +4,17 @@
 import logging
 import textwrap
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import (
-    Any, Dict, Iterable, Union,
+    Any, Callable, Dict, Iterable, List, Tuple, Union,
 )
 
 import neo4j
 from neo4j import GraphDatabase
+from neo4j.exceptions import TransientError
 from pyhocon import ConfigFactory, ConfigTree
+from statsd import StatsClient
 
 from databuilder import Scoped
 from databuilder.publisher.neo4j_csv_publisher import JOB_PUBLISH_TAG
@@ -37,6 +41,25 @@ STALENESS_PCT_MAX_DICT = "staleness_max_pct_dict"
 # Using this milliseconds and published timestamp to determine staleness
 MS_TO_EXPIRE = "milliseconds_to_expire"
 MIN_MS_TO_EXPIRE = "minimum_milliseconds_to_expire"
+# Computes total and stale counts of all target nodes in one query, and of all target relations in another one,
+# instead of running two count queries per LABEL/TYPE
+AGGREGATED_VALIDATION = "aggregated_validation"
+# How stale data of a LABEL/TYPE is deleted. One of the *_DELETE_MODE below
+DELETE_MODE = "delete_mode"
+# Deletes up to batch_size elements per query until there is nothing left to delete
+BATCH_DELETE_MODE = 'batch'
+# Deletes all stale elements in one query with apoc.periodic.iterate, committing every batch_size elements.
+# Requires the APOC plugin.
+APOC_DELETE_MODE = 'apoc'
+# Deletes all stale elements in one query with CALL { ... } IN TRANSACTIONS, committing every batch_size elements.
+# Requires Neo4j 4.4+
+IN_TRANSACTIONS_DELETE_MODE = 'call_in_transactions'
+DELETE_MODES = {BATCH_DELETE_MODE, APOC_DELETE_MODE, IN_TRANSACTIONS_DELETE_MODE}
+# Number of LABEL/TYPE whose stale data is deleted concurrently. Nodes are still all deleted before relations.
+DELETE_CONCURRENCY = "delete_concurrency"
+# If enabled, emits the deletion time and the deleted count of each LABEL/TYPE through statsd with prefix
+# amundsen.databuilder.task.remove_stale_data
+IS_STATSD_ENABLED = "is_statsd_enabled"
 
 DEFAULT_CONFIG = ConfigFactory.from_dict({BATCH_SIZE: 100,
                                           NEO4J_MAX_CONN_LIFE_TIME_SEC: 50,
@@ -47,12 +70,20 @@ DEFAULT_CONFIG = ConfigFactory.from_dict({BATCH_SIZE: 100,
                                           TARGET_RELATIONS: [],
                                           STALENESS_PCT_MAX_DICT: {},
                                           MIN_MS_TO_EXPIRE: 86400000,
-                                          DRY_RUN: False})
+                                          DRY_RUN: False,
+                                          AGGREGATED_VALIDATION: False,
+                                          DELETE_MODE: BATCH_DELETE_MODE,
+                                          DELETE_CONCURRENCY: 1,
+                                          IS_STATSD_ENABLED: False})
 
 LOGGER = logging.getLogger(__name__)
 
 MARKER_VAR_NAME = 'marker'
 
+# TransientError (e.g: a deadlock between concurrent deletions) retries and sleep time
+RETRIES_NUMBER = 5
+SLEEP_TIME = 2
+
 
 class TargetWithCondition:
     def __init__(self, target_type: str, condition: str) -> None:
@@ -94,6 +125,50 @@ class Neo4jStalenessRemovalTask(Task):
         WHERE {staleness_condition}{{extra_condition}}
         RETURN count(*) as count
         """)
+    # Counts of all the targets are combined with UNION ALL into a single query
+    validate_node_staleness_aggregated_statement = textwrap.dedent("""
+        MATCH (target:{{type}})
+        WHERE true{{extra_condition}}
+        RETURN {{target_index}} as target_index, count(*) as total_count,
+        count(CASE WHEN {staleness_condition} THEN 1 END) as stale_count
+        """)
+    validate_relation_staleness_aggregated_statement = textwrap.dedent("""
+        MATCH (start_node)-[target:{{type}}]-(end_node)
+        WHERE true{{extra_condition}}
+        RETURN {{target_index}} as target_index, count(*) as total_count,
+        count(CASE WHEN {staleness_condition} THEN 1 END) as stale_count
+        """)
+    # An undirected pattern matches a relation twice, hence DISTINCT before deleting it
+    delete_stale_nodes_in_transactions_statement = textwrap.dedent("""
+        MATCH (target:{{type}})
+        WHERE {staleness_condition}{{extra_condition}}
+        CALL {{{{ WITH target DETACH DELETE target }}}} IN TRANSACTIONS OF {{batch_size}} ROWS
+        RETURN count(*) as count
+        """)
+    delete_stale_relations_in_transactions_statement = textwrap.dedent("""
+        MATCH (start_node)-[target:{{type}}]-(end_node)
+        WHERE {staleness_condition}{{extra_condition}}
+        WITH DISTINCT target
+        CALL {{{{ WITH target DELETE target }}}} IN TRANSACTIONS OF {{batch_size}} ROWS
+        RETURN count(*) as count
+        """)
+    iterate_stale_nodes_statement = textwrap.dedent("""
+        MATCH (target:{{type}})
+        WHERE {staleness_condition}{{extra_condition}}
+        RETURN target
+        """)
+    iterate_stale_relations_statement = textwrap.dedent("""
+        MATCH (start_node)-[target:{{type}}]-(end_node)
+        WHERE {staleness_condition}{{extra_condition}}
+        RETURN DISTINCT target
+        """)
+    # Statements are passed as parameters so that conditions don't need to be escaped
+    apoc_delete_statement = textwrap.dedent("""
+        CALL apoc.periodic.iterate($iterate_statement, $action_statement,
+                                   {batchSize: $batch_size, params: {marker: $marker}})
+        YIELD total, failedBatches, errorMessages
+        RETURN total as count, failedBatches as failed_batches, errorMessages as error_messages
+        """)
 
     def __init__(self) -> None:
         pass
@@ -111,6 +186,13 @@ class Neo4jStalenessRemovalTask(Task):
         self.dry_run = conf.get_bool(DRY_RUN)
         self.staleness_pct = conf.get_int(STALENESS_MAX_PCT)
         self.staleness_pct_dict = conf.get(STALENESS_PCT_MAX_DICT)
+        self.aggregated_validation = conf.get_bool(AGGREGATED_VALIDATION)
+        self.delete_mode = conf.get_string(DELETE_MODE)
+        if self.delete_mode not in DELETE_MODES:
+            raise Exception(f'{DELETE_MODE} should be one of {sorted(DELETE_MODES)}')
+        self.delete_concurrency = conf.get_int(DELETE_CONCURRENCY)
+        self.statsd = StatsClient(prefix=f'amundsen.databuilder.{self.get_scope()}') \
+            if conf.get_bool(IS_STATSD_ENABLED) else None
 
         if JOB_PUBLISH_TAG in conf and MS_TO_EXPIRE in conf:
             raise Exception(f'Cannot have both {JOB_PUBLISH_TAG} and {MS_TO_EXPIRE} in job config')
@@ -150,12 +232,30 @@ class Neo4jStalenessRemovalTask(Task):
          - Check if deleted nodes will be within 10% of total nodes.
         :return:
         """
+        if self.aggregated_validation:
+            self._validate_aggregated_staleness_pct(
+                statement=self._decorate_staleness(self.validate_node_staleness_aggregated_statement),
+                targets=self.target_nodes)
+            self._validate_aggregated_staleness_pct(
+                statement=self._decorate_staleness(self.validate_relation_staleness_aggregated_statement),
+                targets=self.target_relations)
+            return
+
         self._validate_node_staleness_pct()
         self._validate_relation_staleness_pct()
 
     def _delete_stale_nodes(self) -> None:
-        self._batch_delete(statement=self._decorate_staleness(self.delete_stale_nodes_statement),
-                           targets=self.target_nodes)
+        if self.delete_mode == APOC_DELETE_MODE:
+            delete_target = partial(self._apoc_delete,
+                                    self._decorate_staleness(self.iterate_stale_nodes_statement),
+                                    'DETACH DELETE target')
+        elif self.delete_mode == IN_TRANSACTIONS_DELETE_MODE:
+            delete_target = partial(self._in_transactions_delete,
+                                    self._decorate_staleness(self.delete_stale_nodes_in_transactions_statement))
+        else:
+            delete_target = partial(self._batch_delete,
+                                    self._decorate_staleness(self.delete_stale_nodes_statement))
+        self._delete_targets(delete_target=delete_target, targets=self.target_nodes)
 
     def _decorate_staleness(self,
                             statement: str
@@ -175,41 +275,145 @@ class Neo4jStalenessRemovalTask(Task):
         OR NOT EXISTS(target.published_tag))"""))
 
     def _delete_stale_relations(self) -> None:
-        self._batch_delete(statement=self._decorate_staleness(self.delete_stale_relations_statement),
-                           targets=self.target_relations)
+        if self.delete_mode == APOC_DELETE_MODE:
+            delete_target = partial(self._apoc_delete,
+                                    self._decorate_staleness(self.iterate_stale_relations_statement),
+                                    'DELETE target')
+        elif self.delete_mode == IN_TRANSACTIONS_DELETE_MODE:
+            delete_target = partial(self._in_transactions_delete,
+                                    self._decorate_staleness(self.delete_stale_relations_in_transactions_statement))
+        else:
+            delete_target = partial(self._batch_delete,
+                                    self._decorate_staleness(self.delete_stale_relations_statement))
+        self._delete_targets(delete_target=delete_target, targets=self.target_relations)
+
+    def _delete_targets(self,
+                        delete_target: Callable[[str, str], int],
+                        targets: Union[Iterable[str], Iterable[TargetWithCondition]]
+                        ) -> None:
+        """
+        Deletes stale data of each target, up to delete_concurrency targets at a time.
+        :param delete_target: Deletes stale data of a LABEL/TYPE with an extra condition and returns the deleted count
+        :param targets:
+        :return:
+        """
+        if self.delete_concurrency <= 1:
+            for t in targets:
+                self._delete_target(delete_target, t)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.delete_concurrency) as executor:
+            # list() to re-raise the first failure
+            list(executor.map(partial(self._delete_target, delete_target), targets))
+
+    def _delete_target(self,
+                       delete_target: Callable[[str, str], int],
+                       target: Union[str, TargetWithCondition]
+                       ) -> None:
+        target_type, extra_condition = self._get_type_and_condition(target)
+
+        LOGGER.info('Deleting stale data of %s with batch size %i', target_type, self.batch_size)
+        start = time.time()
+        retries = 0
+        while True:
+            try:
+                total_count = delete_target(target_type, extra_condition)
+                break
+            except TransientError:
+                # Deleted data is already committed, so running the deletion again picks up where it failed
+                retries += 1
+                if retries > RETRIES_NUMBER:
+                    raise
+                LOGGER.warning('Retrying deletion of stale data of %s after a transient error', target_type)
+                time.sleep(SLEEP_TIME)
+        elapsed = time.time() - start
+
+        LOGGER.info('Deleted %i stale data of %s in %.1f seconds', total_count, target_type, elapsed)
+        if self.statsd:
+            self.statsd.timing(f'{target_type}.delete_time', int(elapsed * 1000))
+            self.statsd.incr(f'{target_type}.deleted', total_count)
 
     def _batch_delete(self,
                       statement: str,
-                      targets: Union[Iterable[str], Iterable[TargetWithCondition]]
-                      ) -> None:
+                      target_type: str,
+                      extra_condition: str
+                      ) -> int:
         """
         Performing huge amount of deletion could degrade Neo4j performance. Therefore, it's taking batch deletion here.
         :param statement:
-        :param targets:
-        :return:
+        :param target_type:
+        :param extra_condition:
+        :return: Number of deleted nodes/relations
         """
-        for t in targets:
-            if isinstance(t, TargetWithCondition):
-                target_type = t.target_type
-                extra_condition = ' AND ' + t.condition
-            else:
-                target_type = t
-                extra_condition = ''
-
-            LOGGER.info('Deleting stale data of %s with batch size %i', target_type, self.batch_size)
-            total_count = 0
-            while True:
-                results = self._execute_cypher_query(statement=statement.format(type=target_type,
-                                                                                extra_condition=extra_condition),
-                                                     param_dict={'batch_size': self.batch_size,
-                                                                 MARKER_VAR_NAME: self.marker},
-                                                     dry_run=self.dry_run)
-                record = next(iter(results), None)
-                count = record['count'] if record else 0
-                total_count = total_count + count
-                if count == 0:
-                    break
-            LOGGER.info('Deleted %i stale data of %s', total_count, target_type)
+        total_count = 0
+        while True:
+            results = self._execute_cypher_query(statement=statement.format(type=target_type,
+                                                                            extra_condition=extra_condition),
+                                                 param_dict={'batch_size': self.batch_size,
+                                                             MARKER_VAR_NAME: self.marker},
+                                                 dry_run=self.dry_run)
+            record = next(iter(results), None)
+            count = record['count'] if record else 0
+            total_count = total_count + count
+            if count == 0:
+                return total_count
+
+    def _in_transactions_delete(self,
+                                statement: str,
+                                target_type: str,
+                                extra_condition: str
+                                ) -> int:
+        """
+        Deletes all stale data of the target in a single query, which Neo4j commits every batch_size rows.
+        :param statement:
+        :param target_type:
+        :param extra_condition:
+        :return: Number of deleted nodes/relations
+        """
+        results = self._execute_cypher_query(statement=statement.format(type=target_type,
+                                                                        extra_condition=extra_condition,
+                                                                        batch_size=self.batch_size),
+                                             param_dict={MARKER_VAR_NAME: self.marker},
+                                             dry_run=self.dry_run)
+        record = next(iter(results), None)
+        return record['count'] if record else 0
+
+    def _apoc_delete(self,
+                     iterate_statement: str,
+                     action_statement: str,
+                     target_type: str,
+                     extra_condition: str
+                     ) -> int:
+        """
+        Deletes all stale data of the target in a single query, using apoc.periodic.iterate to commit every
+        batch_size elements.
+        :param iterate_statement: Statement returning stale elements as target
+        :param action_statement: Statement deleting target
+        :param target_type:
+        :param extra_condition:
+        :return: Number of deleted nodes/relations
+        """
+        results = self._execute_cypher_query(
+            statement=self.apoc_delete_statement,
+            param_dict={'iterate_statement': iterate_statement.format(type=target_type,
+                                                                      extra_condition=extra_condition),
+                        'action_statement': action_statement,
+                        'batch_size': self.batch_size,
+                        MARKER_VAR_NAME: self.marker},
+            dry_run=self.dry_run)
+        record = next(iter(results), None)
+        if not record:
+            return 0
+        if record['failed_batches']:
+            raise Exception(f'Failed to delete {record["failed_batches"]} batches of stale {target_type}: '
+                            f'{record["error_messages"]}')
+        return record['count']
+
+    @staticmethod
+    def _get_type_and_condition(target: Union[str, TargetWithCondition]) -> Tuple[str, str]:
+        if isinstance(target, TargetWithCondition):
+            return target.target_type, ' AND ' + target.condition
+        return target, ''
 
     def _validate_staleness_pct(self,
                                 total_record_count: int,
@@ -282,6 +486,32 @@ class Neo4jStalenessRemovalTask(Task):
                                          stale_record_count=stale_record_value['count'] if stale_record_value else 0,
                                          target_type=target_type)
 
+    def _validate_aggregated_staleness_pct(self,
+                                           statement: str,
+                                           targets: Union[Iterable[str], Iterable[TargetWithCondition]]
+                                           ) -> None:
+        """
+        Validates staleness of all the targets with a single query, where each target's total and stale counts are
+        computed in the same pass over its nodes/relations.
+        :param statement:
+        :param targets:
+        :return:
+        """
+        type_and_conditions: List[Tuple[str, str]] = [self._get_type_and_condition(t) for t in targets]
+        if not type_and_conditions:
+            return
+
+        aggregated_statement = 'UNION ALL'.join(
+            statement.format(type=target_type, extra_condition=extra_condition, target_index=index)
+            for index, (target_type, extra_condition) in enumerate(type_and_conditions))
+        records = self._execute_cypher_query(statement=aggregated_statement,
+                                             param_dict={MARKER_VAR_NAME: self.marker})
+
+        for record in records:
+            self._validate_staleness_pct(total_record_count=record['total_count'],
+                                         stale_record_count=record['stale_count'],
+                                         target_type=type_and_conditions[record['target_index']][0])
+
     def _execute_cypher_query(self,
                               statement: str,
                               param_dict: Dict[str, Any] = {},
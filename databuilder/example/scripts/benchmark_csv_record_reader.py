@@ -0,0 +1,65 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+This is a benchmark script comparing the peak memory (max RSS) of parsing a publisher CSV file
+with pandas.read_csv(...).to_dict(orient='records') against the chunked read_csv_records used by the publishers.
+
+It writes a synthetic Column node file and iterates over its records in a fresh process per reader:
+
+    python benchmark_csv_record_reader.py [num_rows]
+"""
+
+import csv
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+import pandas
+
+from databuilder.publisher.csv_record_reader import read_csv_records
+
+num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5000000
+
+
+def write_column_file(path):
+    with open(path, 'w', encoding='utf8') as column_file:
+        writer = csv.writer(column_file, quoting=csv.QUOTE_NONNUMERIC)
+        writer.writerow(['KEY', 'name', 'sort_order:UNQUOTED', 'col_type', 'description', 'LABEL'])
+        for i in range(num_rows):
+            writer.writerow([f'bench://gold.bench_schema/table_{i // 50}/col_{i % 50}', f'col_{i % 50}', i % 50,
+                             'varchar', f'synthetic column number {i}', 'Column'])
+
+
+def read_full(path):
+    with open(path, 'r', encoding='utf8') as column_csv:
+        return sum(1 for _ in pandas.read_csv(column_csv, na_filter=False).to_dict(orient='records'))
+
+
+def read_chunked(path):
+    return sum(1 for _ in read_csv_records(path))
+
+
+def measure(reader, path, queue):
+    start = time.time()
+    count = reader(path)
+    # ru_maxrss is in kilobytes on Linux
+    queue.put((count, time.time() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'Column_0.csv')
+        write_column_file(path)
+        print(f'File size: {os.path.getsize(path) / 1024 / 1024:.0f} MB')
+
+        for name, reader in (('pandas to_dict', read_full), ('read_csv_records', read_chunked)):
+            queue: multiprocessing.Queue = multiprocessing.Queue()
+            process = multiprocessing.Process(target=measure, args=(reader, path, queue))
+            process.start()
+            count, elapsed, max_rss_mb = queue.get()
+            process.join()
+            print(f'{name:>18}: {count} rows in {elapsed:.1f}s, max RSS {max_rss_mb:.0f} MB')
@@ -0,0 +1,82 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+This is a benchmark script comparing the throughput (rows/sec) of MySQLCSVPublisher when it merges records one by one
+with the ORM and when it upserts them in bulk.
+
+It runs against a SQLite database file, so no MySQL is needed. Each mode publishes a synthetic usage file twice
+into a fresh database: the first run inserts every row, the second one updates them:
+
+    python benchmark_mysql_csv_publisher.py [num_rows] [bulk_upsert_chunk_size]
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import time
+
+from pyhocon import ConfigFactory
+from sqlalchemy import (
+    BigInteger, Column, Integer, String,
+)
+from sqlalchemy.ext.declarative import declarative_base
+
+from databuilder.publisher import mysql_csv_publisher
+from databuilder.publisher.mysql_csv_publisher import MySQLCSVPublisher
+
+num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+Base = declarative_base()
+
+
+class RDSBenchUsage(Base):  # type: ignore
+    __tablename__ = 'bench_usage'
+
+    table_rk = Column(String(128), primary_key=True)
+    user_rk = Column(String(128), primary_key=True)
+    read_count = Column(Integer)
+    published_tag = Column(String(128), nullable=False)
+    publisher_last_updated_epoch_ms = Column(BigInteger, nullable=False)
+
+
+def write_usage_file(folder):
+    with open(os.path.join(folder, 'bench_usage_0.csv'), 'w', encoding='utf8') as usage_file:
+        writer = csv.writer(usage_file, quoting=csv.QUOTE_NONNUMERIC)
+        writer.writerow(['table_rk', 'user_rk', 'read_count'])
+        for i in range(num_rows):
+            writer.writerow([f'bench://gold.bench_schema/table_{i // 100}', f'user_{i % 100}@example.com', i % 17])
+
+
+def publish(record_folder, db_path, bulk_upsert_chunk_size):
+    conf = ConfigFactory.from_dict({
+        MySQLCSVPublisher.RECORD_FILES_DIR: record_folder,
+        MySQLCSVPublisher.CONN_STRING: f'sqlite:///{db_path}',
+        MySQLCSVPublisher.TRANSACTION_SIZE: 10000,
+        MySQLCSVPublisher.BULK_UPSERT_CHUNK_SIZE: bulk_upsert_chunk_size,
+        MySQLCSVPublisher.JOB_PUBLISH_TAG: str(time.time()),
+    })
+    publisher = MySQLCSVPublisher()
+    publisher.init(conf)
+    Base.metadata.create_all(publisher._engine)
+
+    start = time.time()
+    publisher.publish()
+    return time.time() - start
+
+
+if __name__ == '__main__':
+    mysql_csv_publisher.Base = Base
+
+    with tempfile.TemporaryDirectory() as folder:
+        record_folder = os.path.join(folder, 'records')
+        os.makedirs(record_folder)
+        write_usage_file(record_folder)
+
+        for label, bulk_upsert_chunk_size in (('orm merge', 0), (f'bulk({chunk_size})', chunk_size)):
+            db_path = os.path.join(folder, f'{bulk_upsert_chunk_size}.db')
+            for run in ('insert', 'update'):
+                elapsed = publish(record_folder, db_path, bulk_upsert_chunk_size)
+                print(f'{label:>12} {run}: {num_rows} rows in {elapsed:.1f}s, {num_rows / elapsed:.0f} rows/sec')
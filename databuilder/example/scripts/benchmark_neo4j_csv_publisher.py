@@ -0,0 +1,98 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+This is a benchmark script comparing the publishing throughput (rows/sec) of Neo4jCsvPublisher
+when it sends one MERGE statement per CSV row and when it sends UNWIND batches.
+
+It generates synthetic Table / Column node files and Table-Column relation files and publishes them
+against a running Neo4j, e.g. the one started by docker-amundsen.yml:
+
+    python benchmark_neo4j_csv_publisher.py [neo4j_host] [num_tables] [columns_per_table] [batch_size]
+
+Each run publishes with a fresh job_publish_tag so every row is written.
+"""
+
+import csv
+import logging
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+from pyhocon import ConfigFactory
+
+from databuilder.publisher import neo4j_csv_publisher
+from databuilder.publisher.neo4j_csv_publisher import Neo4jCsvPublisher
+
+neo_host = os.getenv('CREDENTIALS_NEO4J_PROXY_HOST', 'localhost')
+neo_port = os.getenv('CREDENTIALS_NEO4J_PROXY_PORT', 7687)
+if len(sys.argv) > 1:
+    neo_host = sys.argv[1]
+num_tables = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+columns_per_table = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+batch_size = int(sys.argv[4]) if len(sys.argv) > 4 else 1000
+
+neo4j_endpoint = f'bolt://{neo_host}:{neo_port}'
+neo4j_user = 'neo4j'
+neo4j_password = 'test'
+
+LOGGER = logging.getLogger(__name__)
+
+
+def write_csv_files(folder):
+    node_folder = os.path.join(folder, 'nodes')
+    relation_folder = os.path.join(folder, 'relations')
+    os.makedirs(node_folder)
+    os.makedirs(relation_folder)
+
+    with open(os.path.join(node_folder, 'Table_0.csv'), 'w') as table_file, \
+            open(os.path.join(node_folder, 'Column_0.csv'), 'w') as column_file, \
+            open(os.path.join(relation_folder, 'Table_Column_COLUMN.csv'), 'w') as relation_file:
+        tables = csv.writer(table_file, quoting=csv.QUOTE_NONNUMERIC)
+        columns = csv.writer(column_file, quoting=csv.QUOTE_NONNUMERIC)
+        relations = csv.writer(relation_file, quoting=csv.QUOTE_NONNUMERIC)
+        tables.writerow(['KEY', 'name', 'is_view:UNQUOTED', 'LABEL'])
+        columns.writerow(['KEY', 'name', 'sort_order:UNQUOTED', 'col_type', 'LABEL'])
+        relations.writerow(['START_LABEL', 'START_KEY', 'END_LABEL', 'END_KEY', 'TYPE', 'REVERSE_TYPE'])
+
+        for i in range(num_tables):
+            table_key = f'bench://gold.bench_schema/table_{i}'
+            tables.writerow([table_key, f'table_{i}', 'false', 'Table'])
+            for j in range(columns_per_table):
+                column_key = f'{table_key}/col_{j}'
+                columns.writerow([column_key, f'col_{j}', j, 'bigint', 'Column'])
+                relations.writerow(['Table', table_key, 'Column', column_key, 'COLUMN', 'COLUMN_OF'])
+
+    return node_folder, relation_folder
+
+
+def run_publisher(node_folder, relation_folder, unwind_batch_size):
+    conf = ConfigFactory.from_dict({
+        neo4j_csv_publisher.NODE_FILES_DIR: node_folder,
+        neo4j_csv_publisher.RELATION_FILES_DIR: relation_folder,
+        neo4j_csv_publisher.NEO4J_END_POINT_KEY: neo4j_endpoint,
+        neo4j_csv_publisher.NEO4J_USER: neo4j_user,
+        neo4j_csv_publisher.NEO4J_PASSWORD: neo4j_password,
+        neo4j_csv_publisher.NEO4J_ENCRYPTED: False,
+        neo4j_csv_publisher.NEO4J_UNWIND_BATCH_SIZE: unwind_batch_size,
+        neo4j_csv_publisher.JOB_PUBLISH_TAG: str(uuid.uuid4()),
+    })
+    publisher = Neo4jCsvPublisher()
+    publisher.init(conf)
+    start = time.time()
+    publisher.publish()
+    return time.time() - start
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.WARNING)
+
+    total_rows = num_tables + 2 * num_tables * columns_per_table
+    with tempfile.TemporaryDirectory() as folder:
+        node_folder, relation_folder = write_csv_files(folder)
+
+        for label, unwind_batch_size in (('per-row', 0), (f'unwind({batch_size})', batch_size)):
+            elapsed = run_publisher(node_folder, relation_folder, unwind_batch_size)
+            print(f'{label:>16}: {total_rows} rows in {elapsed:.1f}s, {total_rows / elapsed:.0f} rows/sec')
@@ -0,0 +1,57 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+This is a micro-benchmark of Cypher statement creation in Neo4jCsvPublisher, in statements/sec.
+
+It compares building a new jinja2.Template and rendering it for every row, as the publisher used to do,
+with the statement cache keyed by label (or relation types) and set of columns. No Neo4j is needed:
+
+    python benchmark_neo4j_statement_cache.py [num_rows]
+"""
+
+import sys
+import time
+
+from jinja2 import Template
+
+from databuilder.publisher.neo4j_csv_publisher import NODE_REQUIRED_KEYS, Neo4jCsvPublisher
+
+num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+
+def create_node_merge_statement_uncached(publisher, node_record):
+    template = Template("""
+        MERGE (node:{{ LABEL }} {key: $KEY})
+        ON CREATE SET {{ PROP_BODY }}
+        {% if update %} ON MATCH SET {{ PROP_BODY }} {% endif %}
+    """)
+
+    prop_body = publisher._create_props_body(node_record, NODE_REQUIRED_KEYS, 'node')
+
+    return template.render(LABEL=node_record["LABEL"],
+                           PROP_BODY=prop_body,
+                           update=(not publisher.is_create_only_node(node_record)))
+
+
+def run(label, create_statement, records):
+    start = time.time()
+    for record in records:
+        create_statement(record)
+    elapsed = time.time() - start
+    print(f'{label:>10}: {len(records)} statements in {elapsed:.2f}s, {len(records) / elapsed:.0f} statements/sec')
+
+
+if __name__ == '__main__':
+    publisher = Neo4jCsvPublisher()
+    publisher.publish_tag = 'benchmark'
+    publisher.create_only_nodes = set()
+
+    records = [{'KEY': f'bench://gold.bench_schema/table_{i // 50}/col_{i % 50}',
+                'name': f'col_{i % 50}',
+                'sort_order:UNQUOTED': i % 50,
+                'col_type': 'bigint',
+                'LABEL': 'Column'} for i in range(num_rows)]
+
+    run('uncached', lambda record: create_node_merge_statement_uncached(publisher, record), records)
+    run('cached', publisher.create_node_merge_statement, records)
@@ -1,11 +1,16 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+import tempfile
 import unittest
-from typing import Any, Dict
+from typing import (
+    Any, Dict, Iterator,
+)
 
 from mock import patch
 from pyhocon import ConfigFactory
+from sqlalchemy import create_engine
 
 from databuilder import Scoped
 from databuilder.extractor.sql_alchemy_extractor import SQLAlchemyExtractor
@@ -122,6 +127,75 @@ class TestSqlAlchemyExtractor(unittest.TestCase):
         extractor._get_connection()
         mock_method.assert_called_with('TEST_CONNECTION', connect_args={"protocol": "https"})
 
+        extractor = SQLAlchemyExtractor()
+        config_dict = {
+            'extractor.sqlalchemy.conn_string': 'TEST_CONNECTION',
+            'extractor.sqlalchemy.extract_sql': 'SELECT 1 FROM TEST_TABLE;',
+            'extractor.sqlalchemy.fetch_size': 50,
+        }
+        conf = ConfigFactory.from_dict(config_dict)
+        extractor.init(Scoped.get_scoped_conf(conf=conf,
+                                              scope=extractor.get_scope()))
+        connection = mock_method.return_value.connect.return_value
+        connection.execution_options.assert_called_with(stream_results=True, max_row_buffer=50)
+
+    @patch.object(SQLAlchemyExtractor, '_get_connection')
+    def test_extraction_with_model_class_is_lazy(self: Any, mock_method: Any) -> None:
+        """
+        Test that rows are converted to model one at a time, as they are extracted
+        """
+        config_dict = {
+            'extractor.sqlalchemy.conn_string': 'TEST_CONNECTION',
+            'extractor.sqlalchemy.extract_sql': 'SELECT 1 FROM TEST_TABLE;',
+            'extractor.sqlalchemy.model_class':
+                'tests.unit.extractor.test_sql_alchemy_extractor.TableMetadataResult'
+        }
+        conf = ConfigFactory.from_dict(config_dict)
+        row = dict(database='test_database', schema='test_schema', name='test_table',
+                   description='test_description', column_name='test_column_name',
+                   column_type='test_column_type', column_comment='test_column_comment', owner='test_owner')
+
+        def rows() -> Iterator[Dict[str, str]]:
+            yield row
+            raise AssertionError('Rows should be fetched only when extracted')
+
+        extractor = SQLAlchemyExtractor()
+        extractor.results = rows()
+        extractor.init(Scoped.get_scoped_conf(conf=conf,
+                                              scope=extractor.get_scope()))
+
+        result = extractor.extract()
+        self.assertIsInstance(result, TableMetadataResult)
+        self.assertEqual(result.name, 'test_table')
+
+    def test_extraction_from_sqlite(self: Any) -> None:
+        """
+        Test extraction end to end against SQLite, where stream_results is a no-op
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            conn_string = f'sqlite:///{os.path.join(folder, "test.db")}'
+            engine = create_engine(conn_string)
+            engine.execute('CREATE TABLE test_table (name VARCHAR(32))')
+            engine.execute("INSERT INTO test_table VALUES ('foo'), ('bar'), ('baz')")
+
+            conf = ConfigFactory.from_dict({
+                'extractor.sqlalchemy.conn_string': conn_string,
+                'extractor.sqlalchemy.extract_sql': 'SELECT name FROM test_table ORDER BY name',
+                'extractor.sqlalchemy.fetch_size': 2,
+            })
+            extractor = SQLAlchemyExtractor()
+            extractor.init(Scoped.get_scoped_conf(conf=conf,
+                                                  scope=extractor.get_scope()))
+
+            result = []
+            record = extractor.extract()
+            while record:
+                result.append(record['name'])
+                record = extractor.extract()
+            extractor.close()
+
+            self.assertEqual(result, ['bar', 'baz', 'foo'])
+
 
 class TableMetadataResult:
     """
@@ -45,3 +45,12 @@ class TestAtlasCsvPublisher(unittest.TestCase):
 
         # 2 relationships to create
         self.assertEqual(self.mock_atlas_client.relationship.create_relationship.call_count, 2)
+
+    def test_create_entity_instances_in_batches(self) -> None:
+        publisher = AtlasCSVPublisher()
+        publisher.init(conf=Scoped.get_scoped_conf(conf=self._conf, scope=publisher.get_scope()))
+
+        batches = list(publisher._create_entity_instances(f'{self._resource_path}/entities/000_Actor.csv'))
+
+        # batch_size is 1, so only one record is held at a time
+        self.assertEqual([len(create) + len(update) for create, update, _, _ in batches], [1, 1])
@@ -0,0 +1,64 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas
+
+from databuilder.publisher.csv_record_reader import read_csv_first_record, read_csv_records
+
+here = os.path.dirname(__file__)
+
+
+class TestCsvRecordReader(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._node_file = os.path.join(here, '../resources/csv_publisher/nodes/test_column.csv')
+
+    def test_read_csv_records(self) -> None:
+        with open(self._node_file, 'r', encoding='utf8') as node_csv:
+            expected = pandas.read_csv(node_csv, na_filter=False).to_dict(orient='records')
+
+        self.assertEqual(list(read_csv_records(self._node_file)), expected)
+        self.assertEqual(list(read_csv_records(self._node_file, chunk_size=1)), expected)
+        self.assertEqual(expected[1]['order_pos:UNQUOTED'], 2)
+
+    def test_read_csv_records_column_changing_type_across_chunks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, 'nodes.csv')
+            with open(csv_path, 'w', encoding='utf8') as csv_file:
+                csv_file.write('KEY,name,order_pos,ratio\n'
+                               'k0,0,1,1\n'
+                               'k1,1,2,2\n'
+                               'k2,2,3,2.5\n'
+                               'k3,abc,4,3\n')
+            with open(csv_path, 'r', encoding='utf8') as csv_file:
+                expected = pandas.read_csv(csv_file, na_filter=False).to_dict(orient='records')
+
+            records = list(read_csv_records(csv_path, chunk_size=2, consistent_dtypes=True))
+            with patch.object(pandas, 'read_csv', wraps=pandas.read_csv) as mock_read_csv:
+                list(read_csv_records(csv_path, chunk_size=2))
+
+        # the file is only parsed again when asked for
+        self.assertEqual(mock_read_csv.call_count, 1)
+        self.assertEqual(records, expected)
+        self.assertEqual([record['name'] for record in records], ['0', '1', '2', 'abc'])
+        self.assertEqual([record['order_pos'] for record in records], [1, 2, 3, 4])
+        self.assertEqual([record['ratio'] for record in records], [1.0, 2.0, 2.5, 3.0])
+        self.assertIsInstance(records[0]['ratio'], float)
+
+    def test_read_csv_first_record(self) -> None:
+        record = read_csv_first_record(self._node_file)
+
+        self.assertEqual(record, {'KEY': 'presto://gold.test_schema1/test_table1/test_id1',
+                                  'name': 'test_id1',
+                                  'order_pos:UNQUOTED': 1,
+                                  'type': 'bigint',
+                                  'LABEL': 'Column'})
+
+
+if __name__ == '__main__':
+    unittest.main()
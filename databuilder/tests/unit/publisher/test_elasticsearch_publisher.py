@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
+import os
+import tempfile
 import unittest
 
 from mock import (
@@ -31,6 +33,7 @@ class TestElasticsearchPublisher(unittest.TestCase):
                        'publisher.elasticsearch.alias': self.test_es_alias,
                        'publisher.elasticsearch.doc_type': self.test_doc_type}
 
+        self.config_dict = config_dict
         self.conf = ConfigFactory.from_dict(config_dict)
 
     def test_publish_with_no_data(self) -> None:
@@ -117,3 +120,99 @@ class TestElasticsearchPublisher(unittest.TestCase):
                 {'actions': [{"add": {"index": self.test_es_new_index, "alias": self.test_es_alias}},
                              {"remove_index": {"index": 'test_old_index'}}]}
             )
+
+    def _init_streaming_publisher(self, mock_data: str) -> ElasticsearchPublisher:
+        conf = ConfigFactory.from_dict({**self.config_dict,
+                                        'publisher.elasticsearch.streaming': True,
+                                        'publisher.elasticsearch.batch_size': 2,
+                                        'publisher.elasticsearch.thread_count': 1,
+                                        'publisher.elasticsearch.initial_backoff': 0})
+        with patch('builtins.open', mock_open(read_data=mock_data)):
+            publisher = ElasticsearchPublisher()
+            publisher.init(conf=Scoped.get_scoped_conf(conf=conf, scope=publisher.get_scope()))
+        return publisher
+
+    def test_publish_streaming(self) -> None:
+        """
+        Test Publish functionality in streaming mode, with a document rejected once
+        """
+        mock_data = '{"key": "a"}\n{"key": "b"}\n\n{"key": "c"}\n'
+        self.mock_es_client.indices.get_alias.return_value = {'test_old_index': 'DOES_NOT_MATTER'}
+        self.mock_es_client.bulk.side_effect = [
+            {'errors': True, 'items': [{'index': {'status': 201}},
+                                       {'index': {'status': 429, 'error': {'type': 'rejected_execution'}}}]},
+            {'errors': False, 'items': [{'index': {'status': 201}}]},
+            {'errors': False, 'items': [{'index': {'status': 201}}]},
+        ]
+
+        publisher = self._init_streaming_publisher(mock_data)
+        publisher.publish()
+
+        action = json.dumps({'index': {'_index': self.test_es_new_index, '_type': self.test_doc_type}})
+        self.assertEqual([call[0][0] for call in self.mock_es_client.bulk.call_args_list],
+                         [f'{action}\n{{"key": "a"}}\n{action}\n{{"key": "b"}}\n',
+                          f'{action}\n{{"key": "b"}}\n',
+                          f'{action}\n{{"key": "c"}}\n'])
+
+        self.mock_es_client.indices.update_aliases.assert_called_once_with(
+            {'actions': [{"add": {"index": self.test_es_new_index, "alias": self.test_es_alias}},
+                         {"remove_index": {"index": 'test_old_index'}}]}
+        )
+
+    def test_publish_streaming_with_failed_documents(self) -> None:
+        """
+        Test Publish functionality in streaming mode fails before the alias swap when documents are not indexed
+        """
+        self.mock_es_client.bulk.return_value = {
+            'errors': True, 'items': [{'index': {'status': 400, 'error': {'type': 'mapper_parsing_exception'}}}]
+        }
+
+        publisher = self._init_streaming_publisher('{"key": "a"}\n')
+        with self.assertRaises(RuntimeError):
+            publisher.publish()
+
+        self.mock_es_client.indices.update_aliases.assert_not_called()
+
+    def test_publish_incremental(self) -> None:
+        """
+        Test Publish functionality in incremental mode: a full rebuild without manifest, then a delta update
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_path = os.path.join(tmp_dir, 'data.json')
+            conf = ConfigFactory.from_dict({**self.config_dict,
+                                            'publisher.elasticsearch.file_path': data_path,
+                                            'publisher.elasticsearch.incremental': True,
+                                            'publisher.elasticsearch.hash_manifest_path': f'{tmp_dir}/manifest.json',
+                                            'publisher.elasticsearch.thread_count': 1})
+            self.mock_es_client.bulk.return_value = {'errors': False, 'items': []}
+
+            def publish(data: str) -> None:
+                with open(data_path, 'w') as data_file:
+                    data_file.write(data)
+                publisher = ElasticsearchPublisher()
+                publisher.init(conf=Scoped.get_scoped_conf(conf=conf, scope=publisher.get_scope()))
+                publisher.publish()
+                publisher.file_handler.close()
+
+            self.mock_es_client.indices.get_alias.return_value = {}
+            publish('{"key": "a", "name": "a"}\n{"key": "b", "name": "b"}\n{"key": "c", "name": "c"}\n')
+
+            self.mock_es_client.indices.create.assert_called_once()
+            self.assertEqual(self.mock_es_client.bulk.call_args[0][0].count('"_id"'), 3)
+            self.mock_es_client.indices.update_aliases.assert_called_once_with(
+                {'actions': [{"add": {"index": self.test_es_new_index, "alias": self.test_es_alias}}]}
+            )
+
+            self.mock_es_client.reset_mock()
+            self.mock_es_client.indices.get_alias.return_value = {self.test_es_new_index: {}}
+            publish('{"key": "a", "name": "a"}\n{"key": "b", "name": "b2"}\n{"key": "d", "name": "d"}\n')
+
+            self.mock_es_client.indices.create.assert_not_called()
+            self.mock_es_client.indices.update_aliases.assert_not_called()
+            action = {'_index': self.test_es_new_index, '_type': self.test_doc_type}
+            index_b = json.dumps({'index': {**action, '_id': 'b'}})
+            index_d = json.dumps({'index': {**action, '_id': 'd'}})
+            delete_c = json.dumps({'delete': {**action, '_id': 'c'}})
+            self.mock_es_client.bulk.assert_called_once_with(
+                f'{index_b}\n{{"key": "b", "name": "b2"}}\n{index_d}\n{{"key": "d", "name": "d"}}\n{delete_c}\n'
+            )
@@ -8,6 +8,12 @@ from unittest.mock import MagicMock, patch
 
 from freezegun import freeze_time
 from pyhocon import ConfigFactory
+from sqlalchemy import (
+    BigInteger, Column, MetaData, String, Table, create_engine,
+)
+from sqlalchemy.dialects import (
+    mysql, postgresql, sqlite,
+)
 
 from databuilder.publisher import mysql_csv_publisher
 from databuilder.publisher.mysql_csv_publisher import MySQLCSVPublisher
@@ -58,6 +64,86 @@ class TestMySQLPublish(unittest.TestCase):
         # 3 record files
         self.assertEqual(3, mock_commit.call_count)
 
+    @freeze_time("2021-01-01 01:01:00")
+    def test_publisher_bulk_upsert(self) -> None:
+        mysql_csv_publisher.Base = Base
+
+        conf = ConfigFactory.from_dict({MySQLCSVPublisher.CONN_STRING: 'sqlite://',
+                                        MySQLCSVPublisher.BULK_UPSERT_CHUNK_SIZE: 1,
+                                        MySQLCSVPublisher.JOB_PUBLISH_TAG: 'test_2'}).with_fallback(self.conf)
+
+        publisher = MySQLCSVPublisher()
+        publisher.init(conf)
+        Base.metadata.create_all(publisher._engine)
+        publisher._engine.execute("INSERT INTO actor VALUES ('actor://Meg Ryan', 'Meg', 'test_1', 0)")
+
+        publisher.publish()
+
+        self.assertEqual(publisher._engine.execute('SELECT * FROM actor ORDER BY rk').fetchall(),
+                         [('actor://Meg Ryan', 'Meg Ryan', 'test_2', 1609462860000),
+                          ('actor://Tom Cruise', 'Tom Cruise', 'test_2', 1609462860000)])
+        self.assertEqual(publisher._engine.execute('SELECT COUNT(*) FROM movie_actor').scalar(), 2)
+        self.assertEqual(publisher._count, 5)
+
+    @patch.object(mysql_csv_publisher, 'sessionmaker')
+    @patch.object(mysql_csv_publisher, 'create_engine')
+    def test_publisher_bulk_upsert_unsupported_dialect(self, mock_create_engine: Any, mock_session_maker: Any) -> None:
+        mock_create_engine.return_value.dialect.name = 'mssql'
+        mock_session = mock_session_maker.return_value.return_value
+
+        mysql_csv_publisher.Base = Base
+
+        conf = ConfigFactory.from_dict({MySQLCSVPublisher.BULK_UPSERT_CHUNK_SIZE: 100}).with_fallback(self.conf)
+        publisher = MySQLCSVPublisher()
+        publisher.init(conf)
+        publisher.publish()
+
+        # records are merged one by one
+        self.assertEqual(5, mock_session.merge.call_count)
+        mock_session.execute.assert_not_called()
+
+    def test_create_upsert_statement(self) -> None:
+        publisher = MySQLCSVPublisher()
+        publisher._publish_tag = 'test'
+        table = Base.metadata.tables['actor']
+        records = [{'rk': 'actor://Tom Cruise', 'name': 'Tom Cruise'}, {'rk': 'actor://Meg Ryan', 'name': 'Meg Ryan'}]
+
+        publisher._engine = MagicMock(dialect=mysql.dialect())
+        stmt, params = publisher._create_upsert_statement(table, records)
+        sql = str(stmt.compile(dialect=publisher._engine.dialect))
+        self.assertIsNone(params)
+        self.assertIn('VALUES (%s, %s, %s, %s), (%s, %s, %s, %s) ON DUPLICATE KEY UPDATE name = VALUES(name)', sql)
+
+        publisher._engine = MagicMock(dialect=postgresql.dialect())
+        stmt, params = publisher._create_upsert_statement(table, records)
+        sql = str(stmt.compile(dialect=publisher._engine.dialect))
+        self.assertIn('ON CONFLICT (rk) DO UPDATE SET name = excluded.name', sql)
+
+        publisher._engine = MagicMock(dialect=sqlite.dialect())
+        stmt, params = publisher._create_upsert_statement(table, records)
+        sql = str(stmt.compile(dialect=publisher._engine.dialect))
+        self.assertIsNone(params)
+        self.assertIn('VALUES (?, ?, ?, ?), (?, ?, ?, ?) ON CONFLICT (rk) DO UPDATE SET name = excluded.name', sql)
+
+    def test_sqlite_upsert_keeps_other_columns(self) -> None:
+        publisher = MySQLCSVPublisher()
+        publisher._publish_tag = 'test'
+        publisher._engine = create_engine('sqlite://')
+        table = Table('actor', MetaData(), Column('rk', String(128), primary_key=True), Column('name', String(128)),
+                      Column('extra', String(128)), Column('published_tag', String(128)),
+                      Column('publisher_last_updated_epoch_ms', BigInteger))
+        table.create(publisher._engine)
+        publisher._engine.execute("INSERT INTO actor VALUES ('actor://Meg Ryan', 'Meg', 'kept', 'test_1', 0)")
+
+        stmt, params = publisher._create_upsert_statement(table, [{'rk': 'actor://Meg Ryan', 'name': 'Meg Ryan'},
+                                                                  {'rk': 'actor://Tom Cruise', 'name': 'Tom Cruise'}])
+        self.assertIsNone(params)
+        publisher._engine.execute(stmt)
+
+        # the existing row is updated, not replaced
+        self.assertEqual(publisher._engine.execute('SELECT rk, name, extra FROM actor ORDER BY rk').fetchall(),
+                         [('actor://Meg Ryan', 'Meg Ryan', 'kept'), ('actor://Tom Cruise', 'Tom Cruise', None)])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,11 +3,13 @@
 
 import logging
 import os
+import tempfile
 import unittest
 import uuid
 
 from mock import MagicMock, patch
 from neo4j import GraphDatabase
+from neo4j.exceptions import TransientError
 from pyhocon import ConfigFactory
 
 from databuilder.publisher import neo4j_csv_publisher
@@ -53,6 +55,113 @@ class TestPublish(unittest.TestCase):
             # 2 node files, 1 relation file
             self.assertEqual(mock_commit.call_count, 1)
 
+    def test_publisher_unwind_batch(self) -> None:
+        with patch.object(GraphDatabase, 'driver') as mock_driver:
+            mock_session = MagicMock()
+            mock_driver.return_value.session.return_value = mock_session
+
+            mock_transaction = MagicMock()
+            mock_session.begin_transaction.return_value = mock_transaction
+
+            mock_run = MagicMock()
+            mock_transaction.run = mock_run
+            mock_commit = MagicMock()
+            mock_transaction.commit = mock_commit
+
+            publisher = Neo4jCsvPublisher()
+
+            conf = ConfigFactory.from_dict(
+                {neo4j_csv_publisher.NEO4J_END_POINT_KEY: 'dummy://999.999.999.999:7687/',
+                 neo4j_csv_publisher.NODE_FILES_DIR: f'{self._resource_path}/nodes',
+                 neo4j_csv_publisher.RELATION_FILES_DIR: f'{self._resource_path}/relations',
+                 neo4j_csv_publisher.NEO4J_USER: 'neo4j_user',
+                 neo4j_csv_publisher.NEO4J_PASSWORD: 'neo4j_password',
+                 neo4j_csv_publisher.NEO4J_UNWIND_BATCH_SIZE: 100,
+                 neo4j_csv_publisher.NEO4J_TRANSACTION_SIZE: 3,
+                 neo4j_csv_publisher.JOB_PUBLISH_TAG: str(uuid.uuid4())}
+            )
+            publisher.init(conf)
+            publisher.publish()
+
+            # 2 node files, 1 relation file, each published with a single UNWIND statement
+            self.assertEqual(mock_run.call_count, 3)
+            for call in mock_run.call_args_list:
+                self.assertIn(b'UNWIND $batch AS row', call[0][0])
+                self.assertEqual(len(call[1]['parameters']['batch']), 2)
+
+            # transaction size counts rows: 6 rows with transaction size 3, plus the final commit
+            self.assertEqual(mock_commit.call_count, 3)
+
+    def test_publisher_concurrent(self) -> None:
+        with patch.object(GraphDatabase, 'driver') as mock_driver, \
+                patch.object(neo4j_csv_publisher, 'SLEEP_TIME', 0):
+            mock_session = MagicMock()
+            mock_driver.return_value.session.return_value = mock_session
+
+            mock_transaction = MagicMock()
+            mock_session.begin_transaction.return_value = mock_transaction
+
+            # first relation statement fails with a deadlock, the relation file is published again
+            mock_run = MagicMock(side_effect=[None] * 4 + [TransientError('deadlock')] + [None] * 2)
+            mock_transaction.run = mock_run
+            mock_commit = MagicMock()
+            mock_transaction.commit = mock_commit
+
+            publisher = Neo4jCsvPublisher()
+
+            conf = ConfigFactory.from_dict(
+                {neo4j_csv_publisher.NEO4J_END_POINT_KEY: 'dummy://999.999.999.999:7687/',
+                 neo4j_csv_publisher.NODE_FILES_DIR: f'{self._resource_path}/nodes',
+                 neo4j_csv_publisher.RELATION_FILES_DIR: f'{self._resource_path}/relations',
+                 neo4j_csv_publisher.NEO4J_USER: 'neo4j_user',
+                 neo4j_csv_publisher.NEO4J_PASSWORD: 'neo4j_password',
+                 neo4j_csv_publisher.NEO4J_PUBLISH_WORKERS: 2,
+                 neo4j_csv_publisher.JOB_PUBLISH_TAG: str(uuid.uuid4())}
+            )
+            publisher.init(conf)
+            publisher.publish()
+
+            self.assertEqual(mock_run.call_count, 7)
+
+            # each file is committed on its own
+            self.assertEqual(mock_commit.call_count, 3)
+            self.assertEqual(publisher._count, 6)
+
+    def test_group_relation_files(self) -> None:
+        publisher = Neo4jCsvPublisher()
+        publisher.deadlock_node_labels = {'Badge', 'Tag'}
+
+        with tempfile.TemporaryDirectory() as relation_dir:
+            relation_files = []
+            for start_label, end_label in [('Table', 'Badge'), ('Table', 'Column'), ('Column', 'Tag'),
+                                           ('Column', 'Badge'), ('Table', 'Tag')]:
+                relation_file = os.path.join(relation_dir, f'{start_label}_{end_label}.csv')
+                with open(relation_file, 'w') as relation_csv:
+                    relation_csv.write('START_LABEL,START_KEY,END_LABEL,END_KEY,TYPE,REVERSE_TYPE\n')
+                    relation_csv.write(f'{start_label},key1,{end_label},key2,TYPE,REVERSE_TYPE\n')
+                relation_files.append(relation_file)
+
+            groups = publisher._group_relation_files(relation_files)
+
+        self.assertEqual([[os.path.basename(f) for f in group] for group in groups],
+                         [['Table_Column.csv'],
+                          ['Table_Badge.csv', 'Column_Badge.csv'],
+                          ['Column_Tag.csv', 'Table_Tag.csv']])
+
+    def test_create_node_unwind_statement(self) -> None:
+        publisher = Neo4jCsvPublisher()
+        publisher.publish_tag = 'test_tag'
+        publisher.create_only_nodes = {'Column'}
+
+        stmt = publisher.create_node_unwind_statement({'KEY': 'key1',
+                                                       'LABEL': 'Column',
+                                                       'name': 'col1',
+                                                       'order_pos:UNQUOTED': 1})
+
+        self.assertIn('MERGE (node:Column {key: row.KEY})', stmt)
+        self.assertIn("node.name = row.name, node.order_pos = row.order_pos, node.published_tag = 'test_tag'", stmt)
+        self.assertNotIn('ON MATCH SET', stmt)
+
     def test_preprocessor(self) -> None:
         with patch.object(GraphDatabase, 'driver') as mock_driver:
             mock_session = MagicMock()
@@ -89,6 +198,54 @@ class TestPublish(unittest.TestCase):
             # 2 node files, 1 relation file
             self.assertEqual(mock_commit.call_count, 1)
 
+    def test_statement_cache(self) -> None:
+        publisher = Neo4jCsvPublisher()
+        publisher.publish_tag = 'test_tag'
+        publisher.create_only_nodes = set()
+
+        stmt = publisher.create_node_merge_statement({'KEY': 'key1', 'LABEL': 'Table', 'name': 'table1'})
+        self.assertIs(publisher.create_node_merge_statement({'KEY': 'key2', 'LABEL': 'Table', 'name': 'table2'}),
+                      stmt)
+        self.assertIn('node.name = $name', stmt)
+
+        # A different column set, label or statement kind renders a new statement
+        self.assertNotIn('node.name',
+                         publisher.create_node_merge_statement({'KEY': 'key3', 'LABEL': 'Table'}))
+        self.assertIn('MERGE (node:Column',
+                      publisher.create_node_merge_statement({'KEY': 'key4', 'LABEL': 'Column', 'name': 'col'}))
+        self.assertIn('UNWIND',
+                      publisher.create_node_unwind_statement({'KEY': 'key1', 'LABEL': 'Table', 'name': 'table1'}))
+
+        rel_record = {'START_LABEL': 'Table', 'START_KEY': 'key1', 'END_LABEL': 'Column', 'END_KEY': 'key4',
+                      'TYPE': 'COLUMN', 'REVERSE_TYPE': 'COLUMN_OF'}
+        stmt = publisher.create_relationship_merge_statement(rel_record)
+        self.assertIs(publisher.create_relationship_merge_statement(dict(rel_record, END_KEY='key5')), stmt)
+        self.assertIn('MERGE (n1)-[r1:COLUMN]->(n2)-[r2:COLUMN_OF]->(n1)', stmt)
+        self.assertEqual(len(publisher._statement_cache), 5)
+
+        # A publisher re-initialized with another publish tag stamps the new one
+        publisher.publish_tag = 'new_tag'
+        self.assertIn("node.published_tag = 'new_tag'",
+                      publisher.create_node_merge_statement({'KEY': 'key1', 'LABEL': 'Table', 'name': 'table1'}))
+        self.assertIn("r1.published_tag = 'new_tag'", publisher.create_relationship_merge_statement(rel_record))
+
+    def test_statement_cache_is_reset_by_init(self) -> None:
+        with patch.object(GraphDatabase, 'driver'):
+            publisher = Neo4jCsvPublisher()
+            publisher._statement_cache[('stale',)] = 'stale statement'
+
+            conf = ConfigFactory.from_dict(
+                {neo4j_csv_publisher.NEO4J_END_POINT_KEY: 'dummy://999.999.999.999:7687/',
+                 neo4j_csv_publisher.NODE_FILES_DIR: f'{self._resource_path}/nodes',
+                 neo4j_csv_publisher.RELATION_FILES_DIR: f'{self._resource_path}/relations',
+                 neo4j_csv_publisher.NEO4J_USER: 'neo4j_user',
+                 neo4j_csv_publisher.NEO4J_PASSWORD: 'neo4j_password',
+                 neo4j_csv_publisher.JOB_PUBLISH_TAG: str(uuid.uuid4())}
+            )
+            publisher.init(conf)
+
+        self.assertEqual(publisher._statement_cache, {})
+
 
 if __name__ == '__main__':
     unittest.main()
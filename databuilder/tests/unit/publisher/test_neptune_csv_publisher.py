@@ -0,0 +1,138 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from typing import Any, Dict
+from unittest.mock import patch
+
+import boto3
+from moto import mock_s3
+from pyhocon import ConfigFactory
+
+from databuilder.publisher import neptune_csv_publisher
+from databuilder.publisher.neptune_csv_publisher import NeptuneCSVPublisher
+
+here = os.path.dirname(__file__)
+
+BUCKET_NAME = 'test-bucket'
+
+
+# botocore >= 1.36 adds checksum trailers to uploaded parts, which moto < 5 stores as part of their content
+@patch.dict(os.environ, {'AWS_REQUEST_CHECKSUM_CALCULATION': 'when_required'})
+@mock_s3
+@patch.object(neptune_csv_publisher.time, 'sleep')
+@patch.object(neptune_csv_publisher, 'NeptuneBulkLoaderApi')
+class TestNeptuneCSVPublisher(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        # files are copied so that tests can add or change some
+        self._files_dir = os.path.join(self._tmp_dir.name, 'csv_publisher')
+        shutil.copytree(os.path.join(here, '../resources/csv_publisher'), self._files_dir)
+        self._manifest_path = os.path.join(self._tmp_dir.name, 'manifest.json')
+        self.conf = ConfigFactory.from_dict({
+            NeptuneCSVPublisher.NODE_FILES_DIR: f'{self._files_dir}/nodes',
+            NeptuneCSVPublisher.RELATION_FILES_DIR: f'{self._files_dir}/relations',
+            NeptuneCSVPublisher.AWS_S3_BUCKET_NAME: BUCKET_NAME,
+            NeptuneCSVPublisher.AWS_BASE_S3_DATA_PATH: 'amundsen',
+            NeptuneCSVPublisher.AWS_REGION: 'us-east-1',
+            NeptuneCSVPublisher.AWS_ACCESS_KEY: 'testing',
+            NeptuneCSVPublisher.AWS_SECRET_ACCESS_KEY: 'testing',
+            NeptuneCSVPublisher.NEPTUNE_HOST: 'neptune:8182',
+            NeptuneCSVPublisher.UPLOAD_CONCURRENCY: 2,
+            NeptuneCSVPublisher.MULTIPART_THRESHOLD_MB: 1,
+            NeptuneCSVPublisher.UPLOAD_MANIFEST_PATH: self._manifest_path,
+        })
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+
+    def _s3_client(self) -> Any:
+        return boto3.client('s3', region_name='us-east-1', aws_access_key_id='testing',
+                            aws_secret_access_key='testing')
+
+    def _create_bucket(self) -> Any:
+        s3_client = self._s3_client()
+        s3_client.create_bucket(Bucket=BUCKET_NAME)
+        return s3_client
+
+    def _list_objects(self, s3_client: Any) -> Dict[str, Dict[str, Any]]:
+        response = s3_client.list_objects_v2(Bucket=BUCKET_NAME)
+        return {s3_object['Key']: s3_object for s3_object in response.get('Contents', [])}
+
+    def _publish(self, mock_api: Any, load_statuses: list) -> None:
+        mock_api.return_value.load.return_value = {'payload': {'loadId': 'load_1'}}
+        mock_api.return_value.load_status.side_effect = [
+            {'payload': {'overallStatus': {'status': status}}} for status in load_statuses
+        ]
+
+        publisher = NeptuneCSVPublisher()
+        publisher.init(self.conf)
+        publisher.publish()
+
+    def test_publish(self, mock_api: Any, mock_sleep: Any) -> None:
+        s3_client = self._create_bucket()
+
+        self._publish(mock_api, ['LOAD_IN_PROGRESS', 'LOAD_IN_PROGRESS', 'LOAD_IN_PROGRESS', 'LOAD_COMPLETED'])
+
+        s3_folder_location = mock_api.return_value.load.call_args[1]['s3_object_key']
+        self.assertEqual(sorted(self._list_objects(s3_client)), [
+            f'{s3_folder_location}/test_column.csv',
+            f'{s3_folder_location}/test_edge_short.csv',
+            f'{s3_folder_location}/test_table.csv',
+        ])
+        with open(f'{self._files_dir}/nodes/test_table.csv', 'rb') as table_file:
+            s3_object = s3_client.get_object(Bucket=BUCKET_NAME, Key=f'{s3_folder_location}/test_table.csv')
+            self.assertEqual(s3_object['Body'].read(), table_file.read())
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list], [5, 10, 20, 40])
+        # manifest is removed once the bulk load completed
+        self.assertFalse(os.path.exists(self._manifest_path))
+
+    def test_publish_multipart(self, mock_api: Any, mock_sleep: Any) -> None:
+        s3_client = self._create_bucket()
+        large_file_size = 2 * (2 ** 20) + 1
+        large_file_content = os.urandom(large_file_size)
+        with open(f'{self._files_dir}/nodes/test_large.csv', 'wb') as large_file:
+            large_file.write(large_file_content)
+
+        self._publish(mock_api, ['LOAD_COMPLETED'])
+
+        s3_objects = self._list_objects(s3_client)
+        s3_folder_location = mock_api.return_value.load.call_args[1]['s3_object_key']
+        large_object = s3_objects[f'{s3_folder_location}/test_large.csv']
+        self.assertEqual(large_object['Size'], large_file_size)
+        s3_object = s3_client.get_object(Bucket=BUCKET_NAME, Key=f'{s3_folder_location}/test_large.csv')
+        self.assertEqual(s3_object['Body'].read(), large_file_content)
+        # S3 suffixes the ETag of multipart uploads with their number of parts
+        self.assertIn('-', large_object['ETag'])
+        self.assertNotIn('-', s3_objects[f'{s3_folder_location}/test_table.csv']['ETag'])
+
+    def test_publish_resumes_from_manifest(self, mock_api: Any, mock_sleep: Any) -> None:
+        s3_client = self._create_bucket()
+        self._publish(mock_api, ['LOAD_FAILED'])
+
+        with open(self._manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+        self.assertEqual(len(manifest['uploaded_files']), 3)
+        self.assertEqual(len(self._list_objects(s3_client)), 3)
+
+        # a file changed since the failed job
+        with open(f'{self._files_dir}/nodes/test_table.csv', 'a') as table_file:
+            table_file.write('\n')
+        for s3_object_key in self._list_objects(s3_client):
+            s3_client.delete_object(Bucket=BUCKET_NAME, Key=s3_object_key)
+
+        self._publish(mock_api, ['LOAD_COMPLETED'])
+
+        # only the changed file is uploaded again, to the folder of the failed job
+        self.assertEqual(list(self._list_objects(s3_client)), [f"{manifest['s3_folder_location']}/test_table.csv"])
+        self.assertEqual(mock_api.return_value.load.call_args[1]['s3_object_key'], manifest['s3_folder_location'])
+        self.assertFalse(os.path.exists(self._manifest_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
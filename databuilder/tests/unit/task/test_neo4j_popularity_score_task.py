@@ -0,0 +1,90 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from typing import (
+    Any, Dict, List,
+)
+
+from mock import patch
+from neo4j import GraphDatabase
+from neo4j.exceptions import CypherError
+from pyhocon import ConfigFactory
+
+from databuilder.task import neo4j_popularity_score_task
+from databuilder.task.neo4j_popularity_score_task import Neo4jPopularityScoreTask
+
+
+class TestNeo4jPopularityScoreTask(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.task = Neo4jPopularityScoreTask()
+        scope = self.task.get_scope()
+        self.job_config = ConfigFactory.from_dict({
+            f'{scope}.{neo4j_popularity_score_task.NEO4J_END_POINT_KEY}': 'foobar',
+            f'{scope}.{neo4j_popularity_score_task.NEO4J_USER}': 'foo',
+            f'{scope}.{neo4j_popularity_score_task.NEO4J_PASSWORD}': 'bar',
+            f'{scope}.{neo4j_popularity_score_task.RESOURCE_TYPES}': ['Table'],
+            f'{scope}.{neo4j_popularity_score_task.USER_BATCH_SIZE}': 2,
+            f'{scope}.{neo4j_popularity_score_task.MINIMUM_READER_COUNT}': 3,
+        })
+
+    def test_run(self) -> None:
+        calls: List[Dict[str, Any]] = []
+
+        def execute_cypher_query(statement: str, param_dict: Dict[str, Any] = {}) -> List[Dict[str, Any]]:
+            calls.append({'statement': statement, 'param_dict': param_dict})
+            if 'RETURN DISTINCT u.key' in statement:
+                return [{'user_key': 'a'}, {'user_key': 'b'}, {'user_key': 'c'}]
+            if 'RETURN count(*)' in statement:
+                return [{'count': 1}]
+            return []
+
+        with patch.object(GraphDatabase, 'driver'), \
+                patch.object(Neo4jPopularityScoreTask, '_execute_cypher_query') as mock_execute:
+            mock_execute.side_effect = execute_cypher_query
+            self.task.init(self.job_config)
+            self.task.run()
+
+        statements = [call['statement'] for call in calls]
+        self.assertEqual(statements[0], 'CREATE INDEX ON :Table(popularity_score)')
+        self.assertEqual(statements[1], Neo4jPopularityScoreTask.set_global_scores_statement.format(type='Table'))
+        self.assertEqual(statements[2],
+                         Neo4jPopularityScoreTask.remove_stale_global_scores_statement.format(type='Table'))
+        self.assertEqual(statements[3], Neo4jPopularityScoreTask.get_readers_statement.format(type='Table'))
+        self.assertIn('SET u.popular_table_keys = resource_keys', statements[4])
+        self.assertIn('REMOVE u.popular_table_keys, u.popular_table_keys_run', statements[6])
+        self.assertEqual(len(statements), 7)
+
+        # users are scored in batches
+        self.assertEqual([calls[4]['param_dict']['user_keys'], calls[5]['param_dict']['user_keys']],
+                         [['a', 'b'], ['c']])
+        self.assertEqual(calls[4]['param_dict']['num_readers'], 3)
+        self.assertEqual(calls[4]['param_dict']['num_entries'], 50)
+
+        # scores not set by this run are stale
+        runs = {call['param_dict']['run'] for call in calls if 'run' in call['param_dict']}
+        self.assertEqual(len(runs), 1)
+
+    def test_run_with_existing_score_index(self) -> None:
+        def execute_cypher_query(statement: str, param_dict: Dict[str, Any] = {}) -> List[Dict[str, Any]]:
+            if statement.startswith('CREATE INDEX'):
+                raise CypherError('An equivalent index already exists, \'Index( 1, \'index_1\', ... )\'.')
+            return [{'count': 1}] if 'RETURN count(*)' in statement else []
+
+        with patch.object(GraphDatabase, 'driver'), \
+                patch.object(Neo4jPopularityScoreTask, '_execute_cypher_query') as mock_execute:
+            mock_execute.side_effect = execute_cypher_query
+            self.task.init(self.job_config)
+            self.task.run()
+
+            # the scores are still set
+            self.assertIn(Neo4jPopularityScoreTask.set_global_scores_statement.format(type='Table'),
+                          [call[0][0] for call in mock_execute.call_args_list])
+
+            mock_execute.side_effect = CypherError('Unable to create index')
+            self.assertRaises(CypherError, self.task.run)
+
+
+if __name__ == '__main__':
+    unittest.main()
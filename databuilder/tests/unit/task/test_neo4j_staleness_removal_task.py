@@ -10,6 +10,7 @@ import unittest
 
 from mock import patch
 from neo4j import GraphDatabase
+from neo4j.exceptions import TransientError
 from pyhocon import ConfigFactory
 
 from databuilder.publisher import neo4j_csv_publisher
@@ -453,6 +454,230 @@ class TestRemoveStaleData(unittest.TestCase):
 
             session_mock.assert_not_called()
 
+    def test_aggregated_validation(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jStalenessRemovalTask, '_execute_cypher_query') \
+                as mock_execute:
+            task = Neo4jStalenessRemovalTask()
+            job_config = ConfigFactory.from_dict({
+                f'job.identifier': 'remove_stale_data_job',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_END_POINT_KEY}': 'foobar',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_USER}': 'foo',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_PASSWORD}': 'bar',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.STALENESS_MAX_PCT}': 5,
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.TARGET_NODES}': ['Foo'],
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.TARGET_RELATIONS}': [TargetWithCondition('BAR', '(start_node:Foo)-[target]->(end_node:Foo)')],
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.AGGREGATED_VALIDATION}': True,
+                neo4j_csv_publisher.JOB_PUBLISH_TAG: 'foo',
+            })
+
+            task.init(job_config)
+            mock_execute.side_effect = [[{'target_index': 0, 'total_count': 100, 'stale_count': 1}],
+                                        [{'target_index': 0, 'total_count': 100, 'stale_count': 50}]]
+            with patch.object(Neo4jStalenessRemovalTask, '_validate_staleness_pct') as mock_validate:
+                task.validate()
+                mock_validate.assert_any_call(total_record_count=100,
+                                              stale_record_count=1,
+                                              target_type='Foo')
+                mock_validate.assert_any_call(total_record_count=100,
+                                              stale_record_count=50,
+                                              target_type='BAR')
+
+            self.assertEqual(mock_execute.call_count, 2)
+            mock_execute.assert_any_call(param_dict={'marker': u'foo'},
+                                         statement=textwrap.dedent("""
+            MATCH (target:Foo)
+            WHERE true
+            RETURN 0 as target_index, count(*) as total_count,
+            count(CASE WHEN (target.published_tag <> $marker
+            OR NOT EXISTS(target.published_tag)) THEN 1 END) as stale_count
+            """))
+            mock_execute.assert_any_call(param_dict={'marker': u'foo'},
+                                         statement=textwrap.dedent("""
+            MATCH (start_node)-[target:BAR]-(end_node)
+            WHERE true AND (start_node:Foo)-[target]->(end_node:Foo)
+            RETURN 0 as target_index, count(*) as total_count,
+            count(CASE WHEN (target.published_tag <> $marker
+            OR NOT EXISTS(target.published_tag)) THEN 1 END) as stale_count
+            """))
+
+    def test_aggregated_validation_statement_multiple_targets(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jStalenessRemovalTask, '_execute_cypher_query') \
+                as mock_execute:
+            task = Neo4jStalenessRemovalTask()
+            job_config = ConfigFactory.from_dict({
+                f'job.identifier': 'remove_stale_data_job',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_END_POINT_KEY}': 'foobar',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_USER}': 'foo',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_PASSWORD}': 'bar',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.STALENESS_MAX_PCT}': 5,
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.AGGREGATED_VALIDATION}': True,
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.MS_TO_EXPIRE}': 9876543210
+            })
+
+            task.init(job_config)
+            mock_execute.return_value = [{'target_index': 1, 'total_count': 100, 'stale_count': 50}]
+            statement = task._decorate_staleness(task.validate_node_staleness_aggregated_statement)
+            self.assertRaises(Exception, task._validate_aggregated_staleness_pct, statement, ['Foo', 'Bar'])
+
+            mock_execute.assert_called_once_with(param_dict={'marker': 9876543210},
+                                                 statement=textwrap.dedent("""
+            MATCH (target:Foo)
+            WHERE true
+            RETURN 0 as target_index, count(*) as total_count,
+            count(CASE WHEN (target.publisher_last_updated_epoch_ms < (timestamp() - $marker)
+            OR NOT EXISTS(target.publisher_last_updated_epoch_ms)) THEN 1 END) as stale_count
+            UNION ALL
+            MATCH (target:Bar)
+            WHERE true
+            RETURN 1 as target_index, count(*) as total_count,
+            count(CASE WHEN (target.publisher_last_updated_epoch_ms < (timestamp() - $marker)
+            OR NOT EXISTS(target.publisher_last_updated_epoch_ms)) THEN 1 END) as stale_count
+            """))
+
+    def test_delete_statement_in_transactions(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jStalenessRemovalTask, '_execute_cypher_query') \
+                as mock_execute:
+            mock_execute.return_value = [{'count': 10}]
+            task = Neo4jStalenessRemovalTask()
+            job_config = ConfigFactory.from_dict({
+                f'job.identifier': 'remove_stale_data_job',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_END_POINT_KEY}': 'foobar',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_USER}': 'foo',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_PASSWORD}': 'bar',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.STALENESS_MAX_PCT}': 5,
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.TARGET_NODES}': ['Foo'],
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.TARGET_RELATIONS}': ['BAR'],
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.DELETE_MODE}':
+                    neo4j_staleness_removal_task.IN_TRANSACTIONS_DELETE_MODE,
+                neo4j_csv_publisher.JOB_PUBLISH_TAG: 'foo',
+            })
+
+            task.init(job_config)
+            task._delete_stale_nodes()
+            task._delete_stale_relations()
+
+            # A single query per target
+            self.assertEqual(mock_execute.call_count, 2)
+            mock_execute.assert_any_call(dry_run=False,
+                                         param_dict={'marker': u'foo'},
+                                         statement=textwrap.dedent("""
+            MATCH (target:Foo)
+            WHERE (target.published_tag <> $marker
+            OR NOT EXISTS(target.published_tag))
+            CALL { WITH target DETACH DELETE target } IN TRANSACTIONS OF 100 ROWS
+            RETURN count(*) as count
+            """))
+            mock_execute.assert_any_call(dry_run=False,
+                                         param_dict={'marker': u'foo'},
+                                         statement=textwrap.dedent("""
+            MATCH (start_node)-[target:BAR]-(end_node)
+            WHERE (target.published_tag <> $marker
+            OR NOT EXISTS(target.published_tag))
+            WITH DISTINCT target
+            CALL { WITH target DELETE target } IN TRANSACTIONS OF 100 ROWS
+            RETURN count(*) as count
+            """))
+
+    def test_delete_apoc(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jStalenessRemovalTask, '_execute_cypher_query') \
+                as mock_execute:
+            mock_execute.return_value = [{'count': 10, 'failed_batches': 0, 'error_messages': {}}]
+            task = Neo4jStalenessRemovalTask()
+            job_config = ConfigFactory.from_dict({
+                f'job.identifier': 'remove_stale_data_job',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_END_POINT_KEY}': 'foobar',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_USER}': 'foo',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_PASSWORD}': 'bar',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.STALENESS_MAX_PCT}': 5,
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.TARGET_NODES}': [TargetWithCondition('Foo', 'target.name=\'foo_name\'')],
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.DELETE_MODE}':
+                    neo4j_staleness_removal_task.APOC_DELETE_MODE,
+                neo4j_csv_publisher.JOB_PUBLISH_TAG: 'foo',
+            })
+
+            task.init(job_config)
+            task._delete_stale_nodes()
+
+            mock_execute.assert_called_once_with(dry_run=False,
+                                                 param_dict={'marker': u'foo',
+                                                             'batch_size': 100,
+                                                             'action_statement': 'DETACH DELETE target',
+                                                             'iterate_statement': textwrap.dedent("""
+            MATCH (target:Foo)
+            WHERE (target.published_tag <> $marker
+            OR NOT EXISTS(target.published_tag)) AND target.name=\'foo_name\'
+            RETURN target
+            """)},
+                                                 statement=task.apoc_delete_statement)
+
+            mock_execute.return_value = [{'count': 10, 'failed_batches': 1, 'error_messages': {'error': 1}}]
+            self.assertRaises(Exception, task._delete_stale_nodes)
+
+    def test_delete_concurrently_with_metrics(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), \
+                patch.object(neo4j_staleness_removal_task, 'StatsClient') as mock_statsd_client, \
+                patch.object(Neo4jStalenessRemovalTask, '_execute_cypher_query') as mock_execute:
+            mock_execute.return_value = [{'count': 10}]
+            task = Neo4jStalenessRemovalTask()
+            job_config = ConfigFactory.from_dict({
+                f'job.identifier': 'remove_stale_data_job',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_END_POINT_KEY}': 'foobar',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_USER}': 'foo',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_PASSWORD}': 'bar',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.STALENESS_MAX_PCT}': 5,
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.TARGET_NODES}': ['Foo', 'Bar', 'Baz'],
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.DELETE_MODE}':
+                    neo4j_staleness_removal_task.IN_TRANSACTIONS_DELETE_MODE,
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.DELETE_CONCURRENCY}': 3,
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.IS_STATSD_ENABLED}': True,
+                neo4j_csv_publisher.JOB_PUBLISH_TAG: 'foo',
+            })
+
+            task.init(job_config)
+            task._delete_stale_nodes()
+
+            mock_statsd_client.assert_called_once_with(prefix='amundsen.databuilder.task.remove_stale_data')
+            statsd = mock_statsd_client.return_value
+            self.assertEqual(mock_execute.call_count, 3)
+            for target_type in ('Foo', 'Bar', 'Baz'):
+                statsd.incr.assert_any_call(f'{target_type}.deleted', 10)
+            self.assertEqual(sorted(call[0][0] for call in statsd.timing.call_args_list),
+                             ['Bar.delete_time', 'Baz.delete_time', 'Foo.delete_time'])
+
+    def test_delete_retries_transient_error(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), patch.object(neo4j_staleness_removal_task.time, 'sleep'), \
+                patch.object(Neo4jStalenessRemovalTask, '_execute_cypher_query') as mock_execute:
+            mock_execute.side_effect = [TransientError('deadlock'), [{'count': 10}]]
+            task = Neo4jStalenessRemovalTask()
+            job_config = ConfigFactory.from_dict({
+                f'job.identifier': 'remove_stale_data_job',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_END_POINT_KEY}': 'foobar',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_USER}': 'foo',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_PASSWORD}': 'bar',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.STALENESS_MAX_PCT}': 5,
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.TARGET_NODES}': ['Foo'],
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.DELETE_MODE}':
+                    neo4j_staleness_removal_task.IN_TRANSACTIONS_DELETE_MODE,
+                neo4j_csv_publisher.JOB_PUBLISH_TAG: 'foo',
+            })
+
+            task.init(job_config)
+            task._delete_stale_nodes()
+            self.assertEqual(mock_execute.call_count, 2)
+
+    def test_invalid_delete_mode(self) -> None:
+        with patch.object(GraphDatabase, 'driver'):
+            task = Neo4jStalenessRemovalTask()
+            job_config = ConfigFactory.from_dict({
+                f'job.identifier': 'remove_stale_data_job',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_END_POINT_KEY}': 'foobar',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_USER}': 'foo',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.NEO4J_PASSWORD}': 'bar',
+                f'{task.get_scope()}.{neo4j_staleness_removal_task.DELETE_MODE}': 'foo',
+                neo4j_csv_publisher.JOB_PUBLISH_TAG: 'foo',
+            })
+            self.assertRaises(Exception, task.init, job_config)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,109 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+This is a load test comparing the throughput per core of the metadata service served as a WSGI app by gunicorn
+(metadata_service.metadata_wsgi, one thread per request) with the ASGI app served by uvicorn
+(metadata_service.metadata_asgi, requests run on ASGI_MAX_WORKERS threads).
+
+Each server is started with the config of METADATA_SVC_CONFIG_MODULE_CLASS, pinned to num_cores cores with taskset
+when available, and loaded with num_connections keep-alive connections requesting path for duration_sec seconds.
+Requires the asgi extra and gunicorn, and the backend of the config to be running:
+
+    python benchmark_asgi.py [path] [num_connections] [duration_sec] [num_cores] [num_threads]
+"""
+
+import http.client
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+path = sys.argv[1] if len(sys.argv) > 1 else '/healthcheck'
+num_connections = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+duration_sec = float(sys.argv[3]) if len(sys.argv) > 3 else 30
+num_cores = int(sys.argv[4]) if len(sys.argv) > 4 else 1
+# threads per gunicorn worker and ASGI_MAX_WORKERS of every uvicorn worker
+num_threads = int(sys.argv[5]) if len(sys.argv) > 5 else 32
+
+host = '127.0.0.1'
+port = 5002
+
+SERVERS = {
+    'wsgi': ['gunicorn', '--bind', f'{host}:{port}', '--workers', str(num_cores), '--threads', str(num_threads),
+             'metadata_service.metadata_wsgi'],
+    'asgi': ['uvicorn', '--host', host, '--port', str(port), '--workers', str(num_cores), '--no-access-log',
+             'metadata_service.metadata_asgi:application'],
+}
+
+
+def start_server(mode: str) -> subprocess.Popen:
+    command = SERVERS[mode]
+    if shutil.which('taskset'):
+        command = ['taskset', '--cpu-list', f'0-{num_cores - 1}'] + command
+
+    server = subprocess.Popen(command, env=dict(os.environ, ASGI_MAX_WORKERS=str(num_threads)),
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection(host, port, timeout=1)
+            connection.request('GET', path)
+            connection.getresponse().read()
+            return server
+        except OSError:
+            time.sleep(0.5)
+
+    server.kill()
+    raise RuntimeError(f'{mode} server did not start')
+
+
+def run_connection(end: float) -> Tuple[List[float], int]:
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    latencies: List[float] = []
+    errors = 0
+
+    while time.monotonic() < end:
+        start = time.perf_counter()
+        try:
+            connection.request('GET', path)
+            response = connection.getresponse()
+            response.read()
+            if response.status >= 500:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=30)
+        latencies.append(time.perf_counter() - start)
+
+    connection.close()
+    return latencies, errors
+
+
+def run(mode: str) -> None:
+    server = start_server(mode)
+    try:
+        end = time.monotonic() + duration_sec
+        with ThreadPoolExecutor(max_workers=num_connections) as executor:
+            results = list(executor.map(run_connection, [end] * num_connections))
+    finally:
+        server.terminate()
+        server.wait()
+
+    latencies = sorted(latency for connection_latencies, _ in results for latency in connection_latencies)
+    errors = sum(connection_errors for _, connection_errors in results)
+    throughput = len(latencies) / duration_sec
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f'{mode}: {throughput:.0f} requests/sec, {throughput / num_cores:.0f} requests/sec/core, '
+          f'p50 {statistics.median(latencies) * 1000:.1f}ms, p99 {p99 * 1000:.1f}ms, {errors} errors')
+
+
+if __name__ == '__main__':
+    for server_mode in SERVERS:
+        run(server_mode)
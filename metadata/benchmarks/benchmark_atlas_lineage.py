@@ -0,0 +1,74 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+This is a benchmark script measuring how long AtlasProxy takes to serialize the lineage Atlas returns for a table,
+on a synthetic DAG of Process connected tables (every table of a layer reads every table of the previous layer it is
+close to), without an Atlas server:
+
+    python benchmark_atlas_lineage.py [num_layers] [tables_per_layer] [fan_in]
+"""
+
+import sys
+import time
+from typing import Any, Dict
+
+from amundsen_common.utils.atlas import AtlasTableKey
+
+from metadata_service import create_app
+
+num_layers = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+tables_per_layer = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+fan_in = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+
+def table_guid(layer: int, index: int) -> str:
+    return f't{layer}_{index}'
+
+
+def synthetic_lineage() -> Dict[str, Any]:
+    """
+    Lineage in the format of Atlas lineage API responses, upstream of the single table of layer 0
+    """
+    entities: Dict[str, Dict[str, Any]] = {
+        table_guid(0, 0): {'typeName': 'hive_table', 'attributes': {'qualifiedName': 'sample.table_0_0@demo'}}
+    }
+    relations = []
+
+    for layer in range(1, num_layers + 1):
+        for index in range(tables_per_layer):
+            guid = table_guid(layer, index)
+            entities[guid] = {'typeName': 'hive_table',
+                              'attributes': {'qualifiedName': f'sample.table_{layer}_{index}@demo'}}
+
+    for layer in range(num_layers):
+        outputs = range(tables_per_layer) if layer else range(1)
+        for output in outputs:
+            process_guid = f'p{layer}_{output}'
+            entities[process_guid] = {'typeName': 'spark_process'}
+            relations.append({'fromEntityId': process_guid, 'toEntityId': table_guid(layer, output)})
+
+            for offset in range(fan_in):
+                input_guid = table_guid(layer + 1, (output + offset) % tables_per_layer)
+                relations.append({'fromEntityId': input_guid, 'toEntityId': process_guid})
+
+    return {'guidEntityMap': entities, 'relations': relations}
+
+
+if __name__ == '__main__':
+    with create_app(config_module_class='metadata_service.config.LocalConfig').app_context():
+        # AtlasProxy reads the config when imported
+        from metadata_service.proxy.atlas_proxy import AtlasProxy
+
+    lineage = synthetic_lineage()
+    # _serialize_lineage doesn't use the Atlas client
+    proxy = AtlasProxy.__new__(AtlasProxy)
+
+    start = time.perf_counter()
+    items = proxy._serialize_lineage(lineage, 'Table', 'hive_table://demo.sample/table_0_0', 'upstream',
+                                     AtlasTableKey)
+    elapsed = time.perf_counter() - start
+
+    num_tables = num_layers * tables_per_layer + 1
+    print(f'{num_tables} tables, {len(items)} lineage items, max level {max(item.level for item in items)}: '
+          f'{elapsed * 1000:.1f}ms')
@@ -0,0 +1,52 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+This is a benchmark script comparing query latencies of GenericGremlinProxy when every query creates (and closes) its
+own Client, as the proxy used to do, with the long lived clients of GremlinClientPool.
+
+It runs a trivial traversal from several threads against a running Gremlin Server, e.g.
+`docker run -p 8182:8182 tinkerpop/gremlin-server:3.4.13`:
+
+    python benchmark_gremlin_client_pool.py [gremlin_url] [num_queries] [num_threads]
+"""
+
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from metadata_service.proxy.gremlin_proxy import (FromResultSet,
+                                                  GenericGremlinProxy)
+
+gremlin_url = sys.argv[1] if len(sys.argv) > 1 else 'ws://localhost:8182/gremlin'
+num_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+num_threads = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+
+
+def run_query(proxy: GenericGremlinProxy) -> float:
+    start = time.perf_counter()
+    proxy.query_executor()(query=proxy.g.V().limit(1).count(), get=FromResultSet.toList)
+    return time.perf_counter() - start
+
+
+def run(label: str, proxy: GenericGremlinProxy) -> None:
+    # warm up
+    run_query(proxy)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        latencies: List[float] = sorted(executor.map(lambda _: run_query(proxy), range(num_queries)))
+    elapsed = time.perf_counter() - start
+
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f'{label:>18}: {num_queries / elapsed:.0f} queries/sec, p50 {statistics.median(latencies) * 1000:.1f}ms, '
+          f'p99 {p99 * 1000:.1f}ms')
+
+
+if __name__ == '__main__':
+    # a pool that keeps no client creates and closes one per query
+    run('client per query', GenericGremlinProxy(host=gremlin_url, client_kwargs={'client_pool_options': {'size': 0}}))
+    run(f'pool({num_threads})',
+        GenericGremlinProxy(host=gremlin_url, client_kwargs={'client_pool_options': {'size': num_threads}}))
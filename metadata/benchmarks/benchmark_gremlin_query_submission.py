@@ -0,0 +1,46 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+This is a benchmark script comparing query latencies (p50/p99) of GenericGremlinProxy for each query_submission:
+scripts with every value inlined, parameterized scripts with bindings, and bytecode.
+
+Each query looks a table up by a different key, like get_table does, so an inlined script is new to the server every
+time while the parameterized one hits its compiled script cache. It needs a running Gremlin Server, e.g.
+`docker run -p 8182:8182 tinkerpop/gremlin-server:3.4.13`:
+
+    python benchmark_gremlin_query_submission.py [gremlin_url] [num_queries]
+"""
+
+import statistics
+import sys
+import time
+from typing import List
+
+from metadata_service.proxy.gremlin_proxy import (QUERY_SUBMISSIONS,
+                                                  FromResultSet,
+                                                  GenericGremlinProxy)
+
+gremlin_url = sys.argv[1] if len(sys.argv) > 1 else 'ws://localhost:8182/gremlin'
+num_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+
+def run(query_submission: str, offset: int) -> None:
+    proxy = GenericGremlinProxy(host=gremlin_url, client_kwargs={'query_submission': query_submission})
+    latencies: List[float] = []
+    for i in range(offset, offset + num_queries):
+        query = proxy.g.V().has('Table', 'key', f'hive://gold.bench_schema/table_{i}'). \
+            outE('COLUMN').inV().hasLabel('Column').valueMap(True)
+        start = time.perf_counter()
+        proxy.query_executor()(query=query, get=FromResultSet.toList)
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f'{query_submission:>20}: p50 {statistics.median(latencies) * 1000:.2f}ms, p99 {p99 * 1000:.2f}ms')
+
+
+if __name__ == '__main__':
+    for index, query_submission in enumerate(QUERY_SUBMISSIONS):
+        # keys differ between runs so that no run benefits from scripts compiled by a previous one
+        run(query_submission, index * num_queries)
@@ -33,10 +33,10 @@ from metadata_service.api.healthcheck import HealthcheckAPI
 from metadata_service.api.popular_resources import PopularResourcesAPI
 from metadata_service.api.popular_tables import PopularTablesAPI
 from metadata_service.api.system import Neo4jDetailAPI, StatisticsMetricsAPI
-from metadata_service.api.table import (TableBadgeAPI, TableDashboardAPI,
-                                        TableDescriptionAPI, TableDetailAPI,
-                                        TableLineageAPI, TableOwnerAPI,
-                                        TableTagAPI)
+from metadata_service.api.table import (TableBadgeAPI, TableBatchAPI,
+                                        TableDashboardAPI, TableDescriptionAPI,
+                                        TableDetailAPI, TableLineageAPI,
+                                        TableOwnerAPI, TableTagAPI)
 from metadata_service.api.tag import TagAPI
 from metadata_service.api.user import (UserDetailAPI, UserFollowAPI,
                                        UserFollowsAPI, UserOwnAPI, UserOwnsAPI,
@@ -116,6 +116,7 @@ def create_app(*, config_module_class: str) -> Flask:
                      '/popular_resources/',
                      '/popular_resources/<path:user_id>')
     api.add_resource(TableDetailAPI, '/table/<path:table_uri>')
+    api.add_resource(TableBatchAPI, '/tables')
     api.add_resource(TableDescriptionAPI,
                      '/table/<path:id>/description')
     api.add_resource(TableTagAPI,
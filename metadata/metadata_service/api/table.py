@@ -9,7 +9,7 @@ from amundsen_common.entity.resource_type import ResourceType
 from amundsen_common.models.lineage import LineageSchema
 from amundsen_common.models.table import TableSchema
 from flasgger import swag_from
-from flask import request
+from flask import current_app, request
 from flask_restful import Resource, reqparse
 
 from metadata_service.api import BaseAPI
@@ -39,6 +39,34 @@ class TableDetailAPI(Resource):
             return {'message': 'table_uri {} does not exist'.format(table_uri)}, HTTPStatus.NOT_FOUND
 
 
+class TableBatchAPI(Resource):
+    """
+    TableBatch API to get the details of many tables at once
+    """
+
+    def __init__(self) -> None:
+        self.client = get_proxy_client()
+
+    @swag_from('swagger_doc/table/batch_post.yml')
+    def post(self) -> Iterable[Union[Mapping, int, None]]:
+        try:
+            table_uris = json.loads(request.data).get('table_uris') if request.data else None
+        except (ValueError, AttributeError):
+            table_uris = None
+
+        if not isinstance(table_uris, list) or not all(isinstance(table_uri, str) for table_uri in table_uris):
+            return {'message': 'table_uris, a list of table URIs, is required'}, HTTPStatus.BAD_REQUEST
+
+        max_size = current_app.config['TABLE_BATCH_MAX_SIZE']
+        if len(table_uris) > max_size:
+            return {'message': f'At most {max_size} table URIs can be requested at once'}, HTTPStatus.BAD_REQUEST
+
+        tables, errors = self.client.get_tables(table_uris=list(dict.fromkeys(table_uris)))
+        schema = TableSchema()
+        return {'tables': {table_uri: schema.dump(table) for table_uri, table in tables.items()},
+                'errors': errors}, HTTPStatus.OK
+
+
 class TableLineageAPI(Resource):
     def __init__(self) -> None:
         self.client = get_proxy_client()
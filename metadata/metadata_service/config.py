@@ -28,6 +28,16 @@ PROXY_CLIENTS = {
     'MYSQL': 'metadata_service.proxy.mysql_proxy.MySQLProxy'
 }
 
+PROXY_CACHE = 'PROXY_CACHE'
+PROXY_CACHE_KWARGS = 'PROXY_CACHE_KWARGS'
+PROXY_CACHE_TTL_SEC = 'PROXY_CACHE_TTL_SEC'
+
+PROXY_CACHES = {
+    'LOCAL': 'metadata_service.proxy.cache.local_cache.LocalLRUCache',
+    'REDIS': 'metadata_service.proxy.cache.redis_cache.RedisCache',
+    'MEMCACHED': 'metadata_service.proxy.cache.memcached_cache.MemcachedCache'
+}
+
 PROXY_CLIS = {
     'MYSQL': 'metadata_service.cli.rds_command.rds_cli'
 }
@@ -79,6 +89,9 @@ class Config:
     # Number of minimum reader count to qualify for popular resources
     POPULAR_TABLE_MINIMUM_READER_COUNT = None
     POPULAR_RESOURCES_MINIMUM_READER_COUNT = 10  # type: int
+    # Whether popular resources are read from the scores precomputed by databuilder's Neo4jPopularityScoreTask instead
+    # of being computed from every READ_BY relation on request. Only supported by Neo4jProxy.
+    POPULAR_RESOURCES_PRECOMPUTED = False  # type: bool
 
     # List of regexes which will exclude certain parameters from appearing as Programmatic Descriptions
     PROGRAMMATIC_DESCRIPTIONS_EXCLUDE_FILTERS = []  # type: list
@@ -87,6 +100,21 @@ class Config:
     # or num of retries
     PROXY_CLIENT_KWARGS: Dict = dict()
 
+    # Maximum number of tables whose details can be requested at once with POST /tables
+    TABLE_BATCH_MAX_SIZE = 100
+
+    # Number of threads that run requests, and the proxy calls they make, when the app is served by the ASGI entry
+    # point metadata_service.metadata_asgi. The proxy's connection pool should allow as many connections.
+    ASGI_MAX_WORKERS = int(os.environ.get('ASGI_MAX_WORKERS', 32))
+
+    # Cache of proxy responses, one of PROXY_CACHES (e.g. PROXY_CACHES['REDIS']), or None to disable it.
+    # PROXY_CACHE_KWARGS are passed to it, e.g. {'url': 'redis://localhost:6379/0'} or {'max_size': 1024}
+    PROXY_CACHE = None  # type: Optional[str]
+    PROXY_CACHE_KWARGS: Dict = dict()
+    # TTL (in seconds) of every proxy read to cache, e.g. {'get_table': 300, 'get_popular_resources': 3600}.
+    # Reads without one are never cached.
+    PROXY_CACHE_TTL_SEC: Dict[str, int] = dict()
+
     # Initialize custom flask extensions and routes
     INIT_CUSTOM_EXT_AND_ROUTES = None  # type: Callable[[Flask], None]
 
@@ -0,0 +1,24 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+
+from a2wsgi import WSGIMiddleware
+
+from metadata_service import create_app
+
+'''
+  ASGI entry point, e.g: uvicorn metadata_service.metadata_asgi:application
+  Connections are served by the event loop, while requests run with the same routes as metadata_wsgi on a pool of
+  ASGI_MAX_WORKERS threads, since the proxies block on I/O.
+'''
+
+flask_app = create_app(
+    config_module_class=os.getenv('METADATA_SVC_CONFIG_MODULE_CLASS')
+    or 'metadata_service.config.LocalConfig')
+
+application = WSGIMiddleware(flask_app, workers=flask_app.config['ASGI_MAX_WORKERS'])
+
+if __name__ == '__main__':
+    import uvicorn
+    uvicorn.run(application, host='0.0.0.0', port=5002)
@@ -4,11 +4,11 @@
 import datetime
 import logging
 import re
-from collections import defaultdict
+from collections import defaultdict, deque
 from operator import attrgetter
 from random import randint
-from typing import (Any, Dict, Generator, List, Optional, Set, Tuple, Type,
-                    Union)
+from typing import (Any, Dict, Generator, Iterable, List, Mapping, Optional,
+                    Set, Tuple, Type, Union)
 
 from amundsen_common.entity.resource_type import ResourceType
 from amundsen_common.models.dashboard import DashboardSummary
@@ -351,11 +351,15 @@ class AtlasProxy(BaseProxy):
             )
         return sorted(columns, key=lambda item: item.sort_order)
 
-    def _get_reports(self, guids: List[str]) -> List[ResourceReport]:
+    def _get_reports(self, guids: List[str], related_entities: Optional[Dict[str, AtlasEntity]] = None) \
+            -> List[ResourceReport]:
         reports = []
         if guids:
-            report_entities = self.client.entity.get_entities_by_guids(guids=guids)
-            for report_entity in report_entities.entities:
+            if related_entities is None:
+                report_entities = self.client.entity.get_entities_by_guids(guids=guids).entities
+            else:
+                report_entities = [related_entities[guid] for guid in guids if guid in related_entities]
+            for report_entity in report_entities:
                 try:
                     if report_entity.status == AtlasStatus.ACTIVE:
                         report_attrs = report_entity.attributes
@@ -439,6 +443,83 @@ class AtlasProxy(BaseProxy):
         or gathered from different entities.
         """
         entity = self._get_table_entity(table_uri=table_uri)
+
+        return self._serialize_table(table_uri=table_uri, entity=entity)
+
+    def get_tables(self, *, table_uris: List[str]) -> Tuple[Dict[str, Table], Dict[str, str]]:
+        """
+        Gathers the information of get_table for several tables, fetching the table entities with one request per
+        entity type and the readers, applications and reports of all the tables with one request per chunk of guids.
+        :param table_uris:
+        :return: The tables found by table uri, and the error of every other table uri
+        """
+        entities = self._get_table_entities(table_uris=table_uris)
+
+        related_guids = list({guid for entity in entities.values() for guid in self._get_related_guids(entity.entity)})
+        related_entities: Dict[str, AtlasEntity] = {}
+        for chunk in AtlasProxy.split_list_to_chunks(related_guids, 100):
+            related = self.client.entity.get_entities_by_guids(guids=list(chunk), ignore_relationships=False)
+            for related_entity in related.entities or list():
+                related_entities[related_entity.guid] = related_entity
+
+        tables: Dict[str, Table] = {}
+        errors: Dict[str, str] = {}
+        for table_uri in table_uris:
+            if table_uri not in entities:
+                errors[table_uri] = f'Table URI( {table_uri} ) does not exist'
+                continue
+            try:
+                tables[table_uri] = self._serialize_table(table_uri=table_uri, entity=entities[table_uri],
+                                                          related_entities=related_entities)
+            except BadRequest as e:
+                errors[table_uri] = e.description
+
+        return tables, errors
+
+    def _get_table_entities(self, *, table_uris: List[str]) -> Dict[str, AtlasEntityWithExtInfo]:
+        """
+        Fetch the table entities matching the Qualified Names derived from table_uris, by table uri
+        """
+        uris_by_qualified_name: Dict[str, Dict[str, str]] = defaultdict(dict)
+        for table_uri in table_uris:
+            key = AtlasTableKey(table_uri)
+            uris_by_qualified_name[key.entity_type][key.qualified_name] = table_uri
+
+        entities: Dict[str, AtlasEntityWithExtInfo] = {}
+        for entity_type, table_uris_by_qn in uris_by_qualified_name.items():
+            try:
+                result = self.client.entity.get_entities_by_attribute(
+                    type_name=entity_type,
+                    uniq_attributes_list=[{AtlasCommonParams.qualified_name: qn} for qn in table_uris_by_qn])
+            except Exception as ex:
+                LOGGER.exception(f'Tables not found. {str(ex)}')
+                continue
+
+            for table_entity in result.entities or list():
+                qualified_name = table_entity[AtlasCommonParams.attributes].get(AtlasCommonParams.qualified_name)
+                if qualified_name in table_uris_by_qn:
+                    entities[table_uris_by_qn[qualified_name]] = AtlasEntityWithExtInfo(
+                        {'entity': table_entity, 'referredEntities': result.referredEntities})
+
+        return entities
+
+    def _get_related_guids(self, table_details: AtlasEntity) -> List[str]:
+        """
+        The guids of the entities get_table fetches for the readers, application and reports of a table.
+        """
+        relationships = table_details.get(AtlasCommonParams.relationships, dict())
+        related = self._filter_active(relationships.get('readers', list())) + \
+            self._filter_active(relationships.get('applications', list())) + \
+            (table_details.get(AtlasCommonParams.attributes, dict()).get('reports') or list())
+
+        return [entity.get(AtlasCommonParams.guid) for entity in related]
+
+    def _serialize_table(self, *, table_uri: str, entity: AtlasEntityWithExtInfo,
+                         related_entities: Optional[Dict[str, AtlasEntity]] = None) -> Table:
+        """
+        :param related_entities: The reader, application and report entities of the table by guid, fetched with
+        the client when not given
+        """
         table_details = entity.entity
 
         try:
@@ -458,8 +539,8 @@ class AtlasProxy(BaseProxy):
             table_type = attrs.get('tableType') or 'table'
             is_view = 'view' in table_type.lower()
 
-            readers = self._get_readers(table_details, Reader)
-            application = self._get_application(table_details)
+            readers = self._get_readers(table_details, Reader, related_entities=related_entities)
+            application = self._get_application(table_details, related_entities=related_entities)
 
             table = Table(
                 table_writer=application,
@@ -472,7 +553,7 @@ class AtlasProxy(BaseProxy):
                 description=attrs.get('description') or attrs.get('comment'),
                 owners=self._get_owners(
                     table_details[AtlasCommonParams.relationships].get('ownedBy', []), attrs.get('owner')),
-                resource_reports=self._get_reports(guids=reports_guids),
+                resource_reports=self._get_reports(guids=reports_guids, related_entities=related_entities),
                 columns=columns,
                 is_view=is_view,
                 table_readers=readers,
@@ -1111,8 +1192,8 @@ class AtlasProxy(BaseProxy):
         except Exception:
             return None
 
-    def _get_readers(self, entity: AtlasEntityWithExtInfo, model: Any = Reader, top: Optional[int] = 15) \
-            -> List[Union[Reader, User]]:
+    def _get_readers(self, entity: AtlasEntityWithExtInfo, model: Any = Reader, top: Optional[int] = 15,
+                     related_entities: Optional[Dict[str, AtlasEntity]] = None) -> List[Union[Reader, User]]:
         _readers = entity.get(AtlasCommonParams.relationships, dict()).get('readers', list())
 
         guids = [_reader.get(AtlasCommonParams.guid) for _reader in self._filter_active(_readers)]
@@ -1120,11 +1201,14 @@ class AtlasProxy(BaseProxy):
         if not guids:
             return []
 
-        readers = self.client.entity.get_entities_by_guids(guids=list(guids), ignore_relationships=False)
+        if related_entities is None:
+            readers = self.client.entity.get_entities_by_guids(guids=list(guids), ignore_relationships=False).entities
+        else:
+            readers = [related_entities[guid] for guid in guids if guid in related_entities]
 
         _result = []
 
-        for _reader in readers.entities or list():
+        for _reader in readers or list():
             read_count = _reader.attributes['count']
 
             if read_count >= int(app.config['POPULAR_RESOURCES_MINIMUM_READER_COUNT']):
@@ -1149,7 +1233,8 @@ class AtlasProxy(BaseProxy):
 
         return result
 
-    def _get_application(self, entity: AtlasEntityWithExtInfo) -> Optional[Application]:
+    def _get_application(self, entity: AtlasEntityWithExtInfo,
+                         related_entities: Optional[Dict[str, AtlasEntity]] = None) -> Optional[Application]:
         _applications = entity.get(AtlasCommonParams.relationships, dict()).get('applications', list())
 
         guids = [a.get(AtlasCommonParams.guid) for a in self._filter_active(_applications)]
@@ -1157,9 +1242,13 @@ class AtlasProxy(BaseProxy):
         if not guids:
             return None
 
-        applications = self.client.entity.get_entities_by_guids(guids=list(guids), ignore_relationships=False)
+        if related_entities is None:
+            applications = self.client.entity.get_entities_by_guids(guids=list(guids),
+                                                                    ignore_relationships=False).entities
+        else:
+            applications = [related_entities[guid] for guid in guids if guid in related_entities]
 
-        for _app in applications.entities or list():
+        for _app in applications or list():
             url = _app.attributes.get('application_url', '')
             description = _app.attributes.get('description', '')
             id = _app.attributes.get('id', '')
@@ -1436,35 +1525,27 @@ class AtlasProxy(BaseProxy):
                 edges.append((node, neighbour))
         return edges
 
-    @classmethod
-    def _find_shortest_path(cls, graph: Dict[str, List[str]], start: str, end: str, path: List[Any] = []) -> List[str]:
+    @staticmethod
+    def _find_levels(graph: Mapping[str, Iterable[str]], root_node: str) -> Dict[str, int]:
         """
-        Find shortest path between graph nodes. Used to calculate 'level' parameter
+        Finds the distance from root_node of every node reachable from it, with a single breadth first search.
+        Used to calculate 'level' parameter
 
-        __source__='https://www.python.org/doc/essays/graphs/'
-        __author__='Guido van Rossum'
-
-        :param graph: Dictionary of str (node key) and List[str] (connected nodes)
-        :param start: Starting node for finding the path
-        :param end: Ending node for finding the path
-        :param path: Accumulator for recursive calls
-        :return: Shortest path between start and end nodes
+        :param graph: Dictionary of str (node key) and connected nodes
+        :param root_node: Starting node of every path
+        :return: Dict with keys (node) and values (number of edges of the shortest path from root_node to the node)
         """
-        path = path + [start]
+        levels = {root_node: 0}
+        queue = deque([root_node])
 
-        if start == end:
-            return path
-        if not graph.get(start):
-            return []
-        shortest: List[str] = []
-        for node in graph[start]:
-            if node not in path:
-                newpath = AtlasProxy._find_shortest_path(graph, node, end, path)
-                if newpath:
-                    if not shortest or len(newpath) < len(shortest):
-                        shortest = newpath
+        while queue:
+            node = queue.popleft()
+            for neighbour in graph.get(node, []):
+                if neighbour not in levels:
+                    levels[neighbour] = levels[node] + 1
+                    queue.append(neighbour)
 
-        return shortest
+        return levels
 
     @staticmethod
     def _find_parent_nodes(graph: Dict) -> Dict[str, Set[str]]:
@@ -1536,15 +1617,14 @@ class AtlasProxy(BaseProxy):
         return dict(graph)
 
     def _serialize_lineage_item(self, edge: Tuple[str, str], direction: str, key_class: Any,
-                                graph: Dict, root_node: str, parent_nodes: Dict[str, Set[str]]) -> List[LineageItem]:
+                                levels: Dict[str, int], parent_nodes: Dict[str, Set[str]]) -> List[LineageItem]:
         """
         Serializes LineageItem object.
 
         :param edge: tuple containing two node keys that are connected with each other.
         :param direction: Lineage direction upstream/downstream
         :param key_class: Helper class used for managing Atlas <> Amundsen key formats.
-        :param: graph: Graph from which the edge was derived from. Used to find distance between edge node and entity
-        for which lineage is retrieved.
+        :param levels: Distance between every node and entity for which lineage is retrieved, see _find_levels.
         :param parent_nodes: Dict of keys (nodes) with set of keys (parents).
         :return: Serialized LineageItem list.
         """
@@ -1552,13 +1632,13 @@ class AtlasProxy(BaseProxy):
 
         if direction == 'upstream':
             key, _ = edge
-            level = len(AtlasProxy._find_shortest_path(graph, key, root_node)) - 1
         elif direction == 'downstream':
             _, key = edge
-            level = len(AtlasProxy._find_shortest_path(graph, root_node, key)) - 1
         else:
             raise ValueError(f'Direction {direction} not supported!')
 
+        level = levels.get(key, -1)
+
         parents = parent_nodes.get(key, [''])
 
         while True:
@@ -1613,8 +1693,14 @@ class AtlasProxy(BaseProxy):
         edges = AtlasProxy._generate_edges(graph)
         parent_nodes = self._find_parent_nodes(graph)
 
+        # Upstream nodes lead to root_node, so their levels are found by following edges backwards (to parents)
+        if direction == 'upstream':
+            levels = AtlasProxy._find_levels(parent_nodes, root_node)
+        else:
+            levels = AtlasProxy._find_levels(graph, root_node)
+
         for edge in edges:
-            lineage_items = self._serialize_lineage_item(edge, direction, key_class, graph, root_node, parent_nodes)
+            lineage_items = self._serialize_lineage_item(edge, direction, key_class, levels, parent_nodes)
 
             result += lineage_items
 
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from abc import ABCMeta, abstractmethod
+from inspect import isfunction
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from amundsen_common.entity.resource_type import ResourceType
@@ -18,6 +19,9 @@ from flask import current_app as app
 from metadata_service.entity.dashboard_detail import \
     DashboardDetail as DashboardDetailEntity
 from metadata_service.entity.description import Description
+from metadata_service.exception import NotFoundException
+from metadata_service.proxy.cache import (CACHED_READS, INVALIDATIONS,
+                                          cached_read, invalidating_write)
 from metadata_service.util import UserResourceRel
 
 
@@ -26,6 +30,19 @@ class BaseProxy(metaclass=ABCMeta):
     Base Proxy, which behaves like an interface for all
     the proxy clients available in the amundsen metadata service
     """
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Makes the reads and writes of every proxy go through the proxy cache, see metadata_service.proxy.cache
+        """
+        super().__init_subclass__(**kwargs)
+        for name, method in list(vars(cls).items()):
+            if not isfunction(method):
+                continue
+            if name in CACHED_READS:
+                setattr(cls, name, cached_read(method, name))
+            elif name in INVALIDATIONS:
+                setattr(cls, name, invalidating_write(method, name))
+
     def _get_user_details(self, user_id: str, user_data: Optional[Dict] = None) -> Dict:
         """
         Helper function to help get the user details if the `USER_DETAIL_METHOD` is configured,
@@ -69,6 +86,23 @@ class BaseProxy(metaclass=ABCMeta):
     def get_table(self, *, table_uri: str) -> Table:
         pass
 
+    def get_tables(self, *, table_uris: List[str]) -> Tuple[Dict[str, Table], Dict[str, str]]:
+        """
+        Gets the details of many tables at once. Proxies override it to fetch all of them with a constant number of
+        queries, this default gets them one by one with get_table.
+        :param table_uris: Table URIs
+        :return: Tuple of the tables found by table URI and the error messages of the others by table URI
+        """
+        tables: Dict[str, Table] = {}
+        errors: Dict[str, str] = {}
+        for table_uri in table_uris:
+            try:
+                tables[table_uri] = self.get_table(table_uri=table_uri)
+            except NotFoundException as e:
+                errors[table_uri] = str(e)
+
+        return tables, errors
+
     @abstractmethod
     def delete_owner(self, *, table_uri: str, owner: str) -> None:
         pass
@@ -0,0 +1,256 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Caching of proxy responses. BaseProxy wraps the read methods of every proxy listed in CACHED_READS with cached_read
+and the write methods of INVALIDATIONS with invalidating_write. Nothing is cached unless config.PROXY_CACHE is set,
+and only the reads given a TTL in config.PROXY_CACHE_TTL_SEC are.
+"""
+
+import json
+import logging
+from enum import Enum
+from functools import wraps
+from threading import Lock
+from typing import (Any, Callable, Dict, List, Mapping, Optional,  # noqa: F401
+                    Tuple)
+
+from amundsen_common.entity.resource_type import ResourceType
+from amundsen_common.models.badge import BadgeSchema
+from amundsen_common.models.dashboard import DashboardSummarySchema
+from amundsen_common.models.feature import FeatureSchema
+from amundsen_common.models.generation_code import GenerationCodeSchema
+from amundsen_common.models.lineage import LineageSchema
+from amundsen_common.models.popular_table import PopularTableSchema
+from amundsen_common.models.table import TableSchema, TableSummarySchema
+from amundsen_common.models.user import UserSchema
+from flask import current_app, has_app_context
+from marshmallow import Schema
+from werkzeug.utils import import_string
+
+from metadata_service import config
+from metadata_service.entity.dashboard_detail import DashboardSchema
+from metadata_service.entity.description import DescriptionSchema
+from metadata_service.entity.tag_detail import TagDetailSchema
+from metadata_service.proxy.cache.base_cache import BaseCache
+from metadata_service.proxy.statsd_utilities import _get_statsd_client
+from metadata_service.util import UserResourceRel
+
+LOGGER = logging.getLogger(__name__)
+
+KEY_PREFIX = 'amundsen_metadata:'
+
+_proxy_cache = None  # type: Optional[BaseCache]
+_proxy_cache_lock = Lock()
+
+
+def get_proxy_cache() -> Optional[BaseCache]:
+    """
+    Provides singleton cache based on the config
+    :return: instance of the config.PROXY_CACHE subclass of BaseCache, or None when it's not configured
+    """
+    global _proxy_cache
+
+    if not has_app_context() or not current_app.config.get(config.PROXY_CACHE):
+        return None
+
+    if _proxy_cache:
+        return _proxy_cache
+
+    with _proxy_cache_lock:
+        if not _proxy_cache:
+            cache_class = import_string(current_app.config[config.PROXY_CACHE])
+            _proxy_cache = cache_class(**current_app.config[config.PROXY_CACHE_KWARGS])
+
+    return _proxy_cache
+
+
+def _key_value(value: Any) -> str:
+    return value.name if isinstance(value, Enum) else str(value)
+
+
+def cache_key(method_name: str, kwargs: Mapping[str, Any]) -> str:
+    """
+    e.g. amundsen_metadata:get_table:table_uri=hive://gold.schema/table
+    """
+    args = ','.join(f'{name}={_key_value(value)}' for name, value in sorted(kwargs.items()))
+    return f'{KEY_PREFIX}{method_name}:{args}'
+
+
+# How a response is serialized to and from JSON-compatible data
+Serializer = Tuple[Callable[[Any], Any], Callable[[Any], Any]]
+
+_PLAIN = (lambda value: value, lambda data: data)  # type: Serializer
+
+
+def _schema(schema: Schema, many: bool = False) -> Serializer:
+    return lambda value: schema.dump(value, many=many), lambda data: schema.load(data, many=many)
+
+
+def _schema_lists(schemas: Mapping[str, Schema]) -> Serializer:
+    """
+    For responses mapping keys (e.g. 'table', 'dashboard') to lists of models
+    """
+    return (lambda value: {key: schemas[key].dump(items, many=True) for key, items in value.items()},
+            lambda data: {key: schemas[key].load(items, many=True) for key, items in data.items()})
+
+
+# The reads that can be cached, and how their responses are serialized. Reads missing here are never cached.
+CACHED_READS = {
+    'get_user': _schema(UserSchema()),
+    'get_users': _schema(UserSchema(), many=True),
+    'get_table': _schema(TableSchema()),
+    'get_table_description': _PLAIN,
+    'get_column_description': _PLAIN,
+    'get_popular_tables': _schema(PopularTableSchema(), many=True),
+    'get_popular_resources': _schema_lists({ResourceType.Table.name: TableSummarySchema(),
+                                            ResourceType.Dashboard.name: DashboardSummarySchema()}),
+    'get_latest_updated_ts': _PLAIN,
+    'get_statistics': _PLAIN,
+    'get_tags': _schema(TagDetailSchema(), many=True),
+    'get_badges': _schema(BadgeSchema(), many=True),
+    'get_dashboard_by_user_relation': _schema_lists({'dashboard': DashboardSummarySchema()}),
+    'get_table_by_user_relation': _schema_lists({'table': PopularTableSchema()}),
+    'get_frequently_used_tables': _schema_lists({'table': PopularTableSchema()}),
+    'get_dashboard': _schema(DashboardSchema()),
+    'get_dashboard_description': _schema(DescriptionSchema()),
+    'get_resources_using_table': _schema_lists({'dashboards': DashboardSummarySchema()}),
+    'get_lineage': _schema(LineageSchema()),
+    'get_feature': _schema(FeatureSchema()),
+    'get_resource_description': _schema(DescriptionSchema()),
+    'get_resource_generation_code': _schema(GenerationCodeSchema()),
+}  # type: Dict[str, Serializer]
+
+
+def _serialize(method_name: str, value: Any) -> bytes:
+    dump, _ = CACHED_READS[method_name]
+    return json.dumps(None if value is None else dump(value)).encode('utf-8')
+
+
+def _deserialize(method_name: str, value: bytes) -> Any:
+    _, load = CACHED_READS[method_name]
+    data = json.loads(value)
+    return None if data is None else load(data)
+
+
+def cached_read(f: Callable, method_name: str) -> Callable:
+    """
+    A proxy method decorator that returns the cached response of the same call when there is one. Emits statsd
+    counters {method}.cache_hit and {method}.cache_miss under the prefix of the method's module.
+    Backend failures are logged and the method is called as if there was no cache.
+    :param method_name: name of the method in CACHED_READS, f may be wrapped by other decorators and named otherwise
+    """
+    @wraps(f)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        ttl_sec = current_app.config.get(config.PROXY_CACHE_TTL_SEC, {}).get(method_name) if has_app_context() else None
+        # proxy methods take keyword arguments only, and the key is built from them
+        cache = get_proxy_cache() if ttl_sec and not args else None
+        if not cache:
+            return f(self, *args, **kwargs)
+
+        key = cache_key(method_name, kwargs)
+        statsd_client = _get_statsd_client(prefix=f.__module__)
+        try:
+            value = cache.get(key)
+            if value is not None:
+                result = _deserialize(method_name, value)
+                if statsd_client:
+                    statsd_client.incr(f'{method_name}.cache_hit')
+                return result
+        except Exception:
+            LOGGER.exception(f'Failed to get {key} from cache')
+            return f(self, *args, **kwargs)
+
+        if statsd_client:
+            statsd_client.incr(f'{method_name}.cache_miss')
+        result = f(self, *args, **kwargs)
+        try:
+            cache.set(key, _serialize(method_name, result), ttl_sec)
+        except Exception:
+            LOGGER.exception(f'Failed to set {key} in cache')
+        return result
+
+    return wrapper
+
+
+def _resource_reads(resource_type: ResourceType, uri: str) -> List[Tuple[str, Dict[str, Any]]]:
+    reads = [('get_resource_description', {'resource_type': resource_type, 'uri': uri})]
+    if resource_type == ResourceType.Table:
+        reads += [('get_table', {'table_uri': uri}), ('get_table_description', {'table_uri': uri})]
+    elif resource_type == ResourceType.Dashboard:
+        reads += [('get_dashboard', {'id': uri}), ('get_dashboard_description', {'id': uri})]
+    elif resource_type == ResourceType.Feature:
+        reads += [('get_feature', {'feature_uri': uri})]
+    elif resource_type == ResourceType.User:
+        reads += [('get_user', {'id': uri})]
+    return reads
+
+
+def _user_relation_reads(kwargs: Mapping[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    relation = {'user_email': kwargs['user_id'], 'relation_type': kwargs['relation_type']}
+    return [('get_table_by_user_relation', relation),
+            ('get_dashboard_by_user_relation', relation),
+            ('get_frequently_used_tables', {'user_email': kwargs['user_id']})] + \
+        _resource_reads(kwargs['resource_type'], kwargs['id'])
+
+
+def _user_reads(kwargs: Mapping[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    user = kwargs['user']
+    return [('get_user', {'id': user_id}) for user_id in {user.user_id, user.email} if user_id]
+
+
+def _owner_reads(resource_type: ResourceType, uri: str, owner: str) -> List[Tuple[str, Dict[str, Any]]]:
+    # the owner's user node is created along with the relation
+    reads = [('get_user', {'id': owner})]
+    if resource_type == ResourceType.Table:
+        reads += [('get_table_by_user_relation', {'user_email': owner, 'relation_type': UserResourceRel.own})]
+    elif resource_type == ResourceType.Dashboard:
+        reads += [('get_dashboard_by_user_relation', {'user_email': owner, 'relation_type': UserResourceRel.own})]
+    return reads + _resource_reads(resource_type, uri)
+
+
+def _column_reads(kwargs: Mapping[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    return [('get_column_description', {'table_uri': kwargs['table_uri'], 'column_name': kwargs['column_name']})] + \
+        _resource_reads(ResourceType.Table, kwargs['table_uri'])
+
+
+# The reads (method name and keyword arguments) that every write, given its keyword arguments, makes stale
+INVALIDATIONS = {
+    'put_table_description': lambda kwargs: _resource_reads(ResourceType.Table, kwargs['table_uri']),
+    'put_column_description': _column_reads,
+    'add_owner': lambda kwargs: _owner_reads(ResourceType.Table, kwargs['table_uri'], kwargs['owner']),
+    'delete_owner': lambda kwargs: _owner_reads(ResourceType.Table, kwargs['table_uri'], kwargs['owner']),
+    'add_tag': lambda kwargs: _resource_reads(kwargs['resource_type'], kwargs['id']) + [('get_tags', {})],
+    'delete_tag': lambda kwargs: _resource_reads(kwargs['resource_type'], kwargs['id']) + [('get_tags', {})],
+    'add_badge': lambda kwargs: _resource_reads(kwargs['resource_type'], kwargs['id']) + [('get_badges', {})],
+    'delete_badge': lambda kwargs: _resource_reads(kwargs['resource_type'], kwargs['id']) + [('get_badges', {})],
+    'put_dashboard_description': lambda kwargs: _resource_reads(ResourceType.Dashboard, kwargs['id']),
+    'put_resource_description': lambda kwargs: _resource_reads(kwargs['resource_type'], kwargs['uri']),
+    'add_resource_owner': lambda kwargs: _owner_reads(kwargs['resource_type'], kwargs['uri'], kwargs['owner']),
+    'delete_resource_owner': lambda kwargs: _owner_reads(kwargs['resource_type'], kwargs['uri'], kwargs['owner']),
+    'add_resource_relation_by_user': _user_relation_reads,
+    'delete_resource_relation_by_user': _user_relation_reads,
+    'create_update_user': _user_reads,
+}  # type: Dict[str, Callable[[Mapping[str, Any]], List[Tuple[str, Dict[str, Any]]]]]
+
+
+def invalidating_write(f: Callable, method_name: str) -> Callable:
+    """
+    A proxy method decorator that deletes the cached responses of the reads INVALIDATIONS lists for the method.
+    They are deleted even if the write fails, as it may have been partially applied.
+    :param method_name: name of the method in INVALIDATIONS, f may be wrapped by other decorators and named otherwise
+    """
+    @wraps(f)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return f(self, *args, **kwargs)
+        finally:
+            cache = get_proxy_cache()
+            if cache:
+                try:
+                    cache.delete([cache_key(read_name, read_kwargs)
+                                  for read_name, read_kwargs in INVALIDATIONS[method_name](kwargs)])
+                except Exception:
+                    LOGGER.exception(f'Failed to invalidate cached reads of {method_name}')
+
+    return wrapper
@@ -0,0 +1,27 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+from abc import ABCMeta, abstractmethod
+from typing import List, Optional
+
+
+class BaseCache(metaclass=ABCMeta):
+    """
+    Base Cache, the interface of the stores proxy responses are cached in.
+    Values are serialized responses, keys are built by metadata_service.proxy.cache.cache_key
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        :return: the value of key, or None when it's missing or expired
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_sec: int) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, keys: List[str]) -> None:
+        pass
@@ -0,0 +1,44 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import List, Optional, Tuple
+
+from metadata_service.proxy.cache.base_cache import BaseCache
+
+
+class LocalLRUCache(BaseCache):
+    """
+    An in-process cache that evicts the least recently used key beyond max_size keys.
+    Every process has its own, so a write only invalidates the cache of the process that served it.
+    """
+
+    def __init__(self, *, max_size: int = 1024) -> None:
+        self._max_size = max_size
+        self._values: 'OrderedDict[str, Tuple[bytes, float]]' = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if key not in self._values:
+                return None
+            value, expires_at = self._values[key]
+            if expires_at <= time.monotonic():
+                del self._values[key]
+                return None
+            self._values.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_sec: int) -> None:
+        with self._lock:
+            self._values[key] = (value, time.monotonic() + ttl_sec)
+            self._values.move_to_end(key)
+            while len(self._values) > self._max_size:
+                self._values.popitem(last=False)
+
+    def delete(self, keys: List[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._values.pop(key, None)
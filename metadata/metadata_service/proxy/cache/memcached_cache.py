@@ -0,0 +1,37 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+from typing import Any, List, Optional
+
+from pymemcache.client.hash import HashClient
+
+from metadata_service.proxy.cache.base_cache import BaseCache
+
+
+class MemcachedCache(BaseCache):
+    """
+    A cache shared by every process of the service, kept in memcached.
+    Memcached keys can't hold spaces and are at most 250 bytes long, so keys are stored hashed.
+    """
+
+    def __init__(self, *, servers: List[str] = ['localhost:11211'], **kwargs: Any) -> None:
+        """
+        :param servers: host:port of every memcached server
+        :param kwargs: passed to pymemcache's HashClient, e.g. connect_timeout
+        """
+        self._client = HashClient([(host, int(port)) for host, port in (server.rsplit(':', 1) for server in servers)],
+                                  **kwargs)
+
+    @staticmethod
+    def _hash(key: str) -> str:
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self._hash(key))
+
+    def set(self, key: str, value: bytes, ttl_sec: int) -> None:
+        self._client.set(self._hash(key), value, expire=ttl_sec)
+
+    def delete(self, keys: List[str]) -> None:
+        self._client.delete_many([self._hash(key) for key in keys])
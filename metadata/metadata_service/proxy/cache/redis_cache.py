@@ -0,0 +1,31 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Any, List, Optional
+
+from redis import Redis
+
+from metadata_service.proxy.cache.base_cache import BaseCache
+
+
+class RedisCache(BaseCache):
+    """
+    A cache shared by every process of the service, kept in Redis.
+    """
+
+    def __init__(self, *, url: str = 'redis://localhost:6379/0', **kwargs: Any) -> None:
+        """
+        :param url: Redis URL, e.g. redis://:password@host:6379/0
+        :param kwargs: passed to redis.Redis, e.g. socket_timeout
+        """
+        self._client = Redis.from_url(url, **kwargs)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl_sec: int) -> None:
+        self._client.set(key, value, ex=ttl_sec)
+
+    def delete(self, keys: List[str]) -> None:
+        if keys:
+            self._client.delete(*keys)
@@ -4,12 +4,16 @@
 import collections
 import json
 import logging
+import re
+import threading
+import time
 from abc import abstractmethod
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
 from operator import attrgetter
-from typing import (Any, Callable, Dict, Iterable, List, Mapping, Optional,
-                    Sequence, Set, Tuple, Type, TypeVar, Union, no_type_check,
-                    overload)
+from typing import (Any, Callable, Deque, Dict, Iterable, Iterator, List,
+                    Mapping, Optional, Sequence, Set, Tuple, Type, TypeVar,
+                    Union, no_type_check, overload)
 from urllib.parse import unquote
 
 import gremlin_python
@@ -46,7 +50,7 @@ from gremlin_python.process.graph_traversal import (GraphTraversal,
                                                     constant, has, inE, inV,
                                                     outE, outV, select, unfold,
                                                     valueMap, values)
-from gremlin_python.process.traversal import Cardinality
+from gremlin_python.process.traversal import Bytecode, Cardinality
 from gremlin_python.process.traversal import Column as MapColumn
 from gremlin_python.process.traversal import (Direction, Order, P, T, TextP,
                                               Traversal, gte, not_, within,
@@ -75,6 +79,15 @@ LOGGER = logging.getLogger(__name__)
 PUBLISH_TAG_TIME_FORMAT: str = "%Y-%m-%d %H:%M"
 AMUNDSEN_TIMESTAMP_KEY: str = 'amundsen_updated_timestamp'
 
+# How a Traversal is submitted to the server, see AbstractGremlinProxy
+# a Groovy script with every value inlined
+SCRIPT_QUERY_SUBMISSION: str = 'script'
+# a Groovy script whose values are passed as bindings, see ParameterizedScriptTranslator
+PARAMETERIZED_SCRIPT_QUERY_SUBMISSION: str = 'parameterized_script'
+# the Traversal's bytecode
+BYTECODE_QUERY_SUBMISSION: str = 'bytecode'
+QUERY_SUBMISSIONS = (SCRIPT_QUERY_SUBMISSION, PARAMETERIZED_SCRIPT_QUERY_SUBMISSION, BYTECODE_QUERY_SUBMISSION)
+
 
 def timestamp() -> datetime:
     """
@@ -188,44 +201,233 @@ class ExecuteQuery(Protocol):
         ...
 
 
+class ParameterizedScriptTranslator:
+    """
+    Translates a Traversal like script_translator does, except that values (strings, numbers, dates and collections of
+    them) are replaced by variables, which are returned as bindings.  The script is then the same for every execution
+    of a query whatever the keys, ids or dates in it, so the server compiles it once and hits its script cache after.
+
+    Gremlin Server 3.5+ limits the number of bindings in a request with maxParameters, which upserts with many
+    properties can exceed.  Neptune does not support bindings.
+    """
+
+    def __init__(self, script_translator: Type[ScriptTranslator]) -> None:
+        # the translator's methods are classmethods, so bindings being collected are kept per thread
+        local = threading.local()
+        self._local = local
+
+        class _Translator(script_translator):  # type: ignore
+            @classmethod
+            def _convert_to_string(cls, thing: Any) -> str:
+                if not ParameterizedScriptTranslator._is_bindable(thing):
+                    return super()._convert_to_string(thing)
+                return ParameterizedScriptTranslator._bind(local.bindings, thing)
+
+            @classmethod
+            def _date_to_string(cls, thing: Union[datetime, date]) -> str:
+                # dates are a call on their quoted iso format, e.g. datetime("2020-01-01T00:00:00")
+                script = super()._date_to_string(thing)
+                match = re.fullmatch(r'(.*\()"([^"]*)"\)', script, re.DOTALL)
+                if match is None:
+                    return script
+                return f'{match.group(1)}{ParameterizedScriptTranslator._bind(local.bindings, match.group(2))})'
+
+        self._translator = _Translator
+
+    def translateT(self, traversal: Traversal) -> Tuple[str, Dict[str, Any]]:
+        self._local.bindings = {}
+        try:
+            return self._translator.translateT(traversal), self._local.bindings
+        finally:
+            del self._local.bindings
+
+    @staticmethod
+    def _is_bindable(thing: Any) -> bool:
+        # bool is an int, but true/false don't change between executions
+        if isinstance(thing, bool):
+            return False
+        if isinstance(thing, (str, int, float)):
+            return True
+        if isinstance(thing, (list, tuple, set, frozenset)):
+            # e.g. within(['a', 'b']), so that the script doesn't change with the number of values either
+            return all(isinstance(each, (str, int, float)) and not isinstance(each, bool) for each in thing)
+        return False
+
+    @staticmethod
+    def _bind(bindings: Dict[str, Any], value: Any) -> str:
+        # reuse the variable of an equal value (e.g. a property name used several times), so there are fewer bindings
+        if isinstance(value, (str, int, float)):
+            for name, bound in bindings.items():
+                if type(bound) is type(value) and bound == value:
+                    return name
+        name = f'p{len(bindings)}'
+        bindings[name] = list(value) if isinstance(value, tuple) else value
+        return name
+
+
+class _TraverserResultSet:
+    """
+    Results of a bytecode request are Traversers, this unwraps them into the objects a script request would return.
+    """
+
+    def __init__(self, result_set: ResultSet) -> None:
+        self.result_set = result_set
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        for part in self.result_set:
+            yield [traverser.object for traverser in part for _ in range(traverser.bulk)]
+
+
 class ClientQueryExecutor(ExecuteQuery):
-    def __init__(self, *, client: Client, traversal_translator: Callable[[Traversal], str]) -> None:
+    """
+    :param traversal_translator returns a script, a script and its bindings, or the bytecode to submit for a Traversal
+    """
+    def __init__(self, *, client: Client,
+                 traversal_translator: Callable[[Traversal], Union[str, Bytecode, Tuple[str, Mapping[str, Any]]]]
+                 ) -> None:
         self.client = client
         self.traversal_translator = traversal_translator
 
     def __call__(self, query: Union[str, Traversal], get: Callable[[ResultSet], V], *,  # noqa: F811
                  bindings: Optional[Mapping[str, Any]] = None) -> V:
+        message: Union[str, Bytecode]
         if isinstance(query, Traversal):
             if bindings is not None:
                 raise AssertionError(f'expected bindings to be none')
-            query_text = self.traversal_translator(query)
+            translated = self.traversal_translator(query)
+            message, bindings = translated if isinstance(translated, tuple) else (translated, None)
         else:
-            query_text = query
+            message = query
 
-        if not isinstance(query_text, str):
+        if isinstance(message, Bytecode):
+            return get(_TraverserResultSet(self.client.submit(message)))  # type: ignore
+        if not isinstance(message, str):
             raise AssertionError(f'expected str')
-        result_set = self.client.submit(query_text, bindings)
+        result_set = self.client.submit(message, bindings)
         return get(result_set)
 
 
-class RetryingClientQueryExecutor(ClientQueryExecutor):
-    def __init__(self, client: Client, traversal_translator: Callable[[Traversal], str],
+class _PooledClient:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+        self.created_at = self.last_used_at = time.monotonic()
+
+
+class GremlinClientPool:
+    """
+    A thread safe pool of long lived Clients, so that a query doesn't pay for a websocket handshake (and the request
+    signing on Neptune) every time.
+
+    Clients are created lazily by client_factory, so each new one connects with a freshly signed url.  Up to size
+    clients are kept once given back.  More clients than that can be borrowed at once under load, but the extra ones
+    are closed when given back.
+
+    :param max_age_seconds a client older than this is replaced, e.g. before the credentials it was signed with expire
+    :param health_check_idle_seconds a client idle for longer than this is checked with a trivial query before being
+    lent out, and replaced if the check fails (e.g. the server closed the connection)
+    """
+
+    def __init__(self, *, client_factory: Callable[[], Client], size: int = 8, max_age_seconds: float = 3600,
+                 health_check_idle_seconds: float = 60) -> None:
+        self.client_factory = client_factory
+        self.size = size
+        self.max_age_seconds = max_age_seconds
+        self.health_check_idle_seconds = health_check_idle_seconds
+        self._lock = threading.Lock()
+        self._idle: Deque[_PooledClient] = collections.deque()
+
+    @contextmanager
+    def client(self) -> Iterator[Client]:
+        pooled = self._borrow()
+        try:
+            yield pooled.client
+        except gremlin_python.driver.protocol.GremlinServerError:
+            # the server answered, so the connection is fine
+            self._give_back(pooled)
+            raise
+        except BaseException:
+            # the connection might be broken, don't lend it out again
+            self._close(pooled)
+            raise
+        else:
+            self._give_back(pooled)
+
+    def close(self) -> None:
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for pooled in idle:
+            self._close(pooled)
+
+    def _borrow(self) -> _PooledClient:
+        while True:
+            with self._lock:
+                # most recently used first, so that extra clients age out when the load goes down
+                pooled = self._idle.pop() if self._idle else None
+            if pooled is None:
+                return _PooledClient(self.client_factory())
+
+            now = time.monotonic()
+            if now - pooled.created_at > self.max_age_seconds:
+                LOGGER.debug('replacing gremlin client older than %ss', self.max_age_seconds)
+                self._close(pooled)
+            elif now - pooled.last_used_at > self.health_check_idle_seconds and not self._is_healthy(pooled):
+                self._close(pooled)
+            else:
+                return pooled
+
+    def _give_back(self, pooled: _PooledClient) -> None:
+        pooled.last_used_at = time.monotonic()
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(pooled)
+                return
+        self._close(pooled)
+
+    @staticmethod
+    def _is_healthy(pooled: _PooledClient) -> bool:
+        try:
+            pooled.client.submit('g.inject(0)').all().result()
+            return True
+        except Exception as e:
+            LOGGER.info(f'replacing gremlin client failing its health check: {e}')
+            return False
+
+    @staticmethod
+    def _close(pooled: _PooledClient) -> None:
+        try:
+            pooled.client.close()
+        except Exception as e:
+            LOGGER.debug(f'ignoring exception closing gremlin client: {e}')
+
+
+class RetryingClientQueryExecutor(ExecuteQuery):
+    """
+    Executes each query with a Client borrowed from client_pool, retrying it when is_retryable.  A retry borrows a
+    client again, so it gets a new one if the connection was what failed.
+    """
+    def __init__(self, client_pool: GremlinClientPool,
+                 traversal_translator: Callable[[Traversal], Union[str, Bytecode, Tuple[str, Mapping[str, Any]]]],
                  is_retryable: Callable[[Exception], bool]) -> None:
-        ClientQueryExecutor.__init__(self, client=client, traversal_translator=traversal_translator)
+        self.client_pool = client_pool
+        self.traversal_translator = traversal_translator
         self.is_retryable = is_retryable
 
     def __enter__(self) -> Any:
         return self
 
     def __exit__(self, *args: Any, **kwargs: Any) -> None:
-        return self.client.close()
+        # clients are given back to the pool after each query, so there is nothing to close
+        pass
 
     # TODO: ideally this would be __call__(*args: Any, **kwargs: Any) -> Any (and then this could be mixinable) but I
     # can't get mypy to not think that conflicts
     def __call__(self, query: Union[str, Traversal], get: Callable[[ResultSet], V], *,
                  bindings: Optional[Mapping[str, Any]] = None) -> V:
         def callable() -> V:
-            return ClientQueryExecutor.__call__(self, query, get, bindings=bindings)
+            with self.client_pool.client() as client:
+                executor = ClientQueryExecutor(client=client, traversal_translator=self.traversal_translator)
+                return executor(query, get, bindings=bindings)
         try:
             return retrying(callable, is_retryable=self.is_retryable)
         except Exception as e:
@@ -838,6 +1040,9 @@ class AbstractGremlinProxy(BaseProxy):
 
     :param key_property_name defaults to 'key', but some some servers don't allow key so their proxies will pick a different key property name (e.g. _key)
     :param remote_connection a RemoteConnection e.g. `DriverRemoteConnection(url='wss://host:8182/gremlin')`
+    :param client_pool_options passed to GremlinClientPool's constructor, e.g. size
+    :param query_submission how Traversals are submitted, one of QUERY_SUBMISSIONS.  Defaults to a script with every
+    value inlined.  parameterized_script and bytecode let the server reuse a compiled query for every execution.
 
     If you see:
     gremlin_python.driver.protocol.GremlinServerError: 498: {"requestId":"80a1d05e-bcde-4f43-95c7-d48db3966c0a","code":"UnsupportedOperationException","detailedMessage:"com.amazon.neptune.storage.volcano.ast.CutoffNode cannot be cast to com.amazon.neptune.storage.volcano.ast.AbstractGroupNode"}
@@ -853,7 +1058,9 @@ class AbstractGremlinProxy(BaseProxy):
     """  # noqa: E501
 
     def __init__(self, *, key_property_name: str, driver_remote_connection_options: Mapping[str, Any] = {},
-                 gremlin_client_options: Mapping[str, Any] = {}) -> None:
+                 gremlin_client_options: Mapping[str, Any] = {},
+                 client_pool_options: Mapping[str, Any] = {},
+                 query_submission: str = SCRIPT_QUERY_SUBMISSION) -> None:
         # these might vary from datastore type to another, but if you change these while talking to the same instance
         # without migration, it will go poorly
         self.key_property_name: str = key_property_name
@@ -866,6 +1073,13 @@ class AbstractGremlinProxy(BaseProxy):
         # override these since we need so little
         self.gremlin_client_options.setdefault('pool_size', 1),
         self.gremlin_client_options.setdefault('max_workers', 1),
+        # each client is used by one query at a time, and shared by the queries through this pool
+        self.client_pool = GremlinClientPool(client_factory=self.client, **client_pool_options)
+
+        if query_submission not in QUERY_SUBMISSIONS:
+            raise NotImplementedError(f'query_submission must be one of {QUERY_SUBMISSIONS}, not {query_submission}')
+        self.query_submission = query_submission
+        self._parameterized_script_translator = ParameterizedScriptTranslator(self.script_translator())
 
         # safe this for use in _submit
         self.remote_connection: DriverRemoteConnection = DriverRemoteConnection(
@@ -914,8 +1128,15 @@ class AbstractGremlinProxy(BaseProxy):
     def query_executor(self, *, method_name: str = "nope") -> \
             RetryingClientQueryExecutor:
         return RetryingClientQueryExecutor(
-            client=self.client(), is_retryable=self.get_is_retryable(method_name),
-            traversal_translator=self.script_translator().translateT)
+            client_pool=self.client_pool, is_retryable=self.get_is_retryable(method_name),
+            traversal_translator=self.traversal_translator())
+
+    def traversal_translator(self) -> Callable[[Traversal], Union[str, Bytecode, Tuple[str, Mapping[str, Any]]]]:
+        if self.query_submission == BYTECODE_QUERY_SUBMISSION:
+            return attrgetter('bytecode')
+        if self.query_submission == PARAMETERIZED_SCRIPT_QUERY_SUBMISSION:
+            return self._parameterized_script_translator.translateT
+        return self.script_translator().translateT
 
     @classmethod
     def _is_retryable_exception(cls, *, method_name: str, exception: Exception) -> bool:
@@ -1815,8 +2036,11 @@ class GenericGremlinProxy(AbstractGremlinProxy):
 
         driver_remote_connection_options.update(traversal_source=traversal_source)
 
+        client_kwargs: Mapping[str, Any] = kwargs.get('client_kwargs') or {}
         super().__init__(key_property_name=key_property_name,
-                         driver_remote_connection_options=driver_remote_connection_options)
+                         driver_remote_connection_options=driver_remote_connection_options,
+                         client_pool_options=client_kwargs.get('client_pool_options', {}),
+                         query_submission=client_kwargs.get('query_submission', SCRIPT_QUERY_SUBMISSION))
 
     @classmethod
     @overrides
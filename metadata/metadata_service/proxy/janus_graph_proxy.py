@@ -6,7 +6,7 @@ from typing import Any, Mapping, Optional, Type
 from amundsen_gremlin.script_translator import ScriptTranslatorTargetJanusgraph
 from overrides import overrides
 
-from .gremlin_proxy import AbstractGremlinProxy
+from .gremlin_proxy import SCRIPT_QUERY_SUBMISSION, AbstractGremlinProxy
 
 
 class JanusGraphGremlinProxy(AbstractGremlinProxy):
@@ -38,9 +38,13 @@ class JanusGraphGremlinProxy(AbstractGremlinProxy):
 
         driver_remote_connection_options.update(traversal_source=traversal_source)
 
+        client_kwargs: Mapping[str, Any] = kwargs.get('client_kwargs') or {}
         # use _key
         AbstractGremlinProxy.__init__(self, key_property_name='_key',
-                                      driver_remote_connection_options=driver_remote_connection_options)
+                                      driver_remote_connection_options=driver_remote_connection_options,
+                                      client_pool_options=client_kwargs.get('client_pool_options', {}),
+                                      query_submission=client_kwargs.get('query_submission',
+                                                                         SCRIPT_QUERY_SUBMISSION))
 
     @classmethod
     @overrides
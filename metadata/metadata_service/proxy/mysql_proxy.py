@@ -3,6 +3,7 @@
 
 import logging
 import time
+from collections import defaultdict
 from random import randint
 from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
@@ -59,7 +60,8 @@ from beaker.cache import CacheManager
 from beaker.util import parse_cache_config_options
 from flask import current_app as app
 from sqlalchemy import func
-from sqlalchemy.orm import Session, load_only, subqueryload
+from sqlalchemy.orm import (Query, Session, joinedload, load_only,
+                            selectinload, subqueryload)
 
 from metadata_service.client.rds_client import RDSClient
 from metadata_service.entity.dashboard_detail import \
@@ -216,6 +218,49 @@ class MySQLProxy(BaseProxy):
             # usage
             readers = self._get_table_readers(session=session, table_uri=table_uri)
 
+        return self._make_table(table=table, cols=cols, readers=readers)
+
+    @timer_with_counter
+    def get_tables(self, *, table_uris: List[str]) -> Tuple[Dict[str, Table], Dict[str, str]]:
+        """
+        Retrieve the details of many tables with the same queries as get_table, each of them for all the tables.
+        :param table_uris:
+        :return: Tuple of the tables found by table URI and the error messages of the others by table URI
+        """
+        with self.client.create_session() as session:
+            # tables
+            query = session.query(RDSTable).filter(RDSTable.rk.in_(table_uris))
+            tables = {table.rk: self._make_table_metadata(table=table)
+                      for table in self._load_table_metadata(query=query).all()}
+
+            # columns
+            query = session.query(RDSColumn).filter(RDSColumn.table_rk.in_(table_uris)) \
+                .order_by(RDSColumn.table_rk, RDSColumn.sort_order)
+            cols: Dict[str, List[Column]] = defaultdict(list)
+            for column in self._load_column_details(query=query).all():
+                cols[column.table_rk].append(self._make_column(column=column))
+
+            # usage, the readers of all the tables are read at once and the first ones of every table are kept
+            usages = session.query(RDSTableUsage).filter(RDSTableUsage.table_rk.in_(table_uris)) \
+                .order_by(RDSTableUsage.table_rk, RDSTableUsage.read_count).all()
+            readers: Dict[str, List[Reader]] = defaultdict(list)
+            for usage in usages:
+                if len(readers[usage.table_rk]) < 5:
+                    readers[usage.table_rk].append(Reader(user=User(email=usage.user_rk), read_count=usage.read_count))
+
+        table_results: Dict[str, Table] = {}
+        errors: Dict[str, str] = {}
+        for table_uri in table_uris:
+            if table_uri in tables:
+                table_results[table_uri] = self._make_table(table=tables[table_uri], cols=cols[table_uri],
+                                                            readers=readers[table_uri])
+            else:
+                errors[table_uri] = f'Table URI( {table_uri} ) does not exist'
+
+        return table_results, errors
+
+    @staticmethod
+    def _make_table(*, table: Dict[str, Any], cols: List[Column], readers: List[Reader]) -> Table:
         table_result = Table(database=table['database'].name,
                              cluster=table['cluster'].name,
                              schema=table['schema'].name,
@@ -236,10 +281,40 @@ class MySQLProxy(BaseProxy):
 
     @timer_with_counter
     def _get_table_metadata(self, *, session: Session, table_uri: str) -> Optional[Dict[str, Any]]:
-        table = session.query(RDSTable).filter(RDSTable.rk == table_uri).first()
+        # table
+        query = session.query(RDSTable).filter(RDSTable.rk == table_uri)
+
+        table = self._load_table_metadata(query=query).first()
         if not table:
             return None
 
+        return self._make_table_metadata(table=table)
+
+    @staticmethod
+    def _load_table_metadata(*, query: Query) -> Query:
+        # schema, cluster, database, description, application, timestamp, source are joined in the table query
+        query = query.options(
+            joinedload(RDSTable.schema).joinedload(RDSSchema.cluster).joinedload(RDSCluster.database),
+            joinedload(RDSTable.description),
+            joinedload(RDSTable.application),
+            joinedload(RDSTable.timestamp),
+            joinedload(RDSTable.source)
+        )
+
+        # watermarks, tags, badges, owners, programmatic descriptions are loaded with a query per relationship,
+        # joining them all would multiply the rows of each other
+        query = query.options(
+            selectinload(RDSTable.watermarks),
+            selectinload(RDSTable.tags),
+            selectinload(RDSTable.badges),
+            selectinload(RDSTable.owners),
+            selectinload(RDSTable.programmatic_descriptions)
+        )
+
+        return query
+
+    @staticmethod
+    def _make_table_metadata(*, table: RDSTable) -> Dict[str, Any]:
         schema = table.schema
         cluster = schema.cluster
         database = cluster.database
@@ -325,43 +400,44 @@ class MySQLProxy(BaseProxy):
         # column
         query = session.query(RDSColumn).filter(RDSColumn.table_rk == table_uri)
 
+        columns = self._load_column_details(query=query).all()
+
+        return [self._make_column(column=column) for column in columns]
+
+    @staticmethod
+    def _load_column_details(*, query: Query) -> Query:
         # description, stats, badges
-        query = query.options(
-            subqueryload(RDSColumn.description),
+        return query.options(
+            joinedload(RDSColumn.description),
             subqueryload(RDSColumn.stats),
             subqueryload(RDSColumn.badges)
         )
 
-        columns = query.all()
-
-        col_results = []
-        for column in columns:
-            col_stat_results = []
-            for stat in column.stats:
-                col_stat_result = Stat(
-                    stat_type=stat.stat_type,
-                    stat_val=stat.stat_val,
-                    start_epoch=int(float(stat.start_epoch)),
-                    end_epoch=int(float(stat.end_epoch))
-                )
-                col_stat_results.append(col_stat_result)
-
-            col_badge_results = []
-            for badge in column.badges:
-                col_badge_results.append(
-                    TableBadge(badge_name=badge.rk, category=badge.category)
-                )
+    @staticmethod
+    def _make_column(*, column: RDSColumn) -> Column:
+        col_stat_results = []
+        for stat in column.stats:
+            col_stat_result = Stat(
+                stat_type=stat.stat_type,
+                stat_val=stat.stat_val,
+                start_epoch=int(float(stat.start_epoch)),
+                end_epoch=int(float(stat.end_epoch))
+            )
+            col_stat_results.append(col_stat_result)
 
-            col_result = Column(name=column.name,
-                                description=column.description.description
-                                if column.description else None,
-                                col_type=column.type,
-                                sort_order=int(column.sort_order),
-                                stats=col_stat_results,
-                                badges=col_badge_results)
-            col_results.append(col_result)
+        col_badge_results = []
+        for badge in column.badges:
+            col_badge_results.append(
+                TableBadge(badge_name=badge.rk, category=badge.category)
+            )
 
-        return col_results
+        return Column(name=column.name,
+                      description=column.description.description
+                      if column.description else None,
+                      col_type=column.type,
+                      sort_order=int(column.sort_order),
+                      stats=col_stat_results,
+                      badges=col_badge_results)
 
     @timer_with_counter
     def _get_table_readers(self, *, session: Session, table_uri: str) -> List[Reader]:
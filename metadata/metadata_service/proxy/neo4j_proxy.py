@@ -4,9 +4,12 @@
 import logging
 import textwrap
 import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from random import randint
-from typing import (Any, Dict, Iterable, List, Optional, Tuple,  # noqa: F401
-                    Union, no_type_check)
+from typing import (Any, Callable, Dict, Iterable, List, Mapping,  # noqa: F401
+                    Optional, Tuple, Union, no_type_check)
 
 import neo4j
 import neobolt
@@ -46,6 +49,10 @@ _CACHE = CacheManager(**parse_cache_config_options({'cache.type': 'memory'}))
 # Expire cache every 11 hours + jitter
 _GET_POPULAR_RESOURCES_CACHE_EXPIRY_SEC = 11 * 60 * 60 + randint(0, 3600)
 
+# User details from USER_DETAIL_METHOD, keyed by email
+_GET_USER_DETAILS_CACHE_EXPIRY_SEC = 5 * 60
+_USER_DETAILS_CACHE = _CACHE.get_cache('_get_user_details', expire=_GET_USER_DETAILS_CACHE_EXPIRY_SEC)
+
 CREATED_EPOCH_MS = 'publisher_created_epoch_ms'
 LAST_UPDATED_EPOCH_MS = 'publisher_last_updated_epoch_ms'
 PUBLISHED_TAG_PROPERTY_NAME = 'published_tag'
@@ -77,6 +84,11 @@ class Neo4jProxy(BaseProxy):
         :param max_connection_lifetime_sec: max life time the connection can have when it comes to reuse. In other
         words, connection life time longer than this value won't be reused and closed on garbage collection. This
         value needs to be smaller than surrounding network environment's timeout.
+
+        client_kwargs (PROXY_CLIENT_KWARGS) may set get_table_max_workers: the size of a thread pool, shared by all
+        requests, that runs get_table's independent sub-queries concurrently, each in its own session. When it's not
+        set the sub-queries run one after another. Every worker holds a connection while it runs, so keep it well below
+        num_conns.
         """
         endpoint = f'{host}:{port}'
         LOGGER.info('NEO4J endpoint: {}'.format(endpoint))
@@ -88,6 +100,12 @@ class Neo4jProxy(BaseProxy):
                                             encrypted=encrypted,
                                             trust=trust)  # type: Driver
 
+        client_kwargs: Mapping[str, Any] = kwargs.get('client_kwargs') or {}
+        get_table_max_workers = client_kwargs.get('get_table_max_workers')
+        self._get_table_executor: Optional[ThreadPoolExecutor] = \
+            ThreadPoolExecutor(max_workers=get_table_max_workers, thread_name_prefix='neo4j_get_table') \
+            if get_table_max_workers else None
+
     def health(self) -> health_check.HealthCheck:
         """
         Runs one or more series of checks on the service. Can also
@@ -116,14 +134,43 @@ class Neo4jProxy(BaseProxy):
         :return:  A Table object
         """
 
-        cols, last_neo4j_record = self._exec_col_query(table_uri)
+        # the sub-queries don't depend on each other, see get_table_max_workers
+        col_result, readers, table_result, query_result = self._run_sub_queries(
+            [self._exec_col_query, self._exec_usage_query, self._exec_table_query, self._exec_table_query_query],
+            table_uri)
 
-        readers = self._exec_usage_query(table_uri)
+        return self._make_table(col_result, readers, table_result, query_result)
+
+    @timer_with_counter
+    def get_tables(self, *, table_uris: List[str]) -> Tuple[Dict[str, Table], Dict[str, str]]:
+        """
+        Gets the details of many tables with the same four queries as get_table, each of them for all the tables.
+        :param table_uris: Table URIs
+        :return: Tuple of the tables found by table URI and the error messages of the others by table URI
+        """
+        col_results, readers, table_results, query_results = self._run_sub_queries(
+            [self._exec_bulk_col_query, self._exec_bulk_usage_query, self._exec_bulk_table_query,
+             self._exec_bulk_table_query_query],
+            table_uris)
+
+        tables: Dict[str, Table] = {}
+        errors: Dict[str, str] = {}
+        for table_uri in table_uris:
+            if table_uri in col_results and table_uri in table_results and table_uri in query_results:
+                tables[table_uri] = self._make_table(col_results[table_uri], readers.get(table_uri, []),
+                                                     table_results[table_uri], query_results[table_uri])
+            else:
+                errors[table_uri] = f'Table URI( {table_uri} ) does not exist'
+
+        return tables, errors
+
+    def _make_table(self, col_result: Tuple, readers: List[Reader], table_result: Tuple, query_result: Tuple) -> Table:
+        cols, last_neo4j_record = col_result
 
         wmk_results, table_writer, table_apps, timestamp_value, owners, tags, source, \
-            badges, prog_descs, resource_reports = self._exec_table_query(table_uri)
+            badges, prog_descs, resource_reports = table_result
 
-        joins, filters = self._exec_table_query_query(table_uri)
+        joins, filters = query_result
 
         table = Table(database=last_neo4j_record['db']['name'],
                       cluster=last_neo4j_record['clstr']['name'],
@@ -149,6 +196,27 @@ class Neo4jProxy(BaseProxy):
 
         return table
 
+    def _run_sub_queries(self, sub_queries: List[Callable[[Any], Any]], table_uri: Union[str, List[str]]) -> List[Any]:
+        """
+        Runs each of sub_queries with table_uri (or the table URIs of get_tables), on the get_table executor when there
+        is one, and returns their results in the same order. Workers run within the caller's app context so that the
+        statsd timer of every sub-query is still emitted.
+        """
+        if not self._get_table_executor:
+            return [sub_query(table_uri) for sub_query in sub_queries]
+
+        # current_app is a LocalProxy, which does not declare the Flask app getter
+        app = current_app._get_current_object() if has_app_context() else None  # type: ignore[attr-defined]
+
+        def run(sub_query: Callable[[Any], Any]) -> Any:
+            if app is None:
+                return sub_query(table_uri)
+            with app.app_context():
+                return sub_query(table_uri)
+
+        futures: List[Future] = [self._get_table_executor.submit(run, sub_query) for sub_query in sub_queries]
+        return [future.result() for future in futures]
+
     @timer_with_counter
     def _exec_col_query(self, table_uri: str) -> Tuple:
         # Return Value: (Columns, Last Processed Record)
@@ -166,6 +234,40 @@ class Neo4jProxy(BaseProxy):
 
         tbl_col_neo4j_records = self._execute_cypher_query(
             statement=column_level_query, param_dict={'tbl_key': table_uri})
+        cols, last_neo4j_record = self._make_columns(tbl_col_neo4j_records)
+
+        if not cols:
+            raise NotFoundException('Table URI( {table_uri} ) does not exist'.format(table_uri=table_uri))
+
+        return cols, last_neo4j_record
+
+    @timer_with_counter
+    def _exec_bulk_col_query(self, table_uris: List[str]) -> Dict[str, Tuple]:
+        # Return Value: (Columns, Last Processed Record) by table URI, of the tables that have columns
+
+        column_level_query = textwrap.dedent("""
+        UNWIND $tbl_keys AS tbl_key
+        MATCH (db:Database)-[:CLUSTER]->(clstr:Cluster)-[:SCHEMA]->(schema:Schema)
+        -[:TABLE]->(tbl:Table {key: tbl_key})-[:COLUMN]->(col:Column)
+        OPTIONAL MATCH (tbl)-[:DESCRIPTION]->(tbl_dscrpt:Description)
+        OPTIONAL MATCH (col:Column)-[:DESCRIPTION]->(col_dscrpt:Description)
+        OPTIONAL MATCH (col:Column)-[:STAT]->(stat:Stat)
+        OPTIONAL MATCH (col:Column)-[:HAS_BADGE]->(badge:Badge)
+        RETURN tbl_key, db, clstr, schema, tbl, tbl_dscrpt, col, col_dscrpt, collect(distinct stat) as col_stats,
+        collect(distinct badge) as col_badges
+        ORDER BY col.sort_order;""")
+
+        tbl_col_neo4j_records = self._execute_cypher_query(
+            statement=column_level_query, param_dict={'tbl_keys': table_uris})
+
+        records_by_table: Dict[str, List] = defaultdict(list)
+        for tbl_col_neo4j_record in tbl_col_neo4j_records:
+            records_by_table[tbl_col_neo4j_record['tbl_key']].append(tbl_col_neo4j_record)
+
+        return {table_uri: self._make_columns(records) for table_uri, records in records_by_table.items()}
+
+    def _make_columns(self, tbl_col_neo4j_records: Iterable) -> Tuple[List[Column], Any]:
+        # Return Value: (Columns, Last Processed Record)
         cols = []
         last_neo4j_record = None
         for tbl_col_neo4j_record in tbl_col_neo4j_records:
@@ -192,9 +294,6 @@ class Neo4jProxy(BaseProxy):
 
             cols.append(col)
 
-        if not cols:
-            raise NotFoundException('Table URI( {table_uri} ) does not exist'.format(table_uri=table_uri))
-
         return sorted(cols, key=lambda item: item.sort_order), last_neo4j_record
 
     @timer_with_counter
@@ -203,18 +302,43 @@ class Neo4jProxy(BaseProxy):
 
         usage_query = textwrap.dedent("""\
         MATCH (user:User)-[read:READ]->(table:Table {key: $tbl_key})
-        RETURN user.email as email, read.read_count as read_count, table.name as table_name
+        RETURN user.email as email, read.read_count as read_count, table.name as table_name, user
         ORDER BY read.read_count DESC LIMIT 5;
         """)
 
-        usage_neo4j_records = self._execute_cypher_query(statement=usage_query,
-                                                         param_dict={'tbl_key': table_uri})
-        readers = []  # type: List[Reader]
-        for usage_neo4j_record in usage_neo4j_records:
-            reader_data = self._get_user_details(user_id=usage_neo4j_record['email'])
-            reader = Reader(user=self._build_user_from_record(record=reader_data),
-                            read_count=usage_neo4j_record['read_count'])
-            readers.append(reader)
+        usage_neo4j_records = list(self._execute_cypher_query(statement=usage_query,
+                                                              param_dict={'tbl_key': table_uri}))
+        users = self._get_users(user_records=[usage_neo4j_record.get('user') or {'email': usage_neo4j_record['email']}
+                                              for usage_neo4j_record in usage_neo4j_records])
+        readers = [Reader(user=user, read_count=usage_neo4j_record['read_count'])
+                   for user, usage_neo4j_record in zip(users, usage_neo4j_records)]  # type: List[Reader]
+
+        return readers
+
+    @timer_with_counter
+    def _exec_bulk_usage_query(self, table_uris: List[str]) -> Dict[str, List[Reader]]:
+        # Return Value: List[Reader] by table URI
+
+        usage_query = textwrap.dedent("""\
+        UNWIND $tbl_keys AS tbl_key
+        MATCH (user:User)-[read:READ]->(table:Table {key: tbl_key})
+        WITH tbl_key, user, read
+        ORDER BY read.read_count DESC
+        WITH tbl_key, collect({email: user.email, read_count: read.read_count, user: user})[..5] as readers
+        RETURN tbl_key, readers
+        """)
+
+        usage_neo4j_records = [(record['tbl_key'], reader)
+                               for record in self._execute_cypher_query(statement=usage_query,
+                                                                        param_dict={'tbl_keys': table_uris})
+                               for reader in record['readers']]
+        # the readers of all the tables are resolved at once
+        users = self._get_users(user_records=[reader.get('user') or {'email': reader['email']}
+                                              for _, reader in usage_neo4j_records])
+
+        readers: Dict[str, List[Reader]] = defaultdict(list)
+        for user, (table_uri, reader) in zip(users, usage_neo4j_records):
+            readers[table_uri].append(Reader(user=user, read_count=reader['read_count']))
 
         return readers
 
@@ -255,8 +379,49 @@ class Neo4jProxy(BaseProxy):
                                                    param_dict={'tbl_key': table_uri,
                                                                'tag_normal_type': 'default'})
 
-        table_records = table_records.single()
+        return self._make_table_level(table_records.single())
+
+    @timer_with_counter
+    def _exec_bulk_table_query(self, table_uris: List[str]) -> Dict[str, Tuple]:
+        """
+        Queries the same Cypher record as _exec_table_query for every table.
+        """
 
+        table_level_query = textwrap.dedent("""\
+        UNWIND $tbl_keys AS tbl_key
+        MATCH (tbl:Table {key: tbl_key})
+        OPTIONAL MATCH (wmk:Watermark)-[:BELONG_TO_TABLE]->(tbl)
+        OPTIONAL MATCH (app_producer:Application)-[:GENERATES]->(tbl)
+        OPTIONAL MATCH (app_consumer:Application)-[:CONSUMES]->(tbl)
+        OPTIONAL MATCH (tbl)-[:LAST_UPDATED_AT]->(t:Timestamp)
+        OPTIONAL MATCH (owner:User)<-[:OWNER]-(tbl)
+        OPTIONAL MATCH (tbl)-[:TAGGED_BY]->(tag:Tag{tag_type: $tag_normal_type})
+        OPTIONAL MATCH (tbl)-[:HAS_BADGE]->(badge:Badge)
+        OPTIONAL MATCH (tbl)-[:SOURCE]->(src:Source)
+        OPTIONAL MATCH (tbl)-[:DESCRIPTION]->(prog_descriptions:Programmatic_Description)
+        OPTIONAL MATCH (tbl)-[:HAS_REPORT]->(resource_reports:Report)
+        RETURN tbl_key,
+        collect(distinct wmk) as wmk_records,
+        collect(distinct app_producer) as producing_apps,
+        collect(distinct app_consumer) as consuming_apps,
+        t.last_updated_timestamp as last_updated_timestamp,
+        collect(distinct owner) as owner_records,
+        collect(distinct tag) as tag_records,
+        collect(distinct badge) as badge_records,
+        src,
+        collect(distinct prog_descriptions) as prog_descriptions,
+        collect(distinct resource_reports) as resource_reports
+        """)
+
+        table_records = self._execute_cypher_query(statement=table_level_query,
+                                                   param_dict={'tbl_keys': table_uris,
+                                                               'tag_normal_type': 'default'})
+
+        return {table_record['tbl_key']: self._make_table_level(table_record) for table_record in table_records}
+
+    def _make_table_level(self, table_records: Any) -> Tuple:
+        # Return Value: (Watermark Results, Table Writer, Table Apps, Last Updated Timestamp, owners, tags, source,
+        # badges, programmatic descriptions, resource reports)
         wmk_results = []
         wmk_records = table_records['wmk_records']
         for record in wmk_records:
@@ -283,11 +448,7 @@ class Neo4jProxy(BaseProxy):
 
         timestamp_value = table_records['last_updated_timestamp']
 
-        owner_record = []
-
-        for owner in table_records.get('owner_records', []):
-            owner_data = self._get_user_details(user_id=owner['email'])
-            owner_record.append(self._build_user_from_record(record=owner_data))
+        owner_record = self._get_users(user_records=table_records.get('owner_records', []))
 
         src = None
 
@@ -366,8 +527,70 @@ class Neo4jProxy(BaseProxy):
 
         query_records = self._execute_cypher_query(statement=table_query_level_query, param_dict={'tbl_key': table_uri})
 
-        table_query_records = query_records.single()
+        return self._make_joins_and_filters(query_records.single())
+
+    @timer_with_counter
+    def _exec_bulk_table_query_query(self, table_uris: List[str]) -> Dict[str, Tuple]:
+        """
+        Queries the same results as _exec_table_query_query for every table, the five most executed joins and filters
+        of each table are kept by slicing its collected results rather than with LIMIT.
+        """
 
+        table_query_level_query = textwrap.dedent("""
+        UNWIND $tbl_keys AS tbl_key
+        MATCH (tbl:Table {key: tbl_key})
+        OPTIONAL MATCH (tbl)-[:COLUMN]->(col:Column)-[COLUMN_JOINS_WITH]->(j:Join)
+        OPTIONAL MATCH (j)-[JOIN_OF_COLUMN]->(col2:Column)
+        OPTIONAL MATCH (j)-[JOIN_OF_QUERY]->(jq:Query)-[:HAS_EXECUTION]->(exec:Execution)
+        WITH tbl_key, tbl, j, col, col2,
+            sum(coalesce(exec.execution_count, 0)) as join_exec_cnt
+        ORDER BY join_exec_cnt desc
+        WITH tbl_key, tbl,
+            COLLECT(DISTINCT {
+            join: {
+                joined_on_table: {
+                    database: case when j.left_table_key = tbl_key
+                              then j.right_database
+                              else j.left_database
+                              end,
+                    cluster: case when j.left_table_key = tbl_key
+                             then j.right_cluster
+                             else j.left_cluster
+                             end,
+                    schema: case when j.left_table_key = tbl_key
+                            then j.right_schema
+                            else j.left_schema
+                            end,
+                    name: case when j.left_table_key = tbl_key
+                          then j.right_table
+                          else j.left_table
+                          end
+                },
+                joined_on_column: col2.name,
+                column: col.name,
+                join_type: j.join_type,
+                join_sql: j.join_sql
+            },
+            join_exec_cnt: join_exec_cnt
+        })[..5] as joins
+        OPTIONAL MATCH (tbl)-[:COLUMN]->(col:Column)-[USES_WHERE_CLAUSE]->(whr:Where)
+        OPTIONAL MATCH (whr)-[WHERE_CLAUSE_OF]->(wq:Query)-[:HAS_EXECUTION]->(whrexec:Execution)
+        WITH tbl_key, joins,
+            whr, sum(coalesce(whrexec.execution_count, 0)) as where_exec_cnt
+        ORDER BY where_exec_cnt desc
+        RETURN tbl_key, joins,
+          COLLECT(DISTINCT {
+            where_clause: whr.where_clause,
+            where_exec_cnt: where_exec_cnt
+          })[..5] as filters
+        """)
+
+        query_records = self._execute_cypher_query(statement=table_query_level_query,
+                                                   param_dict={'tbl_keys': table_uris})
+
+        return {query_record['tbl_key']: self._make_joins_and_filters(query_record) for query_record in query_records}
+
+    def _make_joins_and_filters(self, table_query_records: Any) -> Tuple:
         joins = self._extract_joins_from_query(table_query_records.get('joins', [{}]))
         filters = self._extract_filters_from_query(table_query_records.get('filters', [{}]))
 
@@ -1039,15 +1262,25 @@ class Neo4jProxy(BaseProxy):
 
         For score computation, it uses logarithm on total number of reads so that score won't be affected by small
         number of users reading a lot of times.
+
+        With POPULAR_RESOURCES_PRECOMPUTED, reads the scores databuilder's Neo4jPopularityScoreTask set on resources.
         :return: Iterable of table uri
         """
-        query = textwrap.dedent("""
-        MATCH (resource:{resource_type})-[r:READ_BY]->(u:User)
-        WITH resource.key as resource_key, count(distinct u) as readers, sum(r.read_count) as total_reads
-        WHERE readers >= $num_readers
-        RETURN resource_key, readers, total_reads, (readers * log(total_reads)) as score
-        ORDER BY score DESC LIMIT $num_entries;
-        """).format(resource_type=resource_type.name)
+        if current_app.config['POPULAR_RESOURCES_PRECOMPUTED']:
+            query = textwrap.dedent("""
+            MATCH (resource:{resource_type})
+            WHERE resource.popularity_score IS NOT NULL AND resource.popularity_readers >= $num_readers
+            RETURN resource.key as resource_key, resource.popularity_score as score
+            ORDER BY score DESC LIMIT $num_entries;
+            """).format(resource_type=resource_type.name)
+        else:
+            query = textwrap.dedent("""
+            MATCH (resource:{resource_type})-[r:READ_BY]->(u:User)
+            WITH resource.key as resource_key, count(distinct u) as readers, sum(r.read_count) as total_reads
+            WHERE readers >= $num_readers
+            RETURN resource_key, readers, total_reads, (readers * log(total_reads)) as score
+            ORDER BY score DESC LIMIT $num_entries;
+            """).format(resource_type=resource_type.name)
         LOGGER.info('Querying popular tables URIs')
         num_readers = current_app.config['POPULAR_RESOURCES_MINIMUM_READER_COUNT']
         records = self._execute_cypher_query(statement=query,
@@ -1069,17 +1302,26 @@ class Neo4jProxy(BaseProxy):
         The result of this method will be cached based on the key (num_entries, user_id),
         and the cache will be expired based on _GET_POPULAR_TABLE_CACHE_EXPIRY_SEC
 
+        With POPULAR_RESOURCES_PRECOMPUTED, reads the ranked resource keys databuilder's Neo4jPopularityScoreTask set
+        on the user, whose minimum number of co-readers is the task's minimum_reader_count.
         :return: Iterable of table uri
         """
-        statement = textwrap.dedent("""
-        MATCH (:User {{key:$user_id}})<-[:READ_BY]-(:{resource_type})-[:READ_BY]->
-             (coUser:User)<-[coRead:READ_BY]-(resource:{resource_type})
-        WITH resource.key AS resource_key, count(DISTINCT coUser) AS co_readers,
-             sum(coRead.read_count) AS total_co_reads
-        WHERE co_readers >= $num_readers
-        RETURN resource_key, (co_readers * log(total_co_reads)) AS score
-        ORDER BY score DESC LIMIT $num_entries;
-        """).format(resource_type=resource_type.name)
+        if current_app.config['POPULAR_RESOURCES_PRECOMPUTED']:
+            statement = textwrap.dedent("""
+            MATCH (user:User {{key:$user_id}})
+            UNWIND user.popular_{resource_type_lower}_keys[..$num_entries] AS resource_key
+            RETURN resource_key;
+            """).format(resource_type_lower=resource_type.name.lower())
+        else:
+            statement = textwrap.dedent("""
+            MATCH (:User {{key:$user_id}})<-[:READ_BY]-(:{resource_type})-[:READ_BY]->
+                 (coUser:User)<-[coRead:READ_BY]-(resource:{resource_type})
+            WITH resource.key AS resource_key, count(DISTINCT coUser) AS co_readers,
+                 sum(coRead.read_count) AS total_co_reads
+            WHERE co_readers >= $num_readers
+            RETURN resource_key, (co_readers * log(total_co_reads)) AS score
+            ORDER BY score DESC LIMIT $num_entries;
+            """).format(resource_type=resource_type.name)
         LOGGER.info('Querying popular tables URIs')
         num_readers = current_app.config['POPULAR_RESOURCES_MINIMUM_READER_COUNT']
         records = self._execute_cypher_query(statement=statement,
@@ -1355,6 +1597,27 @@ class Neo4jProxy(BaseProxy):
                           manager_fullname=record.get('manager_fullname', manager_name),
                           other_key_values=other_key_values)
 
+    def _get_users(self, *, user_records: Iterable[Mapping[str, Any]]) -> List[UserEntity]:
+        """
+        Builds users from User node records that came with the resource's own Cypher query, so that readers and owners
+        don't cost a query each. When USER_DETAIL_METHOD is configured, it is called once per distinct email and its
+        results are cached for _GET_USER_DETAILS_CACHE_EXPIRY_SEC.
+        :param user_records: User node properties, each with at least an email
+        :return: a user per record, in the same order
+        """
+        records = [dict(user_record) for user_record in user_records]
+        if not (has_app_context() and current_app.config.get('USER_DETAIL_METHOD')):
+            return [self._build_user_from_record(record=record) for record in records]
+
+        user_details = {}  # type: Dict[str, Dict]
+        for record in records:
+            email = record['email']
+            if email not in user_details:
+                user_details[email] = _USER_DETAILS_CACHE.get(
+                    key=email, createfunc=partial(self._get_user_details, user_id=email, user_data=record))
+
+        return [self._build_user_from_record(record=user_details[record['email']]) for record in records]
+
     @staticmethod
     def _get_user_resource_relationship_clause(relation_type: UserResourceRel, id: str = None,
                                                user_key: str = None,
@@ -1661,11 +1924,7 @@ class Neo4jProxy(BaseProxy):
         if not dashboard_record:
             raise NotFoundException('No dashboard exist with URI: {}'.format(id))
 
-        owners = []
-
-        for owner in dashboard_record.get('owners', []):
-            owner_data = self._get_user_details(user_id=owner['email'], user_data=owner)
-            owners.append(self._build_user_from_record(record=owner_data))
+        owners = self._get_users(user_records=dashboard_record.get('owners', []))
 
         tags = [Tag(tag_type=tag['tag_type'], tag_name=tag['key']) for tag in dashboard_record['tags']]
 
@@ -1919,12 +2178,6 @@ class Neo4jProxy(BaseProxy):
                                                                          text=pg['description']))
         return programmatic_descriptions
 
-    def _create_owners(self, owner_records: List) -> List[User]:
-        owners = []
-        for owner in owner_records:
-            owners.append(User(email=owner['email']))
-        return owners
-
     def _create_app(self, app_record: dict, kind: str) -> Application:
         return Application(
             name=app_record['name'],
@@ -2000,7 +2253,7 @@ class Neo4jProxy(BaseProxy):
 
         programmatic_descriptions = self._create_programmatic_descriptions(feature_records['prog_descriptions'])
 
-        owners = self._create_owners(feature_records['owner_records'])
+        owners = self._get_users(user_records=feature_records['owner_records'])
 
         tags = []
         for record in feature_records.get('tag_records'):
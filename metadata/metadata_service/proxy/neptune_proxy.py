@@ -25,8 +25,8 @@ from ssl_override_server_hostname.ssl_context import \
     OverrideServerHostnameSSLContext
 from tornado import httpclient
 
-from .gremlin_proxy import (AbstractGremlinProxy, FromResultSet,
-                            _parse_gremlin_server_error)
+from .gremlin_proxy import (SCRIPT_QUERY_SUBMISSION, AbstractGremlinProxy,
+                            FromResultSet, _parse_gremlin_server_error)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -114,7 +114,10 @@ class NeptuneGremlinProxy(AbstractGremlinProxy):
                                                                                                  neptune_url=host)
 
         AbstractGremlinProxy.__init__(self, key_property_name='key',
-                                      driver_remote_connection_options=driver_remote_connection_options)
+                                      driver_remote_connection_options=driver_remote_connection_options,
+                                      client_pool_options=client_kwargs.get('client_pool_options', {}),
+                                      query_submission=client_kwargs.get('query_submission',
+                                                                         SCRIPT_QUERY_SUBMISSION))
 
     @classmethod
     @overrides
@@ -25,8 +25,11 @@ rds = ['amundsen-rds==0.0.6',
        'mysqlclient>=1.3.6,<3',
        'sqlalchemy>=1.3.6,<1.4',
        'alembic>=1.2,<2.0']
+redis = ['redis>=3.5.3']
+memcached = ['pymemcache>=3.4.0']
+asgi = ['a2wsgi>=1.4.0', 'uvicorn>=0.15.0']
 
-all_deps = requirements + requirements_common + requirements_dev + oidc + atlas + rds
+all_deps = requirements + requirements_common + requirements_dev + oidc + atlas + rds + redis + memcached + asgi
 
 setup(
     name='amundsen-metadata',
@@ -44,7 +47,10 @@ setup(
         'dev': requirements_dev,
         'atlas': atlas,
         'oidc': oidc,
-        'rds': rds
+        'rds': rds,
+        'redis': redis,
+        'memcached': memcached,
+        'asgi': asgi
     },
     python_requires=">=3.6",
     classifiers=[
@@ -0,0 +1,45 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+from http import HTTPStatus
+
+from amundsen_common.models.table import Column, Table
+
+from tests.unit.api.table.table_test_case import TableTestCase
+
+TABLE_URI = 'hive://gold.hogwarts/wizards'
+MISSING_TABLE_URI = 'hive://gold.hogwarts/muggles'
+
+TABLE = Table(database='hive', cluster='gold', schema='hogwarts', name='wizards',
+              columns=[Column(name='wizard_name', col_type='String', sort_order=0)])
+
+
+class TestTableBatchAPI(TableTestCase):
+    def test_should_get_tables(self) -> None:
+        errors = {MISSING_TABLE_URI: f'Table URI( {MISSING_TABLE_URI} ) does not exist'}
+        self.mock_proxy.get_tables.return_value = ({TABLE_URI: TABLE}, errors)
+
+        response = self.app.test_client().post('/tables',
+                                               json={'table_uris': [TABLE_URI, MISSING_TABLE_URI, TABLE_URI]})
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json['errors'], errors)
+        self.assertEqual(list(response.json['tables']), [TABLE_URI])
+        self.assertEqual(response.json['tables'][TABLE_URI]['name'], 'wizards')
+        self.assertEqual(response.json['tables'][TABLE_URI]['columns'][0]['name'], 'wizard_name')
+        self.mock_proxy.get_tables.assert_called_with(table_uris=[TABLE_URI, MISSING_TABLE_URI])
+
+    def test_should_fail_without_table_uris(self) -> None:
+        for body in [{}, {'table_uris': TABLE_URI}, {'table_uris': [1]}]:
+            response = self.app.test_client().post('/tables', json=body)
+
+            self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.mock_proxy.get_tables.assert_not_called()
+
+    def test_should_fail_with_too_many_table_uris(self) -> None:
+        self.app.config['TABLE_BATCH_MAX_SIZE'] = 1
+
+        response = self.app.test_client().post('/tables', json={'table_uris': [TABLE_URI, MISSING_TABLE_URI]})
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.mock_proxy.get_tables.assert_not_called()
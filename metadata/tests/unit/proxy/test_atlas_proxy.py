@@ -15,7 +15,9 @@ from amundsen_common.models.table import (Badge, Column,
                                           ProgrammaticDescription, Reader,
                                           ResourceReport, Stat, Table, User)
 from amundsen_common.utils.atlas import AtlasCommonParams, AtlasCommonTypes
-from apache_atlas.model.instance import AtlasRelatedObjectId
+from apache_atlas.model.instance import (AtlasEntitiesWithExtInfo,
+                                         AtlasEntityWithExtInfo,
+                                         AtlasRelatedObjectId)
 from apache_atlas.model.relationship import AtlasRelationship
 from apache_atlas.utils import type_coerce
 from werkzeug.exceptions import BadRequest
@@ -196,6 +198,33 @@ class TestAtlasProxy(unittest.TestCase, Data):
             self.proxy.client.entity.get_entity_by_attribute = MagicMock(return_value=unique_attr_response)
             self.proxy.get_table(table_uri=cast(str, self.table_uri))
 
+    def test_get_tables(self) -> None:
+        ent_attrs = cast(dict, self.entity1['attributes'])
+        self._create_mocked_report_entities_collection()
+        for report, report_entity in zip(ent_attrs['reports'], self.report_entity_collection.entities):
+            report_entity.guid = report['guid']
+        self.proxy.client.entity.get_entities_by_guids = MagicMock(return_value=self.report_entity_collection)
+        self.proxy._get_owners = MagicMock(return_value=[User(email=ent_attrs['owner'])])  # type: ignore
+        referred_entities = {self.test_column['guid']: self.test_column}
+        table_uri = f'{self.entity_type}://{self.cluster}.{self.db}/{ent_attrs["name"]}'
+
+        self.proxy.client.entity.get_entity_by_attribute = MagicMock(
+            return_value=AtlasEntityWithExtInfo({'entity': self.entity1, 'referredEntities': referred_entities}))
+        expected = self.proxy.get_table(table_uri=table_uri)
+
+        self.proxy.client.entity.get_entities_by_guids.reset_mock()
+        self.proxy.client.entity.get_entities_by_attribute = MagicMock(
+            return_value=AtlasEntitiesWithExtInfo({'entities': [self.entity1, self.entity2],
+                                                   'referredEntities': referred_entities}))
+        missing_uri = f'{self.entity_type}://{self.cluster}.{self.db}/missing'
+        tables, errors = self.proxy.get_tables(table_uris=[table_uri, missing_uri])
+
+        self.assertEqual(str(tables), str({table_uri: expected}))
+        self.assertEqual(len(expected.resource_reports), 2)
+        self.assertEqual(errors, {missing_uri: f'Table URI( {missing_uri} ) does not exist'})
+        self.proxy.client.entity.get_entities_by_attribute.assert_called_once()
+        self.proxy.client.entity.get_entities_by_guids.assert_called_once()
+
     def test_get_popular_tables(self) -> None:
         ent1 = self.to_class(self.entity1)
         ent2 = self.to_class(self.entity2)
@@ -817,6 +846,14 @@ class TestAtlasProxy(unittest.TestCase, Data):
         self.assertIsInstance(result, Lineage)
         self.assertEqual(expected, result)
 
+    def test_find_levels(self) -> None:
+        # diamond with a shortcut to d and an unreachable e
+        graph = {'a': {'b', 'c', 'd'}, 'b': {'d'}, 'c': {'d'}, 'd': {'f'}, 'e': {'a'}}
+
+        result = self.proxy._find_levels(graph, 'a')
+
+        self.assertEqual({'a': 0, 'b': 1, 'c': 1, 'd': 1, 'f': 2}, result)
+
     def test_test_get_lineage_table_unimplemented_resource(self) -> None:
         unimplemented_resource_type = ResourceType.Feature
         key = 'hive_table://demo.sample/table_2'
@@ -0,0 +1,86 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from gremlin_python.driver.protocol import GremlinServerError
+
+from metadata_service.proxy.gremlin_proxy import GremlinClientPool
+
+
+class TestGremlinClientPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client_factory = MagicMock(side_effect=lambda: MagicMock())
+        self.pool = GremlinClientPool(client_factory=self.client_factory, size=2, max_age_seconds=100,
+                                      health_check_idle_seconds=10)
+
+    def test_reuses_client(self) -> None:
+        with self.pool.client() as client:
+            first = client
+        with self.pool.client() as client:
+            self.assertIs(client, first)
+
+        self.client_factory.assert_called_once()
+        first.close.assert_not_called()
+
+    def test_closes_clients_over_size(self) -> None:
+        with self.pool.client() as first, self.pool.client() as second, self.pool.client() as third:
+            self.assertEqual(len({id(first), id(second), id(third)}), 3)
+
+        self.assertEqual(self.client_factory.call_count, 3)
+        self.assertEqual(sum(client.close.call_count for client in (first, second, third)), 1)
+
+    def test_replaces_broken_client(self) -> None:
+        with self.assertRaises(ConnectionError):
+            with self.pool.client() as client:
+                broken = client
+                raise ConnectionError()
+        broken.close.assert_called_once()
+
+        with self.pool.client() as client:
+            self.assertIsNot(client, broken)
+
+    def test_keeps_client_on_server_error(self) -> None:
+        with self.assertRaises(GremlinServerError):
+            with self.pool.client() as client:
+                first = client
+                raise GremlinServerError({'code': 500, 'message': 'oops', 'attributes': {}})
+
+        with self.pool.client() as client:
+            self.assertIs(client, first)
+
+    def test_replaces_old_client(self) -> None:
+        with patch('metadata_service.proxy.gremlin_proxy.time.monotonic', return_value=0):
+            with self.pool.client() as client:
+                old = client
+        with patch('metadata_service.proxy.gremlin_proxy.time.monotonic', return_value=101):
+            with self.pool.client() as client:
+                self.assertIsNot(client, old)
+        old.close.assert_called_once()
+
+    def test_health_checks_idle_client(self) -> None:
+        with patch('metadata_service.proxy.gremlin_proxy.time.monotonic', return_value=0):
+            with self.pool.client() as client:
+                healthy = client
+        with patch('metadata_service.proxy.gremlin_proxy.time.monotonic', return_value=11):
+            with self.pool.client() as client:
+                self.assertIs(client, healthy)
+        healthy.submit.assert_called_once_with('g.inject(0)')
+
+        healthy.submit.side_effect = ConnectionError()
+        with patch('metadata_service.proxy.gremlin_proxy.time.monotonic', return_value=22):
+            with self.pool.client() as client:
+                self.assertIsNot(client, healthy)
+        healthy.close.assert_called_once()
+
+    def test_close(self) -> None:
+        with self.pool.client() as first, self.pool.client() as second:
+            pass
+        self.pool.close()
+        first.close.assert_called_once()
+        second.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from amundsen_gremlin.script_translator import (
+    ScriptTranslatorTargetJanusgraph, ScriptTranslatorTargetNeptune)
+from gremlin_python.driver.remote_connection import RemoteConnection
+from gremlin_python.process.anonymous_traversal import traversal
+from gremlin_python.process.graph_traversal import __
+from gremlin_python.process.traversal import (Bytecode, Cardinality, Traverser,
+                                              within)
+
+from metadata_service.proxy.gremlin_proxy import (
+    ClientQueryExecutor, FromResultSet, ParameterizedScriptTranslator)
+
+
+class TestParameterizedScriptTranslator(unittest.TestCase):
+    def setUp(self) -> None:
+        # the translator only reads the name of the traversal source from the remote connection
+        self.g = traversal().withRemote(MagicMock(spec=RemoteConnection, traversal_source='g'))
+
+    def test_translate(self) -> None:
+        query = self.g.V().has('Table', 'key', 'hive://gold.schema/table').outE('COLUMN').inV(). \
+            has('name', within(['a', 'b'])).coalesce(__.values('name'), __.constant(True)).limit(5).valueMap(True)
+
+        script, bindings = ParameterizedScriptTranslator(ScriptTranslatorTargetJanusgraph).translateT(query)
+
+        self.assertEqual(script, 'g.V().has(p0,p1,p2).outE(p3).inV().has(p4,within(p5))'
+                                 '.coalesce(__.values(p4),__.constant(true)).limit(p6).valueMap(true)')
+        self.assertEqual(bindings, {'p0': 'Table', 'p1': 'key', 'p2': 'hive://gold.schema/table', 'p3': 'COLUMN',
+                                    'p4': 'name', 'p5': ['a', 'b'], 'p6': 5})
+
+    def test_translate_is_stable(self) -> None:
+        translator = ParameterizedScriptTranslator(ScriptTranslatorTargetNeptune)
+
+        first, first_bindings = translator.translateT(
+            self.g.V().has('User', 'key', 'foo').property(Cardinality.single, 'updated', datetime(2020, 1, 1)))
+        second, second_bindings = translator.translateT(
+            self.g.V().has('User', 'key', 'bar').property(Cardinality.single, 'updated', datetime(2021, 2, 2)))
+
+        self.assertEqual(first, 'g.V().has(p0,p1,p2).property(single,p3,datetime(p4))')
+        self.assertEqual(first, second)
+        self.assertEqual(first_bindings['p4'], '2020-01-01T00:00:00')
+        self.assertEqual(second_bindings['p2'], 'bar')
+
+
+class TestClientQueryExecutor(unittest.TestCase):
+    def setUp(self) -> None:
+        # the traversals are submitted to the mocked client, not to the remote connection
+        self.g = traversal().withRemote(MagicMock(spec=RemoteConnection, traversal_source='g'))
+        self.client = MagicMock()
+
+    def test_script(self) -> None:
+        self.client.submit.return_value = [[1]]
+        executor = ClientQueryExecutor(client=self.client,
+                                       traversal_translator=ScriptTranslatorTargetNeptune.translateT)
+
+        self.assertEqual(executor(query=self.g.V().count(), get=FromResultSet.getOnly), 1)
+        self.client.submit.assert_called_once_with('g.V().count()', None)
+
+    def test_parameterized_script(self) -> None:
+        self.client.submit.return_value = [[1]]
+        translator = ParameterizedScriptTranslator(ScriptTranslatorTargetNeptune)
+        executor = ClientQueryExecutor(client=self.client, traversal_translator=translator.translateT)
+
+        self.assertEqual(executor(query=self.g.V().hasLabel('Table').count(), get=FromResultSet.getOnly), 1)
+        self.client.submit.assert_called_once_with('g.V().hasLabel(p0).count()', {'p0': 'Table'})
+
+    def test_bytecode(self) -> None:
+        self.client.submit.return_value = [[Traverser('a', 2)], [Traverser('b')]]
+        executor = ClientQueryExecutor(client=self.client, traversal_translator=lambda t: t.bytecode)
+
+        self.assertEqual(executor(query=self.g.V().values('name'), get=FromResultSet.toList), ['a', 'a', 'b'])
+        message = self.client.submit.call_args[0][0]
+        self.assertIsInstance(message, Bytecode)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import unittest
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Iterator, List
 from unittest.mock import MagicMock, patch
 
 from amundsen_common.entity.resource_type import ResourceType
@@ -15,7 +16,10 @@ from amundsen_common.models.table import (Application, Badge, Column,
                                           Tag, User, Watermark)
 from amundsen_common.models.user import User as UserEntity
 from amundsen_rds.models.application import Application as RDSApplication
+from amundsen_rds.models.application import \
+    ApplicationTable as RDSApplicationTable
 from amundsen_rds.models.badge import Badge as RDSBadge
+from amundsen_rds.models.base import Base
 from amundsen_rds.models.cluster import Cluster as RDSCluster
 from amundsen_rds.models.column import \
     ColumnDescription as RDSColumnDescription
@@ -37,15 +41,19 @@ from amundsen_rds.models.dashboard import DashboardUsage as RDSDashboardUsage
 from amundsen_rds.models.database import Database as RDSDatabase
 from amundsen_rds.models.schema import Schema as RDSSchema
 from amundsen_rds.models.table import Table as RDSTable
+from amundsen_rds.models.table import TableBadge as RDSTableBadge
 from amundsen_rds.models.table import TableDescription as RDSTableDescription
+from amundsen_rds.models.table import TableOwner as RDSTableOwner
 from amundsen_rds.models.table import \
     TableProgrammaticDescription as RDSTableProgrammaticDescription
 from amundsen_rds.models.table import TableSource as RDSTableSource
+from amundsen_rds.models.table import TableTag as RDSTableTag
 from amundsen_rds.models.table import TableTimestamp as RDSTableTimestamp
 from amundsen_rds.models.table import TableUsage as RDSTableUsage
 from amundsen_rds.models.table import TableWatermark as RDSTableWatermark
 from amundsen_rds.models.tag import Tag as RDSTag
 from amundsen_rds.models.user import User as RDSUser
+from sqlalchemy import event
 
 from metadata_service import create_app
 from metadata_service.entity.dashboard_detail import DashboardDetail
@@ -140,6 +148,8 @@ class TestMySQLProxy(unittest.TestCase):
         mock_session_query_filter_options = MagicMock()
         mock_session_query_filter.options.return_value = mock_session_query_filter_options
         mock_session_query_filter_options.all.return_value = columns
+        mock_session_query_filter_options.options.return_value = mock_session_query_filter_options
+        mock_session_query_filter_options.first.return_value = table
 
         proxy = MySQLProxy()
         actual_table = proxy.get_table(table_uri='dummy_uri')
@@ -1030,5 +1040,139 @@ class TestMySQLProxy(unittest.TestCase):
         self.assertEqual(1, mock_session_commit.call_count)
 
 
+class TestMySQLProxyQueryCount(unittest.TestCase):
+    """
+    Runs MySQLProxy against an in-memory SQLite database and counts the queries it sends, so that relationships
+    loaded lazily (with a query each) are caught.
+    """
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='metadata_service.config.MySQLConfig')
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+        self.proxy = MySQLProxy()
+        self.engine = self.proxy.client.engine
+
+        # amundsen-rds keys use a MySQL collation, the database is recreated by the next connection
+        event.listen(self.engine, 'connect', self._create_collation)
+        self.engine.dispose()
+        Base.metadata.create_all(self.engine)
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+        self.app_context.pop()
+
+    @staticmethod
+    def _create_collation(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.create_collation('latin1_general_cs', lambda a, b: (a > b) - (a < b))
+
+    def _add(self, *records: Any) -> None:
+        with self.proxy.client.create_session() as session:
+            for record in records:
+                for column in ('published_tag', 'publisher_last_updated_epoch_ms'):
+                    if hasattr(record, column) and getattr(record, column) is None:
+                        setattr(record, column, 0)
+                session.merge(record)
+            session.commit()
+
+    @contextmanager
+    def assertNumQueries(self, num: int) -> Iterator[None]:
+        statements: List[str] = []
+
+        def before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+            statements.append(statement)
+
+        event.listen(self.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            yield
+        finally:
+            event.remove(self.engine, 'before_cursor_execute', before_cursor_execute)
+
+        self.assertEqual(num, len(statements), '\n\n'.join(statements))
+
+    def _add_table(self, table_uri: str) -> None:
+        self._add(RDSDatabase(rk='database://hive', name='hive'),
+                  RDSCluster(rk='hive://gold', name='gold', database_rk='database://hive'),
+                  RDSSchema(rk='hive://gold.foo_schema', name='foo_schema', cluster_rk='hive://gold'),
+                  RDSTable(rk=table_uri, name=table_uri.split('/')[-1], is_view=False,
+                           schema_rk='hive://gold.foo_schema'),
+                  RDSTableDescription(rk=f'{table_uri}/_description', description_source='description',
+                                      description='foo description', table_rk=table_uri),
+                  RDSApplication(rk=f'application://dag/task_id/{table_uri}', application_url='airflow_host',
+                                 name='Airflow', id='dag/task_id', description='DAG generating a table'),
+                  RDSApplicationTable(rk=table_uri, application_rk=f'application://dag/task_id/{table_uri}'),
+                  RDSTableTimestamp(rk=f'{table_uri}/_timestamp', last_updated_timestamp=1, timestamp=1,
+                                    name='last_updated_timestamp', table_rk=table_uri),
+                  RDSTableSource(rk=f'{table_uri}/_source', source_type='github', source='/source_file_loc',
+                                 table_rk=table_uri),
+                  RDSTableWatermark(rk=f'{table_uri}/high_watermark/', partition_key='ds', partition_value='value',
+                                    create_time='time', table_rk=table_uri),
+                  RDSTableProgrammaticDescription(rk=f'{table_uri}/_s3_crawler', description_source='s3_crawler',
+                                                  description='Test', table_rk=table_uri),
+                  RDSColumn(rk=f'{table_uri}/bar_id_1', name='bar_id_1', type='varchar', sort_order=0,
+                            table_rk=table_uri),
+                  RDSColumnDescription(rk=f'{table_uri}/bar_id_1/_description', description_source='description',
+                                       description='bar col description', column_rk=f'{table_uri}/bar_id_1'),
+                  RDSColumnStat(rk=f'{table_uri}/bar_id_1/avg/', stat_type='avg', stat_val='1', start_epoch='1',
+                                end_epoch='1', column_rk=f'{table_uri}/bar_id_1'),
+                  RDSColumn(rk=f'{table_uri}/bar_id_2', name='bar_id_2', type='bigint', sort_order=1,
+                            table_rk=table_uri))
+        for i in range(2):
+            self._add(RDSUser(rk=f'tester_{i}@example.com', email=f'tester_{i}@example.com'),
+                      RDSTableUsage(table_rk=table_uri, user_rk=f'tester_{i}@example.com', read_count=i),
+                      RDSTableOwner(table_rk=table_uri, user_rk=f'tester_{i}@example.com'),
+                      RDSTag(rk=f'tag_{i}', tag_type='default'),
+                      RDSTableTag(table_rk=table_uri, tag_rk=f'tag_{i}'),
+                      RDSBadge(rk=f'badge_{i}', category='table_status'),
+                      RDSTableBadge(table_rk=table_uri, badge_rk=f'badge_{i}'))
+
+    def test_get_table(self) -> None:
+        table_uri = 'hive://gold.foo_schema/foo_table'
+        self._add_table(table_uri)
+
+        # table with its schema, cluster, database and single valued relationships, watermarks, tags, badges,
+        # owners, programmatic descriptions, columns with their descriptions, column stats, column badges, readers
+        with self.assertNumQueries(10):
+            table = self.proxy.get_table(table_uri=table_uri)
+
+        self.assertEqual((table.database, table.cluster, table.schema, table.name),
+                         ('hive', 'gold', 'foo_schema', 'foo_table'))
+        self.assertEqual(table.description, 'foo description')
+        self.assertEqual(table.table_writer, Application(application_url='airflow_host', description='DAG generating '
+                                                         'a table', name='Airflow', id='dag/task_id'))
+        self.assertEqual(table.last_updated_timestamp, 1)
+        self.assertEqual(table.source, Source(source='/source_file_loc', source_type='github'))
+        self.assertEqual(table.watermarks, [Watermark(watermark_type='high_watermark', partition_key='ds',
+                                                      partition_value='value', create_time='time')])
+        self.assertEqual(table.programmatic_descriptions, [ProgrammaticDescription(source='s3_crawler', text='Test')])
+        self.assertEqual(table.tags, [Tag(tag_name='tag_0', tag_type='default'),
+                                      Tag(tag_name='tag_1', tag_type='default')])
+        self.assertEqual(table.badges, [Badge(badge_name='badge_0', category='table_status'),
+                                        Badge(badge_name='badge_1', category='table_status')])
+        self.assertEqual(table.owners, [User(email='tester_0@example.com'), User(email='tester_1@example.com')])
+        self.assertEqual(table.table_readers, [Reader(user=User(email='tester_0@example.com'), read_count=0),
+                                               Reader(user=User(email='tester_1@example.com'), read_count=1)])
+        self.assertEqual(table.columns, [
+            Column(name='bar_id_1', description='bar col description', col_type='varchar', sort_order=0,
+                   stats=[Stat(stat_type='avg', stat_val='1', start_epoch=1, end_epoch=1)], badges=[]),
+            Column(name='bar_id_2', description=None, col_type='bigint', sort_order=1, stats=[], badges=[])
+        ])
+
+    def test_get_tables(self) -> None:
+        table_uris = ['hive://gold.foo_schema/foo_table', 'hive://gold.foo_schema/bar_table']
+        for table_uri in table_uris:
+            self._add_table(table_uri)
+        expected = {table_uri: self.proxy.get_table(table_uri=table_uri) for table_uri in table_uris}
+
+        # the same queries as get_table, for all the tables
+        with self.assertNumQueries(10):
+            tables, errors = self.proxy.get_tables(table_uris=table_uris + ['hive://gold.foo_schema/missing'])
+
+        self.assertEqual(tables, expected)
+        self.assertEqual(errors, {'hive://gold.foo_schema/missing': 'Table URI( hive://gold.foo_schema/missing ) does '
+                                                                    'not exist'})
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,7 @@
 
 import copy
 import textwrap
+import threading
 import unittest
 from collections import namedtuple
 from typing import Any, Dict  # noqa: F401
@@ -22,6 +23,7 @@ from amundsen_common.models.table import (Application, Badge, Column,
                                           SqlWhere, Stat, Table, TableSummary,
                                           Tag, User, Watermark)
 from amundsen_common.models.user import User as UserModel
+from flask import has_app_context
 from neo4j import GraphDatabase
 
 from metadata_service import create_app
@@ -29,7 +31,7 @@ from metadata_service.entity.dashboard_detail import DashboardDetail
 from metadata_service.entity.dashboard_query import DashboardQuery
 from metadata_service.entity.tag_detail import TagDetail
 from metadata_service.exception import NotFoundException
-from metadata_service.proxy.neo4j_proxy import Neo4jProxy
+from metadata_service.proxy.neo4j_proxy import _USER_DETAILS_CACHE, Neo4jProxy
 from metadata_service.util import UserResourceRel
 
 
@@ -298,6 +300,108 @@ class TestNeo4jProxy(unittest.TestCase):
 
             self.assertEqual(str(expected), str(table))
 
+    def test_get_table_concurrent_sub_queries(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.side_effect = [
+                self.col_usage_return_value,
+                [],
+                self.table_level_return_value,
+                self.table_common_usage,
+                []
+            ]
+            expected = Neo4jProxy(host='DOES_NOT_MATTER', port=0000).get_table(table_uri='dummy_uri')
+
+        # every sub-query waits for all the others to start
+        barrier = threading.Barrier(4, timeout=5)
+        app_contexts = []
+
+        def execute_cypher_query(*, statement: str, param_dict: Dict[str, Any]) -> Any:
+            app_contexts.append(has_app_context())
+            barrier.wait()
+            if 'col.sort_order' in statement:
+                return self.col_usage_return_value
+            if 'read.read_count' in statement:
+                return []
+            if 'join_exec_cnt' in statement:
+                return self.table_common_usage
+            return self.table_level_return_value
+
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.side_effect = execute_cypher_query
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000, client_kwargs={'get_table_max_workers': 4})
+            table = neo4j_proxy.get_table(table_uri='dummy_uri')
+
+        self.assertEqual(str(expected), str(table))
+        self.assertEqual(app_contexts, [True] * 4)
+
+    def test_get_tables(self) -> None:
+        reader = {'key': 'reader@example.com', 'email': 'reader@example.com'}
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.side_effect = [
+                self.col_usage_return_value,
+                [{'email': 'reader@example.com', 'read_count': 10, 'table_name': 'foo_table', 'user': reader}],
+                self.table_level_return_value,
+                self.table_common_usage
+            ]
+            neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+            expected = neo4j_proxy.get_table(table_uri='dummy_uri')
+
+            # the records of every table are returned by the same four queries
+            mock_execute.side_effect = [
+                [dict(col, tbl_key='dummy_uri') for col in self.col_usage_return_value],
+                [{'tbl_key': 'dummy_uri', 'readers': [{'email': 'reader@example.com', 'read_count': 10,
+                                                       'user': reader}]}],
+                [dict(self.table_level_return_value.single.return_value, tbl_key='dummy_uri')],
+                [dict(self.table_common_usage.single.return_value, tbl_key='dummy_uri')]
+            ]
+            tables, errors = neo4j_proxy.get_tables(table_uris=['dummy_uri', 'missing_uri'])
+
+        self.assertEqual(mock_execute.call_count, 8)
+        self.assertEqual(mock_execute.call_args[1]['param_dict'], {'tbl_keys': ['dummy_uri', 'missing_uri']})
+        self.assertEqual(tables, {'dummy_uri': expected})
+        self.assertEqual(errors, {'missing_uri': 'Table URI( missing_uri ) does not exist'})
+
+    def test_get_table_readers_and_owners(self) -> None:
+        reader = {'key': 'reader@example.com', 'email': 'reader@example.com', 'full_name': 'Reader'}
+        usage_return_value = [{'email': 'reader@example.com', 'read_count': 10, 'table_name': 'foo_table',
+                               'user': reader},
+                              {'email': 'tester@example.com', 'read_count': 5, 'table_name': 'foo_table',
+                               'user': {'key': 'tester@example.com', 'email': 'tester@example.com'}}]
+
+        user_detail_method = MagicMock(side_effect=lambda user_id: {'email': user_id, 'user_id': user_id,
+                                                                    'full_name': user_id.split('@')[0]})
+        self.app.config['USER_DETAIL_METHOD'] = user_detail_method
+        _USER_DETAILS_CACHE.clear()
+        try:
+            with patch.object(GraphDatabase, 'driver'), \
+                    patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+                mock_execute.side_effect = [self.col_usage_return_value, usage_return_value,
+                                            self.table_level_return_value, self.table_common_usage,
+                                            self.col_usage_return_value, usage_return_value,
+                                            self.table_level_return_value, self.table_common_usage]
+                neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+                table = neo4j_proxy.get_table(table_uri='dummy_uri')
+                neo4j_proxy.get_table(table_uri='dummy_uri')
+        finally:
+            self.app.config['USER_DETAIL_METHOD'] = None
+            _USER_DETAILS_CACHE.clear()
+
+        self.assertEqual([(r.user.email, r.user.full_name, r.read_count) for r in table.table_readers],
+                         [('reader@example.com', 'reader', 10), ('tester@example.com', 'tester', 5)])
+        self.assertEqual([(o.email, o.full_name) for o in table.owners], [('tester@example.com', 'tester')])
+        # once per distinct user, and not again for the second table
+        self.assertEqual(sorted(call[0][0] for call in user_detail_method.call_args_list),
+                         ['reader@example.com', 'tester@example.com'])
+
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.side_effect = [self.col_usage_return_value, usage_return_value,
+                                        self.table_level_return_value, self.table_common_usage]
+            table = Neo4jProxy(host='DOES_NOT_MATTER', port=0000).get_table(table_uri='dummy_uri')
+
+        # without USER_DETAIL_METHOD the user nodes returned by the queries are used
+        self.assertEqual([(r.user.email, r.user.full_name) for r in table.table_readers],
+                         [('reader@example.com', 'Reader'), ('tester@example.com', None)])
+
     def test_get_table_view_only(self) -> None:
         col_usage_return_value = copy.deepcopy(self.col_usage_return_value)
         for col in col_usage_return_value:
@@ -730,6 +834,29 @@ class TestNeo4jProxy(unittest.TestCase):
 
             self.assertEqual(actual.__repr__(), expected.__repr__())
 
+    def test_get_popular_resources_uris_precomputed(self) -> None:
+        self.app.config['POPULAR_RESOURCES_PRECOMPUTED'] = True
+        try:
+            with patch.object(GraphDatabase, 'driver'), \
+                    patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+                mock_execute.return_value = [{'resource_key': 'foo'}, {'resource_key': 'bar'}]
+                neo4j_proxy = Neo4jProxy(host='DOES_NOT_MATTER', port=0000)
+
+                self.assertEqual(neo4j_proxy._get_global_popular_resources_uris(7, ResourceType.Dashboard),
+                                 ['foo', 'bar'])
+                statement = mock_execute.call_args[1]['statement']
+                self.assertIn('MATCH (resource:Dashboard)', statement)
+                self.assertIn('ORDER BY score DESC', statement)
+                self.assertNotIn('READ_BY', statement)
+
+                self.assertEqual(neo4j_proxy._get_personal_popular_resources_uris(7, 'precomputed_id'),
+                                 ['foo', 'bar'])
+                statement = mock_execute.call_args[1]['statement']
+                self.assertIn('UNWIND user.popular_table_keys[..$num_entries] AS resource_key', statement)
+                self.assertEqual(mock_execute.call_args[1]['param_dict']['user_id'], 'precomputed_id')
+        finally:
+            self.app.config['POPULAR_RESOURCES_PRECOMPUTED'] = False
+
     def test_get_popular_resources_table(self) -> None:
         with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_get_popular_tables') as mock_execute:
             mock_execute.return_value = [
@@ -1403,7 +1530,7 @@ class TestNeo4jProxy(unittest.TestCase):
                                feature_group='test_feature_group', entity='test_entity',
                                data_type='bigint', availability=['hive', 'dynamodb'],
                                description='test feature description',
-                               owners=[User(email='tester@example.com')],
+                               owners=[User(email='tester@example.com', user_id='tester@example.com')],
                                badges=[Badge(badge_name='pii', category='data')],
                                tags=[Tag(tag_name='test', tag_type='default')],
                                programmatic_descriptions=[
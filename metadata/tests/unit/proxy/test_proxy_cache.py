@@ -0,0 +1,202 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import unittest
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+from amundsen_common.entity.resource_type import ResourceType
+from amundsen_common.models.table import Column, Table
+from neo4j import GraphDatabase
+from pymemcache.test.utils import MockMemcacheClient
+
+from metadata_service import config, create_app
+from metadata_service.entity.tag_detail import TagDetail
+from metadata_service.proxy import cache
+from metadata_service.proxy.cache.local_cache import LocalLRUCache
+from metadata_service.proxy.cache.memcached_cache import MemcachedCache
+from metadata_service.proxy.cache.redis_cache import RedisCache
+from metadata_service.proxy.neo4j_proxy import Neo4jProxy
+from metadata_service.proxy.statsd_utilities import timer_with_counter
+from metadata_service.util import UserResourceRel
+
+
+class CountingProxy(Neo4jProxy):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.reads = 0
+
+    @timer_with_counter
+    def get_table(self, *, table_uri: str) -> Table:
+        self.reads += 1
+        return Table(database='hive', cluster='gold', schema='schema', name=table_uri.rsplit('/', 1)[-1],
+                     description=f'read {self.reads}', columns=[Column(name='col', col_type='int', sort_order=0)])
+
+    @timer_with_counter
+    def get_tables(self, *, table_uris: List[str]) -> Tuple[Dict[str, Table], Dict[str, str]]:
+        self.reads += 1
+        return {}, {}
+
+    @timer_with_counter
+    def get_column_description(self, *, table_uri: str, column_name: str) -> Optional[str]:
+        self.reads += 1
+        return None
+
+    @timer_with_counter
+    def get_tags(self) -> List:
+        self.reads += 1
+        return [TagDetail(tag_name='tag', tag_count=self.reads)]
+
+    @timer_with_counter
+    def put_table_description(self, *, table_uri: str, description: str) -> None:
+        pass
+
+    @timer_with_counter
+    def put_column_description(self, *, table_uri: str, column_name: str, description: str) -> None:
+        pass
+
+    @timer_with_counter
+    def add_tag(self, *, id: str, tag: str, tag_type: str = 'default',
+                resource_type: ResourceType = ResourceType.Table) -> None:
+        raise Exception('failed')
+
+
+class TestProxyCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='metadata_service.config.LocalConfig')
+        self.app.config[config.PROXY_CACHE] = config.PROXY_CACHES['LOCAL']
+        self.app.config[config.PROXY_CACHE_KWARGS] = {'max_size': 16}
+        self.app.config[config.PROXY_CACHE_TTL_SEC] = {'get_table': 60, 'get_tables': 60,
+                                                       'get_column_description': 60, 'get_tags': 60}
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        cache._proxy_cache = None
+
+        with patch.object(GraphDatabase, 'driver'):
+            self.proxy = CountingProxy(host='DOES_NOT_MATTER', port=0000)
+
+    def tearDown(self) -> None:
+        cache._proxy_cache = None
+        self.app_context.pop()
+
+    def test_cached_read(self) -> None:
+        statsd_client = MagicMock()
+        with patch('metadata_service.proxy.cache._get_statsd_client', return_value=statsd_client):
+            first = self.proxy.get_table(table_uri='hive://gold.schema/foo')
+            second = self.proxy.get_table(table_uri='hive://gold.schema/foo')
+            self.proxy.get_table(table_uri='hive://gold.schema/bar')
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.proxy.reads, 2)
+        self.assertEqual([call[0][0] for call in statsd_client.incr.call_args_list],
+                         ['get_table.cache_miss', 'get_table.cache_hit', 'get_table.cache_miss'])
+
+    def test_cached_as_json(self) -> None:
+        table = self.proxy.get_table(table_uri='hive://gold.schema/foo')
+        value = cache.get_proxy_cache().get('amundsen_metadata:get_table:table_uri=hive://gold.schema/foo')
+
+        self.assertEqual(json.loads(value)['columns'][0]['name'], 'col')
+        self.assertEqual(self.proxy.get_table(table_uri='hive://gold.schema/foo'), table)
+
+        # None is cached too
+        self.assertIsNone(self.proxy.get_column_description(table_uri='hive://gold.schema/foo', column_name='col'))
+        self.assertIsNone(self.proxy.get_column_description(table_uri='hive://gold.schema/foo', column_name='col'))
+        self.assertEqual(self.proxy.reads, 2)
+
+    def test_get_tables_not_cached(self) -> None:
+        self.proxy.get_tables(table_uris=['hive://gold.schema/foo'])
+        self.proxy.get_tables(table_uris=['hive://gold.schema/foo'])
+        self.assertEqual(self.proxy.reads, 2)
+
+    def test_not_cached_without_ttl(self) -> None:
+        self.app.config[config.PROXY_CACHE_TTL_SEC] = {}
+        self.proxy.get_table(table_uri='hive://gold.schema/foo')
+        self.proxy.get_table(table_uri='hive://gold.schema/foo')
+        self.assertEqual(self.proxy.reads, 2)
+
+    def test_writes_invalidate(self) -> None:
+        self.proxy.get_table(table_uri='hive://gold.schema/foo')
+        self.proxy.put_table_description(table_uri='hive://gold.schema/foo', description='new')
+        self.proxy.get_table(table_uri='hive://gold.schema/foo')
+        self.assertEqual(self.proxy.reads, 2)
+
+        # even when the write fails
+        with self.assertRaises(Exception):
+            self.proxy.add_tag(id='hive://gold.schema/foo', tag='tag', tag_type='default',
+                               resource_type=ResourceType.Table)
+        self.proxy.get_table(table_uri='hive://gold.schema/foo')
+        self.assertEqual(self.proxy.reads, 3)
+
+    def test_column_and_tag_writes_invalidate(self) -> None:
+        self.proxy.get_column_description(table_uri='hive://gold.schema/foo', column_name='col')
+        self.proxy.put_column_description(table_uri='hive://gold.schema/foo', column_name='col', description='new')
+        self.proxy.get_column_description(table_uri='hive://gold.schema/foo', column_name='col')
+        self.assertEqual(self.proxy.reads, 2)
+
+        self.proxy.get_tags()
+        with self.assertRaises(Exception):
+            self.proxy.add_tag(id='hive://gold.schema/foo', tag='tag', tag_type='default',
+                               resource_type=ResourceType.Table)
+        self.assertEqual(self.proxy.get_tags()[0].tag_count, 4)
+
+    def test_owner_invalidations(self) -> None:
+        self.assertIn(('get_table_by_user_relation', {'user_email': 'foo@bar', 'relation_type': UserResourceRel.own}),
+                      cache.INVALIDATIONS['add_owner']({'table_uri': 'hive://gold.schema/foo', 'owner': 'foo@bar'}))
+        self.assertIn(('get_dashboard_by_user_relation',
+                       {'user_email': 'foo@bar', 'relation_type': UserResourceRel.own}),
+                      cache.INVALIDATIONS['add_resource_owner']({'uri': 'dashboard://foo', 'owner': 'foo@bar',
+                                                                 'resource_type': ResourceType.Dashboard}))
+
+    def test_cache_failure(self) -> None:
+        cache._proxy_cache = MagicMock()
+        cache._proxy_cache.get.side_effect = ConnectionError()
+
+        self.assertEqual(self.proxy.get_table(table_uri='hive://gold.schema/foo').name, 'foo')
+
+    def test_cache_key(self) -> None:
+        self.assertEqual(cache.cache_key('get_resource_description',
+                                         {'uri': 'dashboard://foo', 'resource_type': ResourceType.Dashboard}),
+                         'amundsen_metadata:get_resource_description:resource_type=Dashboard,uri=dashboard://foo')
+
+
+class TestCaches(unittest.TestCase):
+    def _test_cache(self, proxy_cache: cache.BaseCache) -> None:
+        self.assertIsNone(proxy_cache.get('foo'))
+        proxy_cache.set('foo', b'foo', 60)
+        proxy_cache.set('bar', b'bar', 60)
+        self.assertEqual(proxy_cache.get('foo'), b'foo')
+        proxy_cache.delete(['foo', 'baz'])
+        self.assertIsNone(proxy_cache.get('foo'))
+        self.assertEqual(proxy_cache.get('bar'), b'bar')
+
+    def test_local_lru_cache(self) -> None:
+        proxy_cache = LocalLRUCache(max_size=2)
+        self._test_cache(proxy_cache)
+
+        proxy_cache.set('foo', b'foo', 60)
+        proxy_cache.get('bar')
+        proxy_cache.set('baz', b'baz', 60)
+        # foo is the least recently used
+        self.assertIsNone(proxy_cache.get('foo'))
+        self.assertEqual(proxy_cache.get('bar'), b'bar')
+
+        with patch('metadata_service.proxy.cache.local_cache.time.monotonic', return_value=float('inf')):
+            self.assertIsNone(proxy_cache.get('bar'))
+
+    def test_redis_cache(self) -> None:
+        with patch('metadata_service.proxy.cache.redis_cache.Redis', fakeredis.FakeRedis):
+            proxy_cache = RedisCache(url='redis://localhost:6379/0')
+        self._test_cache(proxy_cache)
+
+    def test_memcached_cache(self) -> None:
+        with patch('metadata_service.proxy.cache.memcached_cache.HashClient') as hash_client:
+            hash_client.return_value = MockMemcacheClient()
+            proxy_cache = MemcachedCache(servers=['localhost:11211'])
+        hash_client.assert_called_once_with([('localhost', 11211)])
+        self._test_cache(proxy_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
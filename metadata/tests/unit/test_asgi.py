@@ -0,0 +1,49 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import json
+import unittest
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+from amundsen_common.models.api import health_check
+
+
+class AsgiTestCase(unittest.TestCase):
+    """
+    Test the service when served as an ASGI app
+    """
+
+    def _get(self, application: Any, path: str) -> List[Dict[str, Any]]:
+        scope = {'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET', 'scheme': 'http',
+                 'path': path, 'raw_path': path.encode(), 'query_string': b'', 'root_path': '',
+                 'headers': [(b'host', b'localhost')], 'client': ('127.0.0.1', 1234), 'server': ('localhost', 5002)}
+        messages: List[Dict[str, Any]] = []
+
+        async def receive() -> Dict[str, Any]:
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+        async def send(message: Dict[str, Any]) -> None:
+            messages.append(message)
+
+        # asyncio.run is missing from python 3.6
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(application(scope, receive, send))
+        finally:
+            loop.close()
+        return messages
+
+    def test_healthcheck(self) -> None:
+        from metadata_service.metadata_asgi import application
+
+        proxy = MagicMock()
+        proxy.health.return_value = health_check.HealthCheck(status='ok', checks={})
+        with patch('metadata_service.api.healthcheck.get_proxy_client', return_value=proxy):
+            messages = self._get(application, '/healthcheck')
+
+        self.assertEqual(messages[0]['type'], 'http.response.start')
+        self.assertEqual(messages[0]['status'], 200)
+        body = b''.join(message.get('body', b'') for message in messages[1:])
+        self.assertEqual(json.loads(body), {'status': 'ok', 'checks': {}})
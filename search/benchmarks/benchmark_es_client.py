@@ -0,0 +1,108 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+This is a benchmark script comparing the latencies of the /v2/search API when every request creates its own
+Elasticsearch client, as SearchAPI used to do, with the client shared by the process (get_elasticsearch_client).
+
+Elasticsearch is replaced by a local stub server answering every search with no results, which can wait
+connect_delay_ms when accepting a connection to stand in for the TCP/TLS setup with a remote cluster:
+
+    python benchmark_es_client.py [num_requests] [num_threads] [connect_delay_ms]
+"""
+
+import json
+import logging
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import (
+    Any, Callable, List,
+)
+from unittest.mock import patch
+
+from elasticsearch import Elasticsearch
+from flask import Flask
+
+from search_service import create_app, proxy
+
+num_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+num_threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+connect_delay_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+SEARCH_REQUEST = {'query_term': 'test', 'resource_types': ['table'], 'page_index': 0, 'results_per_page': 10,
+                  'filters': []}
+EMPTY_RESPONSE = {'took': 1, 'timed_out': False, '_shards': {'total': 1, 'successful': 1, 'skipped': 0, 'failed': 0},
+                  'hits': {'total': {'value': 0, 'relation': 'eq'}, 'max_score': None, 'hits': []}, 'status': 200}
+
+
+class StubElasticsearchHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        time.sleep(connect_delay_ms / 1000)
+        super().setup()
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        # _msearch sends a header and a body line per search
+        num_searches = len([line for line in body.splitlines() if line.strip()]) // 2
+        self._send({'took': 1, 'responses': [EMPTY_RESPONSE] * num_searches})
+
+    def do_GET(self) -> None:
+        self._send({'version': {'number': '7.13.3'}, 'tagline': 'You Know, for Search'})
+
+    def _send(self, response: Any) -> None:
+        payload = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def run(label: str, app: Flask, get_client: Callable[[], Elasticsearch]) -> None:
+    def run_request(_: int) -> float:
+        start = time.perf_counter()
+        with app.app_context():
+            response = app.test_client().post('/v2/search', json=SEARCH_REQUEST)
+        assert response.status_code == 200, response.data
+        return time.perf_counter() - start
+
+    with patch('search_service.api.search.get_elasticsearch_client', get_client):
+        # warm up
+        run_request(0)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            latencies: List[float] = sorted(executor.map(run_request, range(num_requests)))
+        elapsed = time.perf_counter() - start
+
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f'{label:>18}: {num_requests / elapsed:.0f} requests/sec, p50 {statistics.median(latencies) * 1000:.2f}ms, '
+          f'p99 {p99 * 1000:.2f}ms')
+
+
+if __name__ == '__main__':
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubElasticsearchHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f'http://127.0.0.1:{server.server_address[1]}'
+
+    search_app = create_app(config_module_class='search_service.config.LocalConfig')
+    logging.getLogger('elasticsearch').setLevel(logging.WARNING)
+    search_app.config['PROXY_ENDPOINT'] = endpoint
+    search_app.config['PROXY_CLIENT_KEY'] = None
+    search_app.config['ELASTICSEARCH_MAX_CONNECTIONS'] = num_threads
+
+    run('client per request', search_app, lambda: Elasticsearch(endpoint))
+    run('shared client', search_app, proxy.get_elasticsearch_client)
+
+    server.shutdown()
@@ -0,0 +1,97 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+This is a benchmark script comparing the latencies of the query term of a filtered table search on an index built
+with the prefix subfields of TABLE_INDEX_MAP, with the leading wildcard query of an index built without them.
+
+It loads num_docs tables with random names into two indices of a running Elasticsearch 7, e.g.
+`docker run -p 9200:9200 -e discovery.type=single-node elasticsearch:7.13.3`, then times the queries of
+prefixes of 1 to 6 characters (run it with several num_docs to see how they scale):
+
+    python benchmark_prefix_search.py [elasticsearch_url] [num_docs] [num_queries]
+"""
+
+import json
+import random
+import statistics
+import string
+import sys
+import time
+from typing import (
+    Any, Dict, Iterator, List,
+)
+
+from amundsen_common.models.index_map import TABLE_INDEX_MAP
+from elasticsearch import Elasticsearch
+from elasticsearch.helpers import bulk
+
+from search_service.api.table import TABLE_INDEX
+from search_service.proxy.elasticsearch import ElasticsearchProxy
+
+elasticsearch_url = sys.argv[1] if len(sys.argv) > 1 else 'http://localhost:9200'
+num_docs = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+num_queries = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+
+WORDS = [''.join(random.choices(string.ascii_lowercase, k=random.randint(3, 10))) for _ in range(20000)]
+
+
+def without_prefix_fields(mapping: Any) -> Any:
+    if isinstance(mapping, dict):
+        return {key: without_prefix_fields(value) for key, value in mapping.items()
+                if key != ElasticsearchProxy.PREFIX_SUBFIELD}
+    return mapping
+
+
+def generate_docs(index: str) -> Iterator[Dict[str, Any]]:
+    for i in range(num_docs):
+        yield {
+            '_index': index,
+            '_type': 'table',
+            '_id': str(i),
+            '_source': {
+                'name': '_'.join(random.choices(WORDS, k=3)),
+                'schema': random.choice(WORDS),
+                'description': ' '.join(random.choices(WORDS, k=10)),
+                'column_names': ['_'.join(random.choices(WORDS, k=2)) for _ in range(5)],
+                'column_descriptions': [],
+                'total_usage': random.randint(0, 1000),
+            }
+        }
+
+
+def create_index(client: Elasticsearch, index: str, mapping: Dict[str, Any]) -> None:
+    client.indices.delete(index=index, ignore=[404])
+    client.indices.create(index=index, body=mapping, params={'include_type_name': 'true'})
+    bulk(client, generate_docs(index), chunk_size=5000, request_timeout=120)
+    client.indices.refresh(index=index)
+
+
+def run(client: Elasticsearch, index: str, prefix_fields: bool) -> None:
+    for prefix_length in range(1, 7):
+        latencies: List[float] = []
+        for _ in range(num_queries):
+            query_term = random.choice(WORDS)[:prefix_length]
+            query_string = ElasticsearchProxy.parse_query_term(query_term, TABLE_INDEX, prefix_fields=prefix_fields)
+            body = {'query': {'query_string': {'query': query_string}}, 'size': 10}
+
+            start = time.perf_counter()
+            client.search(index=index, body=body, request_cache=False)
+            latencies.append(time.perf_counter() - start)
+
+        latencies.sort()
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        print(f'{index} prefix of {prefix_length}: p50 {statistics.median(latencies) * 1000:.1f}ms, '
+              f'p99 {p99 * 1000:.1f}ms')
+
+
+if __name__ == '__main__':
+    es = Elasticsearch(elasticsearch_url, timeout=120)
+    table_index_map = json.loads(TABLE_INDEX_MAP)
+
+    create_index(es, 'benchmark_wildcard', without_prefix_fields(table_index_map))
+    create_index(es, 'benchmark_prefix', table_index_map)
+    print(f'{num_docs} tables')
+
+    run(es, 'benchmark_wildcard', prefix_fields=False)
+    run(es, 'benchmark_prefix', prefix_fields=True)
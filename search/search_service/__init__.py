@@ -18,6 +18,7 @@ from search_service.api.dashboard import SearchDashboardAPI, SearchDashboardFilt
 from search_service.api.document import (
     DocumentFeatureAPI, DocumentFeaturesAPI, DocumentTableAPI, DocumentTablesAPI, DocumentUserAPI, DocumentUsersAPI,
 )
+from search_service.api.export import ExportAPI
 from search_service.api.feature import SearchFeatureAPI, SearchFeatureFilterAPI
 from search_service.api.healthcheck import HealthcheckAPI
 from search_service.api.search import SearchAPI
@@ -109,6 +110,9 @@ def create_app(*, config_module_class: str) -> Flask:
     api.add_resource(SearchFeatureAPI, '/search_feature')
     api.add_resource(SearchFeatureFilterAPI, '/search_feature_filter')
 
+    # Export API
+    api.add_resource(ExportAPI, '/export')
+
     # DocumentAPI
     # todo: needs to handle dashboard
     api.add_resource(DocumentTablesAPI, '/document_table')
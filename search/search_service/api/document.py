@@ -13,6 +13,7 @@ from marshmallow.exceptions import ValidationError
 from search_service.api.feature import FEATURE_INDEX
 from search_service.api.table import TABLE_INDEX
 from search_service.api.user import USER_INDEX
+from search_service.exception import BulkWriteException
 from search_service.models.feature import FeatureSchema
 from search_service.models.table import TableSchema
 from search_service.models.user import UserSchema
@@ -41,6 +42,9 @@ class BaseDocumentAPI(Resource):
         try:
             self.proxy.delete_document(data=[document_id], index=args.get('index'))
             return {}, HTTPStatus.OK
+        except BulkWriteException as e:
+            LOGGER.error(str(e))
+            return {'message': str(e), 'failures': e.failures}, HTTPStatus.INTERNAL_SERVER_ERROR
         except RuntimeError as e:
             err_msg = 'Exception encountered while deleting document '
             LOGGER.error(err_msg + str(e))
@@ -75,6 +79,9 @@ class BaseDocumentsAPI(Resource):
 
             results = self.proxy.create_document(data=data, index=args.get('index'))
             return results, HTTPStatus.OK
+        except BulkWriteException as e:
+            LOGGER.error(str(e))
+            return {'message': str(e), 'failures': e.failures}, HTTPStatus.INTERNAL_SERVER_ERROR
         except RuntimeError as e:
             err_msg = 'Exception encountered while updating documents '
             LOGGER.error(err_msg + str(e))
@@ -102,6 +109,9 @@ class BaseDocumentsAPI(Resource):
 
             results = self.proxy.update_document(data=data, index=args.get('index'))
             return results, HTTPStatus.OK
+        except BulkWriteException as e:
+            LOGGER.error(str(e))
+            return {'message': str(e), 'failures': e.failures}, HTTPStatus.INTERNAL_SERVER_ERROR
         except RuntimeError as e:
             err_msg = 'Exception encountered while updating documents '
             LOGGER.error(err_msg + str(e))
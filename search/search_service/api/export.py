@@ -0,0 +1,82 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import logging
+from http import HTTPStatus
+from typing import (
+    Any, Dict, Iterator, Type, Union,
+)
+
+from flasgger import swag_from
+from flask import (
+    Response, current_app, stream_with_context,
+)
+from flask_restful import Resource, reqparse
+from marshmallow import Schema
+
+from search_service import config
+from search_service.api.dashboard import DASHBOARD_INDEX
+from search_service.api.feature import FEATURE_INDEX
+from search_service.api.table import TABLE_INDEX
+from search_service.api.user import USER_INDEX
+from search_service.models.dashboard import DashboardSchema
+from search_service.models.feature import FeatureSchema
+from search_service.models.table import TableSchema
+from search_service.models.user import UserSchema
+from search_service.proxy import get_proxy_client
+
+LOGGER = logging.getLogger(__name__)
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+
+class ExportAPI(Resource):
+    """
+    Export API streams all the documents of an index matching an optional query term, one JSON document per line
+    """
+    SCHEMAS: Dict[str, Type[Schema]] = {
+        TABLE_INDEX: TableSchema,
+        USER_INDEX: UserSchema,
+        DASHBOARD_INDEX: DashboardSchema,
+        FEATURE_INDEX: FeatureSchema,
+    }
+
+    def __init__(self) -> None:
+        self.proxy = get_proxy_client()
+
+        self.parser = reqparse.RequestParser(bundle_errors=True)
+
+        self.parser.add_argument('query_term', required=False, default='', type=str)
+        self.parser.add_argument('index', required=False, default=TABLE_INDEX, type=str)
+
+        super(ExportAPI, self).__init__()
+
+    @swag_from('swagger_doc/export.yml')
+    def get(self) -> Union[Response, Any]:
+        """
+        Streams the documents in chunks of config.SEARCH_EXPORT_CHUNK_SIZE, so that the memory used doesn't grow
+        with the size of the index.
+        :return: NDJSON of the documents, in no particular order
+        """
+        args = self.parser.parse_args(strict=True)
+
+        index = args['index']
+        if index not in self.SCHEMAS:
+            return {'message': f'Export of index {index} is not supported'}, HTTPStatus.BAD_REQUEST
+
+        schema = self.SCHEMAS[index]()
+        chunks = self.proxy.export_documents(index=index,
+                                             query_term=args['query_term'],
+                                             chunk_size=current_app.config[config.SEARCH_EXPORT_CHUNK_SIZE])
+
+        def generate() -> Iterator[str]:
+            try:
+                for chunk in chunks:
+                    yield ''.join(json.dumps(schema.dump(document)) + '\n' for document in chunk)
+            except Exception:
+                # the status is already sent, so a failure can only end the stream early
+                LOGGER.exception(f'Failed to export index {index}')
+                raise
+
+        return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
@@ -11,6 +11,7 @@ from amundsen_common.models.search import SearchRequestSchema, SearchResponseSch
 from flasgger import swag_from
 from flask_restful import Resource, request
 
+from search_service.proxy import get_elasticsearch_client
 from search_service.proxy.es_search_proxy import (
     RESOURCE_STR_MAPPING, ElasticsearchProxy, Resource as AmundsenResource,
 )
@@ -22,7 +23,7 @@ class SearchAPI(Resource):
     """
 
     def __init__(self) -> None:
-        self.search_proxy = ElasticsearchProxy()
+        self.search_proxy = ElasticsearchProxy(client=get_elasticsearch_client())
 
     @swag_from('swagger_doc/search/search.yml')
     def post(self) -> Iterable[Any]:
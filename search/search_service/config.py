@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import os
-from typing import Any, Optional
+from typing import (  # noqa: F401
+    Any, Dict, Optional,
+)
 
 ELASTICSEARCH_INDEX_KEY = 'ELASTICSEARCH_INDEX'
 SEARCH_PAGE_SIZE_KEY = 'SEARCH_PAGE_SIZE'
@@ -13,10 +15,26 @@ PROXY_USER = 'PROXY_USER'
 PROXY_PASSWORD = 'PROXY_PASSWORD'
 PROXY_CLIENT = 'PROXY_CLIENT'
 PROXY_CLIENT_KEY = 'PROXY_CLIENT_KEY'
+ELASTICSEARCH_MAX_CONNECTIONS = 'ELASTICSEARCH_MAX_CONNECTIONS'
+ELASTICSEARCH_TIMEOUT_SEC = 'ELASTICSEARCH_TIMEOUT_SEC'
+ELASTICSEARCH_MAX_RETRIES = 'ELASTICSEARCH_MAX_RETRIES'
+ELASTICSEARCH_SNIFF_ON_START = 'ELASTICSEARCH_SNIFF_ON_START'
+ELASTICSEARCH_SNIFF_ON_CONNECTION_FAIL = 'ELASTICSEARCH_SNIFF_ON_CONNECTION_FAIL'
+ELASTICSEARCH_SNIFFER_TIMEOUT_SEC = 'ELASTICSEARCH_SNIFFER_TIMEOUT_SEC'
+SEARCH_EXPORT_CHUNK_SIZE = 'SEARCH_EXPORT_CHUNK_SIZE'
+SEARCH_CACHE = 'SEARCH_CACHE'
+SEARCH_CACHE_KWARGS = 'SEARCH_CACHE_KWARGS'
+SEARCH_CACHE_TTL_SEC = 'SEARCH_CACHE_TTL_SEC'
+SEARCH_CACHE_ALIAS_CHECK_SEC = 'SEARCH_CACHE_ALIAS_CHECK_SEC'
 PROXY_CLIENTS = {
     'ELASTICSEARCH': 'search_service.proxy.elasticsearch.ElasticsearchProxy'
 }
 
+SEARCH_CACHES = {
+    'LOCAL': 'search_service.proxy.cache.local_cache.LocalLRUCache',
+    'REDIS': 'search_service.proxy.cache.redis_cache.RedisCache'
+}
+
 
 class Config:
     LOG_FORMAT = '%(asctime)s.%(msecs)03d [%(levelname)s] %(module)s.%(funcName)s:%(lineno)d (%(process)d:'\
@@ -32,6 +50,32 @@ class Config:
     # Config used by ElastichSearch
     ELASTICSEARCH_INDEX = 'table_search_index'
 
+    # Settings of the Elasticsearch client shared by all the requests of a process (unless PROXY_CLIENT_KEY is set):
+    # the number of keep-alive connections kept per node, the timeout and retries of every request and
+    # the sniffing of the cluster nodes, see https://elasticsearch-py.readthedocs.io/en/7.x/connection.html
+    ELASTICSEARCH_MAX_CONNECTIONS = int(os.environ.get('ELASTICSEARCH_MAX_CONNECTIONS', 32))
+    ELASTICSEARCH_TIMEOUT_SEC = float(os.environ.get('ELASTICSEARCH_TIMEOUT_SEC', 10))
+    ELASTICSEARCH_MAX_RETRIES = int(os.environ.get('ELASTICSEARCH_MAX_RETRIES', 3))
+    ELASTICSEARCH_SNIFF_ON_START = os.environ.get('ELASTICSEARCH_SNIFF_ON_START', 'false').lower() == 'true'
+    ELASTICSEARCH_SNIFF_ON_CONNECTION_FAIL = \
+        os.environ.get('ELASTICSEARCH_SNIFF_ON_CONNECTION_FAIL', 'false').lower() == 'true'
+    # seconds between periodic sniffs, None to disable them
+    ELASTICSEARCH_SNIFFER_TIMEOUT_SEC = float(os.environ['ELASTICSEARCH_SNIFFER_TIMEOUT_SEC']) \
+        if os.environ.get('ELASTICSEARCH_SNIFFER_TIMEOUT_SEC') else None  # type: Optional[float]
+
+    # number of documents fetched per request, and serialized per chunk of the response, by /export
+    SEARCH_EXPORT_CHUNK_SIZE = int(os.environ.get('SEARCH_EXPORT_CHUNK_SIZE', 1000))
+
+    # Cache of the results of /v2/search, one of SEARCH_CACHES (e.g. SEARCH_CACHES['REDIS']), or None to disable it.
+    # SEARCH_CACHE_KWARGS are passed to it, e.g. {'url': 'redis://localhost:6379/0'} or {'max_size': 1024}
+    SEARCH_CACHE = SEARCH_CACHES[os.environ['SEARCH_CACHE']] \
+        if os.environ.get('SEARCH_CACHE') else None  # type: Optional[str]
+    SEARCH_CACHE_KWARGS: Dict = dict()
+    SEARCH_CACHE_TTL_SEC = int(os.environ.get('SEARCH_CACHE_TTL_SEC', 60))
+    # seconds between the checks of the indices the aliases point to, cached results of a swapped out index
+    # are served for at most that long
+    SEARCH_CACHE_ALIAS_CHECK_SEC = float(os.environ.get('SEARCH_CACHE_ALIAS_CHECK_SEC', 10))
+
     SWAGGER_ENABLED = os.environ.get('SWAGGER_ENABLED', False)
 
 
@@ -117,7 +161,9 @@ class AwsSearchConfig(LocalConfig):
             http_auth=aws_auth,
             use_ssl=use_ssl,
             verify_certs=verify_certs,
-            connection_class=RequestsHttpConnection
+            connection_class=RequestsHttpConnection,
+            timeout=LocalConfig.ELASTICSEARCH_TIMEOUT_SEC,
+            max_retries=LocalConfig.ELASTICSEARCH_MAX_RETRIES
         )
 
         PROXY_CLIENT_KEY = client
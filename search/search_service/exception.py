@@ -1,7 +1,20 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+from typing import (
+    Any, Dict, List,
+)
+
 
 class NotFoundException(Exception):
     def __init__(self, message: str) -> None:
         super().__init__(message)
+
+
+class BulkWriteException(RuntimeError):
+    def __init__(self, message: str, failures: List[Dict[str, Any]]) -> None:
+        """
+        :param failures: the actions that failed, with the id, index, operation, status and error of each
+        """
+        super().__init__(message)
+        self.failures = failures
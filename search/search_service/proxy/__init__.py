@@ -3,6 +3,7 @@
 
 from threading import Lock
 
+from elasticsearch import Elasticsearch
 from flask import current_app
 from werkzeug.utils import import_string
 
@@ -12,9 +13,49 @@ from search_service.proxy.base import BaseProxy
 _proxy_client = None
 _proxy_client_lock = Lock()
 
+_elasticsearch_client = None
+_elasticsearch_client_lock = Lock()
+
 DEFAULT_PAGE_SIZE = 10
 
 
+def get_elasticsearch_client() -> Elasticsearch:
+    """
+    Provides singleton Elasticsearch client based on the config, shared by all the proxies so that every request
+    reuses the keep-alive connections of its pool
+    :return: The client of PROXY_CLIENT_KEY if set, otherwise a client of PROXY_ENDPOINT
+    """
+    global _elasticsearch_client
+
+    if _elasticsearch_client:
+        return _elasticsearch_client
+
+    with _elasticsearch_client_lock:
+        if _elasticsearch_client:
+            return _elasticsearch_client
+
+        client = current_app.config[config.PROXY_CLIENT_KEY]
+
+        if not client:
+            user = current_app.config[config.PROXY_USER]
+            password = current_app.config[config.PROXY_PASSWORD]
+            http_auth = (user, password) if user else None
+
+            client = Elasticsearch(current_app.config[config.PROXY_ENDPOINT],
+                                   http_auth=http_auth,
+                                   maxsize=current_app.config[config.ELASTICSEARCH_MAX_CONNECTIONS],
+                                   timeout=current_app.config[config.ELASTICSEARCH_TIMEOUT_SEC],
+                                   max_retries=current_app.config[config.ELASTICSEARCH_MAX_RETRIES],
+                                   sniff_on_start=current_app.config[config.ELASTICSEARCH_SNIFF_ON_START],
+                                   sniff_on_connection_fail=current_app.config[
+                                       config.ELASTICSEARCH_SNIFF_ON_CONNECTION_FAIL],
+                                   sniffer_timeout=current_app.config[config.ELASTICSEARCH_SNIFFER_TIMEOUT_SEC])
+
+        _elasticsearch_client = client
+
+    return _elasticsearch_client
+
+
 def get_proxy_client() -> BaseProxy:
     """
     Provides singleton proxy client based on the config
@@ -29,7 +70,7 @@ def get_proxy_client() -> BaseProxy:
         if _proxy_client:
             return _proxy_client
         else:
-            obj = current_app.config[config.PROXY_CLIENT_KEY]
+            obj = get_elasticsearch_client()
 
             # Gather all the configuration to create a Proxy Client
             host = current_app.config[config.PROXY_ENDPOINT]
@@ -3,7 +3,7 @@
 
 from abc import ABCMeta, abstractmethod
 from typing import (
-    Any, Dict, List, Union,
+    Any, Dict, Iterator, List, Union,
 )
 
 from amundsen_common.models.api.health_check import HealthCheck
@@ -28,6 +28,17 @@ class BaseProxy(metaclass=ABCMeta):
         """
         return HealthCheck(status='ok', checks={f'{type(self).__name__}:connection': {'status': 'not checked'}})
 
+    @abstractmethod
+    def export_documents(self, *,
+                         index: str,
+                         query_term: str = '',
+                         chunk_size: int = 1000) -> Iterator[List[Any]]:
+        """
+        Walks the documents of the index matching query_term, or all of them when it's empty
+        :return: lists of up to chunk_size documents
+        """
+        pass
+
     @abstractmethod
     def fetch_table_search_results(self, *,
                                    query_term: str,
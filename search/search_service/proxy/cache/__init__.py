@@ -0,0 +1,177 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Caching of search results. Nothing is cached unless config.SEARCH_CACHE is set.
+The key of every result is built from its search request and from:
+ - the indices its aliases point to, resolved at most every config.SEARCH_CACHE_ALIAS_CHECK_SEC seconds, so that
+   the results of an index swapped out by databuilder are no longer served
+ - the generation of the cache, incremented by every write of the document API
+"""
+
+import hashlib
+import json
+import logging
+import time
+from functools import wraps
+from threading import Lock
+from typing import (  # noqa: F401
+    Any, Callable, Dict, List, Mapping, Optional, Tuple,
+)
+
+from amundsen_common.models.search import SearchResponse, SearchResponseSchema
+from elasticsearch import Elasticsearch
+from elasticsearch_dsl.utils import AttrDict, AttrList
+from flask import current_app, has_app_context
+from werkzeug.utils import import_string
+
+from search_service import config
+from search_service.proxy.cache.base_cache import BaseCache
+from search_service.proxy.statsd_utilities import _get_statsd_client
+
+LOGGER = logging.getLogger(__name__)
+
+KEY_PREFIX = 'amundsen_search:'
+GENERATION_KEY = f'{KEY_PREFIX}generation'
+
+_search_cache = None  # type: Optional[BaseCache]
+_search_cache_lock = Lock()
+
+# aliases -> (the indices they point to, when they were resolved)
+_alias_indices = {}  # type: Dict[Tuple[str, ...], Tuple[List[str], float]]
+_alias_indices_lock = Lock()
+
+
+def get_search_cache() -> Optional[BaseCache]:
+    """
+    Provides singleton cache based on the config
+    :return: instance of the config.SEARCH_CACHE subclass of BaseCache, or None when it's not configured
+    """
+    global _search_cache
+
+    if not has_app_context() or not current_app.config.get(config.SEARCH_CACHE):
+        return None
+
+    if _search_cache:
+        return _search_cache
+
+    with _search_cache_lock:
+        if not _search_cache:
+            cache_class = import_string(current_app.config[config.SEARCH_CACHE])
+            _search_cache = cache_class(**current_app.config[config.SEARCH_CACHE_KWARGS])
+
+    return _search_cache
+
+
+def get_alias_indices(client: Elasticsearch, aliases: List[str]) -> List[str]:
+    """
+    :return: the indices the aliases point to, as resolved within the last config.SEARCH_CACHE_ALIAS_CHECK_SEC seconds
+    """
+    aliases_key = tuple(sorted(aliases))
+    check_sec = current_app.config[config.SEARCH_CACHE_ALIAS_CHECK_SEC]
+
+    with _alias_indices_lock:
+        resolved = _alias_indices.get(aliases_key)
+    if resolved and resolved[1] + check_sec > time.monotonic():
+        return resolved[0]
+
+    # a missing alias is reported next to the indices of the others instead of failing the request
+    response = client.indices.get_alias(name=','.join(aliases_key), ignore=[404])
+    indices = sorted(index for index, value in response.items() if isinstance(value, dict) and 'aliases' in value)
+
+    with _alias_indices_lock:
+        _alias_indices[aliases_key] = (indices, time.monotonic())
+    return indices
+
+
+def search_cache_key(request: Mapping[str, Any], indices: List[str], generation: int) -> str:
+    """
+    e.g. amundsen_search:search:5d41402abc4b2a76b9719d911017c592...
+    :param request: the normalized search request, it must be serializable to JSON
+    """
+    payload = json.dumps({'request': request, 'indices': indices, 'generation': generation}, sort_keys=True)
+    return f'{KEY_PREFIX}search:{hashlib.sha256(payload.encode("utf-8")).hexdigest()}'
+
+
+def _json_default(value: Any) -> Any:
+    # document fields of the results are read from elasticsearch_dsl hits
+    if isinstance(value, AttrDict):
+        return value.to_dict()
+    if isinstance(value, AttrList):
+        return list(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def _serialize(response: SearchResponse) -> bytes:
+    return json.dumps(SearchResponseSchema().dump(response), default=_json_default).encode('utf-8')
+
+
+def _deserialize(value: bytes) -> SearchResponse:
+    return SearchResponseSchema().load(json.loads(value))
+
+
+def cached_search(*, client: Elasticsearch, aliases: List[str], request: Mapping[str, Any],
+                  search: Callable[[], SearchResponse]) -> SearchResponse:
+    """
+    Returns the cached result of the same search request when there is one, otherwise the result of search.
+    Emits statsd counters search.cache_hit and search.cache_miss under the prefix of this module.
+    Backend failures are logged and search is called as if there was no cache.
+    :param aliases: the indices searched
+    :param request: the normalized search request, see search_cache_key
+    """
+    cache = get_search_cache()
+    if not cache:
+        return search()
+
+    statsd_client = _get_statsd_client(prefix=__name__)
+    try:
+        key = search_cache_key(request, get_alias_indices(client, aliases), cache.get_counter(GENERATION_KEY))
+        value = cache.get(key)
+        if value is not None:
+            result = _deserialize(value)
+            if statsd_client:
+                statsd_client.incr('search.cache_hit')
+            return result
+    except Exception:
+        LOGGER.exception('Failed to get search results from cache')
+        return search()
+
+    if statsd_client:
+        statsd_client.incr('search.cache_miss')
+    result = search()
+    try:
+        cache.set(key, _serialize(result), current_app.config[config.SEARCH_CACHE_TTL_SEC])
+    except Exception:
+        LOGGER.exception(f'Failed to set {key} in cache')
+    return result
+
+
+def invalidate_search_cache() -> None:
+    """
+    Makes all the cached search results stale, by incrementing the generation of the cache
+    and forgetting the indices the aliases were resolved to.
+    """
+    with _alias_indices_lock:
+        _alias_indices.clear()
+
+    cache = get_search_cache()
+    if cache:
+        try:
+            cache.incr(GENERATION_KEY)
+        except Exception:
+            LOGGER.exception('Failed to invalidate the cached search results')
+
+
+def invalidating_write(f: Callable) -> Callable:
+    """
+    A proxy method decorator that invalidates the cached search results after the write, even if it fails,
+    as it may have been partially applied.
+    """
+    @wraps(f)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return f(*args, **kwargs)
+        finally:
+            invalidate_search_cache()
+
+    return wrapper
@@ -0,0 +1,39 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+from abc import ABCMeta, abstractmethod
+from typing import Optional
+
+
+class BaseCache(metaclass=ABCMeta):
+    """
+    Base Cache, the interface of the stores search results are cached in.
+    Values are serialized search responses, keys are built by search_service.proxy.cache.search_cache_key.
+    Counters never expire, they hold the generation of the cached results.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        :return: the value of key, or None when it's missing or expired
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_sec: int) -> None:
+        pass
+
+    @abstractmethod
+    def get_counter(self, key: str) -> int:
+        """
+        :return: the value of the counter key, 0 when it was never incremented
+        """
+        pass
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """
+        Increments the counter key
+        :return: its new value
+        """
+        pass
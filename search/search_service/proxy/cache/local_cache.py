@@ -0,0 +1,51 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import (
+    Dict, Optional, Tuple,
+)
+
+from search_service.proxy.cache.base_cache import BaseCache
+
+
+class LocalLRUCache(BaseCache):
+    """
+    An in-process cache that evicts the least recently used key beyond max_size keys.
+    Every process has its own, so a document API write only invalidates the cache of the process that served it.
+    """
+
+    def __init__(self, *, max_size: int = 1024) -> None:
+        self._max_size = max_size
+        self._values: 'OrderedDict[str, Tuple[bytes, float]]' = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if key not in self._values:
+                return None
+            value, expires_at = self._values[key]
+            if expires_at <= time.monotonic():
+                del self._values[key]
+                return None
+            self._values.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_sec: int) -> None:
+        with self._lock:
+            self._values[key] = (value, time.monotonic() + ttl_sec)
+            self._values.move_to_end(key)
+            while len(self._values) > self._max_size:
+                self._values.popitem(last=False)
+
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
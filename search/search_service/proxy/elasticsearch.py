@@ -1,10 +1,13 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import logging
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
-    Any, Dict, List, Union,
+    Any, Callable, Dict, Iterable, Iterator, List, Tuple, Union,
 )
 
 from amundsen_common.models.api import health_check
@@ -12,7 +15,9 @@ from amundsen_common.models.index_map import (
     FEATURE_INDEX_MAP, TABLE_INDEX_MAP, USER_INDEX_MAP,
 )
 from elasticsearch import Elasticsearch
-from elasticsearch.exceptions import ConnectionError as ElasticConnectionError, NotFoundError
+from elasticsearch.exceptions import (
+    ConnectionError as ElasticConnectionError, NotFoundError, TransportError,
+)
 from elasticsearch_dsl import Search, query
 from elasticsearch_dsl.utils import AttrDict
 from flask import current_app
@@ -22,6 +27,7 @@ from search_service.api.dashboard import DASHBOARD_INDEX
 from search_service.api.feature import FEATURE_INDEX
 from search_service.api.table import TABLE_INDEX
 from search_service.api.user import USER_INDEX
+from search_service.exception import BulkWriteException
 from search_service.models.dashboard import Dashboard, SearchDashboardResult
 from search_service.models.feature import Feature, SearchFeatureResult
 from search_service.models.search_result import SearchResult
@@ -29,6 +35,7 @@ from search_service.models.table import SearchTableResult, Table
 from search_service.models.tag import Tag
 from search_service.models.user import SearchUserResult, User
 from search_service.proxy.base import BaseProxy
+from search_service.proxy.cache import invalidating_write
 from search_service.proxy.statsd_utilities import timer_with_counter
 
 # Default Elasticsearch index to use, if none specified
@@ -80,6 +87,37 @@ class ElasticsearchProxy(BaseProxy):
         'badges': 'badges'
     }
 
+    # fields matched by the query term of a filtered search
+    QUERY_TERM_FIELDS = {
+        TABLE_INDEX: ['name', 'schema', 'description', 'column_names', 'column_descriptions'],
+        DASHBOARD_INDEX: ['name', 'group_name', 'query_names', 'description', 'tags', 'badges', 'product'],
+        FEATURE_INDEX: ['feature_name', 'feature_group', 'version', 'description', 'status', 'entity', 'badges',
+                        'tags'],
+    }
+
+    # fields with a subfield analyzed into edge n-grams in the index maps of amundsen_common, which match any
+    # prefix of the terms of the field without the term dictionary scan of a leading wildcard
+    PREFIX_SUBFIELD = 'prefix'
+    PREFIX_FIELDS = {
+        TABLE_INDEX: ['name', 'schema', 'column_names'],
+        DASHBOARD_INDEX: ['name', 'group_name', 'query_names'],
+        FEATURE_INDEX: ['feature_name', 'feature_group'],
+    }
+    # how long to remember whether an index maps the prefix subfields, since an index built with a newer
+    # mapping can replace it behind its alias
+    PREFIX_MAPPING_TTL_SEC = 300
+
+    # number of hits fetched per request when walking all the matches of a search with a scroll
+    SCROLL_SIZE = 1000
+
+    # bulk requests of the document API: the most documents and bytes per request, the requests sent at the
+    # same time, and the retries with exponential backoff of the documents rejected with a 429 or 5xx
+    BULK_CHUNK_SIZE = 500
+    BULK_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+    BULK_MAX_WORKERS = 4
+    BULK_MAX_RETRIES = 3
+    BULK_INITIAL_BACKOFF_SEC = 1.0
+
     # special characters we want to escape in filter values. See:
     # https://www.elastic.co/guide/en/elasticsearch/reference/5.5/query-dsl-query-string-query.html#_reserved_characters
     ESCAPE_CHARS = str.maketrans({':': r'\:', '/': r'\/'})
@@ -109,6 +147,9 @@ class ElasticsearchProxy(BaseProxy):
             self.elasticsearch = Elasticsearch(host, http_auth=http_auth)
 
         self.page_size = page_size
+        self._prefix_mappings: Dict[str, Tuple[bool, float]] = {}
+        # alias -> the indices it was last resolved to by the document API
+        self._alias_indices: Dict[str, List[str]] = {}
 
     def health(self) -> health_check.HealthCheck:
         """
@@ -140,7 +181,12 @@ class ElasticsearchProxy(BaseProxy):
                                    "last_name.raw^5",
                                    "first_name^3",
                                    "last_name^3",
-                                   "email^3"],
+                                   "email^3",
+                                   # prefixes of the names, not mapped in indices built with an older mapping
+                                   "full_name.prefix",
+                                   "first_name.prefix",
+                                   "last_name.prefix",
+                                   "email.prefix"],
                         "operator": "and"
                     }
                 }
@@ -249,70 +295,82 @@ class ElasticsearchProxy(BaseProxy):
         if model is None:
             raise Exception('ES Doc model must be provided!')
 
-        results = []
         # Use {page_index} to calculate index of results to fetch from
         if page_index != -1:
             start_from = page_index * self.page_size
             end_at = start_from + self.page_size
-            client = client[start_from:end_at]
-        else:
-            # if page index is -1, return everything
-            client = client[0:client.count()]
+            response = client[start_from:end_at].execute()
+            hits: Iterable[Any] = response
 
-        response = client.execute()
-
-        for hit in response:
-            try:
-                es_metadata = hit.__dict__.get('meta', {})
-                """
-                ES hit example:
-                {
-                    '_d_': {
-                        'name': 'name',
-                        'database': 'database',
-                        'schema': 'schema',
-                        'key': 'database://cluster.schema/name',
-                        'cluster': 'cluster',
-                        'column_descriptions': ['description1', 'description2'],
-                        'column_names': ['colname1', 'colname2'],
-                        'description': None,
-                        'display_name': 'display name',
-                        'last_updated_timestamp': 12345678,
-                        'programmatic_descriptions': [],
-                        'schema_description': None,
-                        'tags': ['tag1', 'tag2'],
-                        'badges': [],
-                        'total_usage': 0
-                    },
-                    'meta': {
-                        'index': 'table index',
-                        'id': 'table id',
-                        'type': 'type'
-                    }
-                }
-                """
-                es_payload = hit.__dict__.get('_d_', {})
-                if not es_payload:
-                    raise Exception('The ES doc not contain required field')
-                result = {}
-                for attr, val in es_payload.items():
-                    if attr in model.get_attrs():
-                        result[attr] = self._get_instance(attr=attr, val=val)
-                result['id'] = self._get_instance(attr='id', val=es_metadata['id'])
-
-                results.append(model(**result))
-            except Exception:
-                LOGGING.exception('The record doesnt contain specified field.')
-
-        # This is to support ESv7.x, and newer version of elasticsearch_dsl
-        if isinstance(response.hits.total, AttrDict):
-            _total = response.hits.total.value
+            # This is to support ESv7.x, and newer version of elasticsearch_dsl
+            if isinstance(response.hits.total, AttrDict):
+                _total = response.hits.total.value
+            else:
+                _total = response.hits.total
         else:
-            _total = response.hits.total
+            # if page index is -1, return everything. The matches are walked with a scroll, as a single
+            # response can't hold more than index.max_result_window of them
+            hits = client.params(preserve_order=True, size=self.SCROLL_SIZE).scan()
+            _total = None
 
-        return search_result_model(total_results=_total,
+        results = []
+        num_hits = 0
+        for hit in hits:
+            num_hits += 1
+            result = self._get_model_from_hit(hit=hit, model=model)
+            if result is not None:
+                results.append(result)
+
+        return search_result_model(total_results=num_hits if _total is None else _total,
                                    results=results)
 
+    def _get_model_from_hit(self, hit: Any, model: Any) -> Any:
+        """
+        :return: the model instance of the hit, None if it doesn't contain its required fields
+        """
+        try:
+            es_metadata = hit.__dict__.get('meta', {})
+            """
+            ES hit example:
+            {
+                '_d_': {
+                    'name': 'name',
+                    'database': 'database',
+                    'schema': 'schema',
+                    'key': 'database://cluster.schema/name',
+                    'cluster': 'cluster',
+                    'column_descriptions': ['description1', 'description2'],
+                    'column_names': ['colname1', 'colname2'],
+                    'description': None,
+                    'display_name': 'display name',
+                    'last_updated_timestamp': 12345678,
+                    'programmatic_descriptions': [],
+                    'schema_description': None,
+                    'tags': ['tag1', 'tag2'],
+                    'badges': [],
+                    'total_usage': 0
+                },
+                'meta': {
+                    'index': 'table index',
+                    'id': 'table id',
+                    'type': 'type'
+                }
+            }
+            """
+            es_payload = hit.__dict__.get('_d_', {})
+            if not es_payload:
+                raise Exception('The ES doc not contain required field')
+            result = {}
+            for attr, val in es_payload.items():
+                if attr in model.get_attrs():
+                    result[attr] = self._get_instance(attr=attr, val=val)
+            result['id'] = self._get_instance(attr='id', val=es_metadata['id'])
+
+            return model(**result)
+        except Exception:
+            LOGGING.exception('The record doesnt contain specified field.')
+            return None
+
     def _get_instance(self, attr: str, val: Any) -> Any:
         if attr in self.TAG_MAPPING:
             # maps a given badge or tag to a tag class
@@ -389,43 +447,63 @@ class ElasticsearchProxy(BaseProxy):
 
         return ' AND '.join(query_list)
 
-    @staticmethod
-    def parse_query_term(query_term: str,
-                         index: str) -> str:
+    @classmethod
+    def parse_query_term(cls, query_term: str,
+                         index: str,
+                         prefix_fields: bool = False) -> str:
+        """
+        Matches the query term, or any term containing it, in the QUERY_TERM_FIELDS of the index.
+        With prefix_fields, the prefix subfields (or a trailing wildcard for the other fields) match the terms
+        starting with the query term instead, without the leading wildcards that indices built with an older
+        mapping need.
+        """
         # TODO: Might be some issue with using wildcard & underscore
         # https://discuss.elastic.co/t/wildcard-search-with-underscore-is-giving-no-result/114010/8
-        if index == TABLE_INDEX:
-            query_term = f'(name:(*{query_term}*) OR name:({query_term}) ' \
-                         f'OR schema:(*{query_term}*) OR schema:({query_term}) ' \
-                         f'OR description:(*{query_term}*) OR description:({query_term}) ' \
-                         f'OR column_names:(*{query_term}*) OR column_names:({query_term}) ' \
-                         f'OR column_descriptions:(*{query_term}*) OR column_descriptions:({query_term}))'
-        elif index == DASHBOARD_INDEX:
-            query_term = f'(name:(*{query_term}*) OR name:({query_term}) ' \
-                         f'OR group_name:(*{query_term}*) OR group_name:({query_term}) ' \
-                         f'OR query_names:(*{query_term}*) OR query_names:({query_term}) ' \
-                         f'OR description:(*{query_term}*) OR description:({query_term}) ' \
-                         f'OR tags:(*{query_term}*) OR tags:({query_term}) ' \
-                         f'OR badges:(*{query_term}*) OR badges:({query_term}) ' \
-                         f'OR product:(*{query_term}*) OR product:({query_term}))'
-        elif index == FEATURE_INDEX:
-            query_term = f'(feature_name:(*{query_term}*) OR feature_name:({query_term}) ' \
-                         f'OR feature_group:(*{query_term}*) OR feature_group:({query_term}) ' \
-                         f'OR version:(*{query_term}*) OR version:({query_term}) ' \
-                         f'OR description:(*{query_term}*) OR description:({query_term}) ' \
-                         f'OR status:(*{query_term}*) OR status:({query_term}) ' \
-                         f'OR entity:(*{query_term}*) OR entity:({query_term}) ' \
-                         f'OR badges:(*{query_term}*) OR badges:({query_term}) ' \
-                         f'OR tags:(*{query_term}*) OR tags:({query_term}))'
-        else:
+        fields = cls.QUERY_TERM_FIELDS.get(index)
+        if fields is None:
             raise Exception(f'index {index} doesnt exist nor support search filter')
-        return query_term
+
+        query_list = []  # type: List[str]
+        for field in fields:
+            if not prefix_fields:
+                query_list.append(f'{field}:(*{query_term}*)')
+            elif field in cls.PREFIX_FIELDS[index]:
+                query_list.append(f'{field}.{cls.PREFIX_SUBFIELD}:({query_term})')
+            else:
+                query_list.append(f'{field}:({query_term}*)')
+            query_list.append(f'{field}:({query_term})')
+
+        return '(' + ' OR '.join(query_list) + ')'
+
+    def has_prefix_fields(self, index: str) -> bool:
+        """
+        Whether the indices behind the index alias map the prefix subfields of PREFIX_FIELDS
+        """
+        now = time.monotonic()
+        cached = self._prefix_mappings.get(index)
+        if cached and now - cached[1] < self.PREFIX_MAPPING_TTL_SEC:
+            return cached[0]
+
+        field = f'{self.PREFIX_FIELDS[index][0]}.{self.PREFIX_SUBFIELD}'
+        try:
+            response = self.elasticsearch.indices.get_field_mapping(fields=field, index=index)
+            # {index: {'mappings': {field: ...}}}, with a level for the document type before ES 7
+            supported = isinstance(response, dict) and len(response) > 0 and all(
+                field in mappings or any(field in type_mappings for type_mappings in mappings.values())
+                for mappings in (index_mappings.get('mappings', {}) for index_mappings in response.values()))
+        except Exception:
+            LOGGING.warning(f'Unable to get the mapping of {field} in {index}', exc_info=True)
+            supported = False
+
+        self._prefix_mappings[index] = (supported, now)
+        return supported
 
     @classmethod
     def convert_query_json_to_query_dsl(self, *,
                                         search_request: dict,
                                         query_term: str,
-                                        index: str) -> str:
+                                        index: str,
+                                        prefix_fields: bool = False) -> str:
         """
         Convert the generic query json to query DSL
         e.g
@@ -454,6 +532,7 @@ class ElasticsearchProxy(BaseProxy):
         :param search_request:
         :param query_term:
         :param index: table_index, dashboard_index
+        :param prefix_fields: whether the index maps the prefix subfields, see parse_query_term
         :return: The search engine query DSL
         """
         filter_list = search_request.get('filters')
@@ -463,7 +542,7 @@ class ElasticsearchProxy(BaseProxy):
             query_dsl = self.parse_filters(filter_list, index)
 
         if query_term:
-            add_query = self.parse_query_term(query_term, index)
+            add_query = self.parse_query_term(query_term, index, prefix_fields=prefix_fields)
 
         if not query_dsl and not add_query:
             raise Exception('Unable to convert parameters to valid query dsl')
@@ -507,10 +586,12 @@ class ElasticsearchProxy(BaseProxy):
             # return empty result for blank query term
             return search_model(total_results=0, results=[])
 
+        prefix_fields = bool(query_term) and self.has_prefix_fields(current_index)
         try:
             query_string = self.convert_query_json_to_query_dsl(search_request=search_request,
                                                                 query_term=query_term,
-                                                                index=current_index)  # type: str
+                                                                index=current_index,
+                                                                prefix_fields=prefix_fields)  # type: str
         except Exception as e:
             LOGGING.exception(e)
             # return nothing if any exception is thrown under the hood
@@ -633,8 +714,46 @@ class ElasticsearchProxy(BaseProxy):
                                    model=Feature,
                                    search_result_model=SearchFeatureResult)
 
+    def export_documents(self, *,
+                         index: str,
+                         query_term: str = '',
+                         chunk_size: int = SCROLL_SIZE) -> Iterator[List[Any]]:
+        """
+        Walks the documents of the index matching query_term, or all of them when it's empty, with a scroll.
+        They come in no particular order, and only one chunk is held in memory at a time whatever the size of
+        the index.
+        :return: lists of up to chunk_size documents, as instances of the model of the index
+        """
+        model = self.get_model_by_index(index)
+        s = Search(using=self.elasticsearch, index=index)
+
+        if query_term:
+            query_builders = {
+                TABLE_INDEX: self.get_table_search_query,
+                USER_INDEX: self.get_user_search_query,
+                DASHBOARD_INDEX: self.get_dashboard_search_query,
+                FEATURE_INDEX: self.get_feature_search_query,
+            }
+            s = s.query(query.Q(query_builders[index](query_term)))
+
+        return self._export_helper(s.params(size=chunk_size), model=model, chunk_size=chunk_size)
+
+    def _export_helper(self, client: Search, model: Any, chunk_size: int) -> Iterator[List[Any]]:
+        chunk = []
+        for hit in client.scan():
+            result = self._get_model_from_hit(hit=hit, model=model)
+            if result is not None:
+                chunk.append(result)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
     # The following methods are related to document API that needs to update
     @timer_with_counter
+    @invalidating_write
     def create_document(self, *, data: Union[List[Table], List[User], List[Feature]], index: str) -> str:
         """
         Creates new index in elasticsearch, then routes traffic to the new index
@@ -651,6 +770,7 @@ class ElasticsearchProxy(BaseProxy):
         return self._create_document_helper(data=data, index=index)
 
     @timer_with_counter
+    @invalidating_write
     def update_document(self, *, data: Union[List[Table], List[User], List[Feature]], index: str) -> str:
         """
         Updates the existing index in elasticsearch
@@ -665,6 +785,7 @@ class ElasticsearchProxy(BaseProxy):
         return self._update_document_helper(data=data, index=index)
 
     @timer_with_counter
+    @invalidating_write
     def delete_document(self, *, data: List[str], index: str) -> str:
         if not index:
             raise Exception('Index cant be empty for deleting document')
@@ -675,35 +796,18 @@ class ElasticsearchProxy(BaseProxy):
         return self._delete_document_helper(data=data, index=index)
 
     def _create_document_helper(self, data: Union[List[Table], List[User], List[Feature]], index: str) -> str:
-        # fetch indices that use our chosen alias (should only ever return one in a list)
-        indices = self._fetch_old_index(index)
-
-        for i in indices:
-            # build a list of elasticsearch actions for bulk upload
-            actions = self._build_index_actions(data=data, index_key=i)
-
-            # bulk create or update data
-            self._bulk_helper(actions)
-
+        # build a list of elasticsearch actions for bulk upload, to create or update data
+        self._bulk_write(alias=index, build_actions=lambda index_key: self._build_index_actions(data=data,
+                                                                                                index_key=index_key))
         return index
 
     def _update_document_helper(self, data: Union[List[Table], List[User], List[Feature]], index: str) -> str:
-        # fetch indices that use our chosen alias (should only ever return one in a list)
-        indices = self._fetch_old_index(index)
-
-        for i in indices:
-            # build a list of elasticsearch actions for bulk update
-            actions = self._build_update_actions(data=data, index_key=i)
-
-            # bulk update existing documents in index
-            self._bulk_helper(actions)
-
+        # build a list of elasticsearch actions for bulk update of existing documents in index
+        self._bulk_write(alias=index, build_actions=lambda index_key: self._build_update_actions(data=data,
+                                                                                                 index_key=index_key))
         return index
 
     def _delete_document_helper(self, data: List[str], index: str) -> str:
-        # fetch indices that use our chosen alias
-        indices = self._fetch_old_index(index)
-
         # set the document type
         if index == USER_INDEX:
             type = User.get_type()
@@ -714,14 +818,48 @@ class ElasticsearchProxy(BaseProxy):
         else:
             raise Exception(f'document deletion not supported for index {index}')
 
-        for i in indices:
-            # build a list of elasticsearch actions for bulk deletion
-            actions = self._build_delete_actions(data=data, index_key=i, type=type)
+        # build a list of elasticsearch actions for bulk deletion
+        self._bulk_write(alias=index, build_actions=lambda index_key: self._build_delete_actions(data=data,
+                                                                                                 index_key=index_key,
+                                                                                                 type=type))
+        return index
 
-            # bulk delete documents in index
-            self._bulk_helper(actions)
+    def _bulk_write(self, alias: str, build_actions: Callable[[str], List[Dict[str, Any]]]) -> None:
+        """
+        Applies the actions to every index tied to alias
+        :param build_actions: builds the bulk actions for an index
+        :raise BulkWriteException: with the actions that failed
+        """
+        # fetch indices that use our chosen alias (should only ever return one in a list)
+        indices = self._fetch_old_index(alias)
+        targets = self._write_targets(alias, indices)
+        failures = [failure for target in targets for failure in self._bulk_helper(build_actions(target))]
+
+        alias_failures = [failure for failure in failures if self._is_alias_error(failure)]
+        if alias_failures:
+            # the alias was moved since it was resolved, e.g. by a rebuild of databuilder
+            self._alias_indices.pop(alias, None)
+            written = [target for target in targets if target not in {failure['index'] for failure in alias_failures}]
+            retries = [target for target in self._write_targets(alias, self._fetch_old_index(alias))
+                       if target not in written]
+            failures = [failure for failure in failures if failure['index'] in written] + \
+                [failure for target in retries for failure in self._bulk_helper(build_actions(target))]
+
+        if failures:
+            raise BulkWriteException(f'Failed to write {len(failures)} documents of {alias}', failures=failures)
 
-        return index
+    @staticmethod
+    def _write_targets(alias: str, indices: List[str]) -> List[str]:
+        # Write through the alias when it is tied to one index: elasticsearch resolves it for every action, so writes
+        # racing an alias swap by databuilder go to the new index, instead of re-creating the deleted old one.
+        return [alias] if len(indices) == 1 else indices
+
+    @staticmethod
+    def _is_alias_error(failure: Dict[str, Any]) -> bool:
+        """
+        Whether the write failed because the alias was moved, e.g. its index was deleted or another one was added
+        """
+        return failure['error_type'] == 'index_not_found_exception' or 'alias' in (failure['error'] or '')
 
     def _build_index_actions(
             self, data: Union[List[Table], List[User], List[Feature]], index_key: str) -> List[Dict[str, Any]]:
@@ -744,31 +882,143 @@ class ElasticsearchProxy(BaseProxy):
     def _build_delete_actions(self, data: List[str], index_key: str, type: str) -> List[Dict[str, Any]]:
         return [{'delete': {'_index': index_key, '_id': id, '_type': type}} for id in data]
 
-    def _bulk_helper(self, actions: List[Dict[str, Any]]) -> None:
-        result = self.elasticsearch.bulk(body=actions)
+    def _bulk_helper(self, actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Sends the actions in requests of up to BULK_CHUNK_SIZE documents and BULK_MAX_CHUNK_BYTES,
+        BULK_MAX_WORKERS at a time
+        :return: the actions that failed, see _bulk_failure
+        """
+        chunks = self._chunk_bulk_actions(actions)
+        if len(chunks) <= 1:
+            return [failure for chunk in chunks for failure in self._send_bulk_chunk(chunk)]
+
+        with ThreadPoolExecutor(max_workers=min(self.BULK_MAX_WORKERS, len(chunks))) as executor:
+            return [failure for failures in executor.map(self._send_bulk_chunk, chunks) for failure in failures]
+
+    def _chunk_bulk_actions(self, actions: List[Dict[str, Any]]) -> List[List[List[Dict[str, Any]]]]:
+        """
+        :return: chunks of documents, as the action and the source (but for deletions) of every document
+        """
+        documents = []
+        i = 0
+        while i < len(actions):
+            size = 1 if 'delete' in actions[i] else 2
+            documents.append(actions[i:i + size])
+            i += size
+
+        chunks: List[List[List[Dict[str, Any]]]] = []
+        chunk: List[List[Dict[str, Any]]] = []
+        chunk_bytes = 0
+        for document in documents:
+            # the size of the lines of the document in the body of the request
+            document_bytes = sum(len(json.dumps(line, default=str).encode('utf-8')) + 1 for line in document)
+            if chunk and (len(chunk) == self.BULK_CHUNK_SIZE or
+                          chunk_bytes + document_bytes > self.BULK_MAX_CHUNK_BYTES):
+                chunks.append(chunk)
+                chunk = []
+                chunk_bytes = 0
+            chunk.append(document)
+            chunk_bytes += document_bytes
+
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @classmethod
+    def _is_retryable(cls, status: Any) -> bool:
+        # a connection error has no status
+        return not isinstance(status, int) or status == 429 or status >= 500
+
+    def _send_bulk_chunk(self, documents: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Sends a bulk request, retrying the documents rejected with a 429 or 5xx up to BULK_MAX_RETRIES times
+        with an exponential backoff
+        :return: the actions that failed, see _bulk_failure
+        """
+        failures: List[Dict[str, Any]] = []
+        backoff_sec = self.BULK_INITIAL_BACKOFF_SEC
+        for attempt in range(self.BULK_MAX_RETRIES + 1):
+            if attempt > 0:
+                time.sleep(backoff_sec)
+                backoff_sec *= 2
+            last_attempt = attempt == self.BULK_MAX_RETRIES
+
+            try:
+                result = self.elasticsearch.bulk(body=[line for document in documents for line in document])
+            except TransportError as e:
+                if last_attempt or not self._is_retryable(e.status_code):
+                    LOGGING.exception('Error during Elasticsearch bulk actions')
+                    error = {'type': type(e).__name__, 'reason': str(e)}
+                    return failures + [self._bulk_failure(document[0], e.status_code, error)
+                                       for document in documents]
+                LOGGING.warning(f'Retrying Elasticsearch bulk actions after error {e.status_code}')
+                continue
+
+            retries, item_failures = self._split_bulk_errors(documents, result, retry=not last_attempt)
+            failures += item_failures
+            if not retries:
+                break
+            LOGGING.warning(f'Retrying {len(retries)} rejected Elasticsearch bulk actions')
+            documents = retries
+
+        if failures:
+            LOGGING.error(f'Error during Elasticsearch bulk actions: {failures}')
+        return failures
+
+    def _split_bulk_errors(self, documents: List[List[Dict[str, Any]]], result: Dict[str, Any],
+                           retry: bool) -> Tuple[List[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        :return: the documents to retry and the failures (see _bulk_failure) of the others in error
+        """
+        retries: List[List[Dict[str, Any]]] = []
+        failures: List[Dict[str, Any]] = []
+        if not result['errors']:
+            return retries, failures
+
+        # ES's error messages are nested within elasticsearch objects and can
+        # fail silently if you aren't careful
+        for document, item in zip(documents, result['items']):
+            item_result = next(iter(item.values()))
+            if 'error' not in item_result:
+                continue
+            if retry and self._is_retryable(item_result['status']):
+                retries.append(document)
+            else:
+                failures.append(self._bulk_failure(document[0], item_result['status'], item_result['error']))
+        return retries, failures
 
-        if result['errors']:
-            # ES's error messages are nested within elasticsearch objects and can
-            # fail silently if you aren't careful
-            LOGGING.error('Error during Elasticsearch bulk actions')
-            LOGGING.debug(result['items'])
-            return
+    @staticmethod
+    def _bulk_failure(action: Dict[str, Any], status: Any, error: Any) -> Dict[str, Any]:
+        operation, metadata = next(iter(action.items()))
+        return {
+            'id': metadata.get('_id'),
+            'index': metadata.get('_index'),
+            'operation': operation,
+            'status': status,
+            'error_type': error.get('type') if isinstance(error, dict) else None,
+            'error': error.get('reason') if isinstance(error, dict) else str(error),
+        }
 
     def _fetch_old_index(self, alias: str) -> List[str]:
         """
         Retrieve all indices that are currently tied to alias
-        (Can most often expect only one index to be returned in this list)
+        (Can most often expect only one index to be returned in this list).
+        They are remembered until a write finds the alias was moved, see _bulk_write.
         :return: list of elasticsearch indices
         """
+        if alias in self._alias_indices:
+            return self._alias_indices[alias]
+
         try:
-            indices = self.elasticsearch.indices.get_alias(index=alias).keys()
-            return indices
+            indices = list(self.elasticsearch.indices.get_alias(index=alias).keys())
         except NotFoundError:
             LOGGING.warn('Received index not found error from Elasticsearch', exc_info=True)
 
             # create a new index if there isn't already one that is usable
-            new_index = self._create_index_helper(alias=alias)
-            return [new_index]
+            indices = [self._create_index_helper(alias=alias)]
+
+        self._alias_indices[alias] = indices
+        return indices
 
     def _create_index_helper(self, alias: str) -> str:
         def _get_mapping(alias: str) -> str:
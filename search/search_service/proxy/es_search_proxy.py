@@ -15,6 +15,8 @@ from elasticsearch_dsl.query import MultiMatch
 from elasticsearch_dsl.response import Response
 from werkzeug.exceptions import InternalServerError
 
+from search_service.proxy.cache import cached_search
+
 BOOL_QUERY = 'bool'
 WILDCARD_QUERY = 'wildcard'
 TERM_QUERY = 'term'
@@ -271,6 +273,32 @@ class ElasticsearchProxy():
             # if resource types are not defined then search all resources
             resource_types = self.PRIMARY_ENTITIES
 
+        query_term = query_term.strip()
+
+        # the order of the resource types, of the filters and of their values doesn't change the results
+        request = {
+            'query_term': query_term,
+            'page_index': page_index,
+            'results_per_page': results_per_page,
+            'resource_types': sorted(resource.name for resource in resource_types),
+            'filters': sorted([f.name, f.operation, sorted(f.values)] for f in filters),
+        }
+
+        return cached_search(client=self.elasticsearch,
+                             aliases=[f"{resource.name.lower()}_search_index" for resource in resource_types],
+                             request=request,
+                             search=lambda: self._search(query_term=query_term,
+                                                         page_index=page_index,
+                                                         results_per_page=results_per_page,
+                                                         resource_types=resource_types,
+                                                         filters=filters))
+
+    def _search(self, *,
+                query_term: str,
+                page_index: int,
+                results_per_page: int,
+                resource_types: List[Resource],
+                filters: List[Filter]) -> SearchResponse:
         queries: Dict[Resource, Q] = {}
         for resource in resource_types:
             # build a query for each resource to search
@@ -8,6 +8,7 @@ from setuptools import find_packages, setup
 __version__ = '2.11.1'
 
 oidc = ['flaskoidc>=1.0.0']
+redis = ['redis>=3.5.3']
 
 requirements_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'requirements.txt')
 with open(requirements_path) as requirements_file:
@@ -21,7 +22,7 @@ requirements_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'r
 with open(requirements_path) as requirements_file:
     requirements_dev = requirements_file.readlines()
 
-all_deps = requirements + requirements_common + requirements_dev + oidc
+all_deps = requirements + requirements_common + requirements_dev + oidc + redis
 
 setup(
     name='amundsen-search',
@@ -38,7 +39,8 @@ setup(
     extras_require={
         'all': all_deps,
         'dev': requirements_dev,
-        'oidc': oidc
+        'oidc': oidc,
+        'redis': redis
     },
     python_requires=">=3.6"
 )
@@ -12,6 +12,7 @@ from mock import (
 
 from search_service import create_app
 from search_service.api.document import DocumentTablesAPI
+from search_service.exception import BulkWriteException
 from search_service.models.table import Table
 from search_service.models.tag import Tag
 
@@ -35,6 +36,20 @@ class TestDocumentTablesAPI(unittest.TestCase):
         self.assertEqual(list(response)[1], HTTPStatus.OK)
         mock_proxy.create_document.assert_called_with(data=[], index='fake_index')
 
+    @patch('search_service.api.document.reqparse.RequestParser')
+    @patch('search_service.api.document.get_proxy_client')
+    def test_post_reports_failed_documents(self, get_proxy: MagicMock, RequestParser: MagicMock) -> None:
+        mock_proxy = get_proxy.return_value = Mock()
+        RequestParser().parse_args.return_value = dict(data=[], index='fake_index')
+        failures = [{'id': 'table1', 'index': 'fake_index_1', 'operation': 'index', 'status': 400,
+                     'error_type': 'mapper_parsing_exception', 'error': 'failed to parse'}]
+        mock_proxy.create_document.side_effect = BulkWriteException('Failed to write 1 documents of fake_index',
+                                                                    failures=failures)
+
+        response = DocumentTablesAPI().post()
+        self.assertEqual(list(response)[1], HTTPStatus.INTERNAL_SERVER_ERROR)
+        self.assertEqual(list(response)[0]['failures'], failures)
+
     @patch('search_service.api.document.reqparse.RequestParser')
     @patch('search_service.api.document.get_proxy_client')
     def test_put(self, get_proxy: MagicMock, RequestParser: MagicMock) -> None:
@@ -0,0 +1,46 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from http import HTTPStatus
+from unittest import TestCase
+
+from mock import Mock, patch
+
+from search_service import create_app
+from tests.unit.api.table.fixtures import mock_json_response, mock_proxy_results
+
+
+class TestExportAPI(TestCase):
+
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='search_service.config.Config')
+        self.app.config['SEARCH_EXPORT_CHUNK_SIZE'] = 2
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+        self.mock_client = patch('search_service.api.export.get_proxy_client')
+        self.mock_proxy = self.mock_client.start().return_value = Mock()
+
+    def tearDown(self) -> None:
+        self.mock_client.stop()
+        self.app_context.pop()
+
+    def test_should_stream_documents_as_ndjson(self) -> None:
+        self.mock_proxy.export_documents.return_value = iter([[mock_proxy_results(), mock_proxy_results()],
+                                                              [mock_proxy_results()]])
+
+        response = self.app.test_client().get('/export?query_term=searchterm')
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        self.assertEqual([json.loads(line) for line in response.data.decode().splitlines()],
+                         [mock_json_response()] * 3)
+        self.mock_proxy.export_documents.assert_called_with(query_term='searchterm', index='table_search_index',
+                                                            chunk_size=2)
+
+    def test_should_fail_for_unsupported_index(self) -> None:
+        response = self.app.test_client().get('/export?index=unknown_index')
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.mock_proxy.export_documents.assert_not_called()
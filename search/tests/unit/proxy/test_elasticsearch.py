@@ -1,20 +1,23 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import unittest
 from typing import (  # noqa: F401
-    Any, Iterable, List,
+    Any, Dict, Iterable, List,
 )
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
 from amundsen_common.models.api import health_check
+from elasticsearch.exceptions import TransportError
 from elasticsearch_dsl import Search
 
 from search_service import create_app
 from search_service.api.feature import FEATURE_INDEX
 from search_service.api.table import TABLE_INDEX
 from search_service.api.user import USER_INDEX
+from search_service.exception import BulkWriteException
 from search_service.models.dashboard import Dashboard
 from search_service.models.feature import Feature, SearchFeatureResult
 from search_service.models.search_result import SearchResult
@@ -324,6 +327,33 @@ class TestElasticsearchProxy(unittest.TestCase):
                                  vars(expected.results[i]),
                                  "Search result doesn't match with expected result!")
 
+    @patch('elasticsearch_dsl.Search.execute')
+    @patch('elasticsearch_dsl.Search.scan')
+    def test_search_all_results_with_scroll(self, mock_scan: MagicMock, mock_execute: MagicMock) -> None:
+        mock_scan.return_value = iter([TableResponse(result=vars(self.mock_result1)),
+                                       TableResponse(result=vars(self.mock_result2))])
+
+        resp = self.es_proxy.fetch_table_search_results(query_term='test_query_term', page_index=-1)
+
+        self.assertEqual(resp.total_results, 2)
+        self.assertEqual([table.key for table in resp.results], ['test_key', 'test_key2'])
+        mock_execute.assert_not_called()
+
+    @patch('elasticsearch_dsl.Search.scan')
+    def test_export_documents(self, mock_scan: MagicMock) -> None:
+        mock_scan.return_value = iter([TableResponse(result=vars(self.mock_result1)),
+                                       TableResponse(result=vars(self.mock_result2)),
+                                       TableResponse(result=vars(self.mock_result1))])
+
+        chunks = list(self.es_proxy.export_documents(index=TABLE_INDEX, chunk_size=2))
+
+        self.assertEqual([[table.key for table in chunk] for chunk in chunks],
+                         [['test_key', 'test_key2'], ['test_key']])
+
+    def test_export_documents_raise_exception_unknown_index(self) -> None:
+        with self.assertRaises(Exception):
+            self.es_proxy.export_documents(index='unknown_index')
+
     @patch('elasticsearch_dsl.Search.execute')
     def test_search_table_filter(self, mock_search: MagicMock) -> None:
         mock_results = MagicMock()
@@ -427,6 +457,42 @@ class TestElasticsearchProxy(unittest.TestCase):
         self.assertEqual(self.es_proxy.parse_query_term(term,
                                                         index=TABLE_INDEX), expected_result)
 
+    def test_parse_query_term_with_prefix_fields(self) -> None:
+        term = 'test'
+        expected_result = "(name.prefix:(test) OR name:(test) OR schema.prefix:(test) OR " \
+                          "schema:(test) OR description:(test*) OR description:(test) OR " \
+                          "column_names.prefix:(test) OR column_names:(test) OR " \
+                          "column_descriptions:(test*) OR column_descriptions:(test))"
+        self.assertEqual(self.es_proxy.parse_query_term(term,
+                                                        index=TABLE_INDEX,
+                                                        prefix_fields=True), expected_result)
+
+    def test_has_prefix_fields(self) -> None:
+        new_mapping = {'table_index_1': {'mappings': {'name.prefix': {'full_name': 'name.prefix'}}}}
+        new_mapping_with_type = {'table_index_1': {'mappings': {'table': {'name.prefix': {}}}}}
+        old_mapping = {'table_index_1': {'mappings': {}}}
+
+        for response, expected in [(new_mapping, True), (new_mapping_with_type, True), (old_mapping, False)]:
+            with self.subTest(response=response):
+                self.es_proxy._prefix_mappings.clear()
+                self.es_proxy.elasticsearch.indices.get_field_mapping.return_value = response
+
+                self.assertEqual(self.es_proxy.has_prefix_fields(TABLE_INDEX), expected)
+
+    def test_has_prefix_fields_is_cached(self) -> None:
+        get_field_mapping = self.es_proxy.elasticsearch.indices.get_field_mapping
+        get_field_mapping.side_effect = Exception('Boom!')
+
+        self.assertFalse(self.es_proxy.has_prefix_fields(TABLE_INDEX))
+        self.assertFalse(self.es_proxy.has_prefix_fields(TABLE_INDEX))
+        get_field_mapping.assert_called_once_with(fields='name.prefix', index=TABLE_INDEX)
+
+        with patch.object(self.es_proxy, 'PREFIX_MAPPING_TTL_SEC', 0):
+            get_field_mapping.side_effect = None
+            get_field_mapping.return_value = {'table_index_1': {'mappings': {'name.prefix': {}}}}
+
+            self.assertTrue(self.es_proxy.has_prefix_fields(TABLE_INDEX))
+
     def test_convert_query_json_to_query_dsl_term_and_filters(self) -> None:
         term = 'test'
         test_filters = {
@@ -722,6 +788,140 @@ class TestElasticsearchProxy(unittest.TestCase):
         _bulk = mock.create_autospec(mock_elasticsearch.bulk)
         _bulk.assert_called_with(body=expected_data)
 
+    def _bulk_item(self, id: str, status: int = 200, error_type: str = '') -> dict:
+        item = {'_index': 'table_index_1', '_id': id, 'status': status}
+        if error_type:
+            item['error'] = {'type': error_type, 'reason': f'{error_type} of {id}'}
+        return {'delete': item}
+
+    def test_delete_document_in_chunks(self) -> None:
+        mock_elasticsearch = self.es_proxy.elasticsearch
+        mock_elasticsearch.indices.get_alias.return_value = {'table_index_1': {}}
+        mock_elasticsearch.bulk.return_value = {'errors': False, 'items': []}
+
+        with patch.object(self.es_proxy, 'BULK_CHUNK_SIZE', 2):
+            self.es_proxy.delete_document(data=['id1', 'id2', 'id3', 'id4', 'id5'], index=TABLE_INDEX)
+
+        self.assertEqual(sorted([action['delete']['_id'] for action in call[1]['body']]
+                                for call in mock_elasticsearch.bulk.call_args_list),
+                         [['id1', 'id2'], ['id3', 'id4'], ['id5']])
+
+    def test_chunk_bulk_actions_max_bytes(self) -> None:
+        actions = self.es_proxy._build_index_actions(data=[self.mock_result3, self.mock_result3, self.mock_result3],
+                                                     index_key='table_index_1')
+        document_bytes = sum(len(json.dumps(line)) + 1 for line in actions[:2])
+
+        with patch.object(self.es_proxy, 'BULK_MAX_CHUNK_BYTES', document_bytes * 2):
+            chunks = self.es_proxy._chunk_bulk_actions(actions)
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        self.assertEqual(chunks[0][0], actions[:2])
+
+    @patch('time.sleep')
+    def test_bulk_retries_rejected_documents(self, mock_sleep: MagicMock) -> None:
+        mock_elasticsearch = self.es_proxy.elasticsearch
+        mock_elasticsearch.indices.get_alias.return_value = {'table_index_1': {}}
+        mock_elasticsearch.bulk.side_effect = [
+            TransportError(503, 'unavailable'),
+            {'errors': True, 'items': [self._bulk_item('id1'),
+                                       self._bulk_item('id2', 429, 'es_rejected_execution_exception')]},
+            {'errors': False, 'items': [self._bulk_item('id2')]},
+        ]
+
+        self.es_proxy.delete_document(data=['id1', 'id2'], index=TABLE_INDEX)
+
+        self.assertEqual([action['delete']['_id'] for action in mock_elasticsearch.bulk.call_args[1]['body']],
+                         ['id2'])
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list], [1.0, 2.0])
+
+    @patch('time.sleep')
+    def test_bulk_reports_failed_documents(self, mock_sleep: MagicMock) -> None:
+        mock_elasticsearch = self.es_proxy.elasticsearch
+        mock_elasticsearch.indices.get_alias.return_value = {'table_index_1': {}}
+        rejected = {'errors': True, 'items': [self._bulk_item('id2', 429, 'es_rejected_execution_exception')]}
+        mock_elasticsearch.bulk.side_effect = [
+            {'errors': True, 'items': [self._bulk_item('id1', 400, 'mapper_parsing_exception'),
+                                       self._bulk_item('id2', 429, 'es_rejected_execution_exception')]},
+        ] + [rejected] * ElasticsearchProxy.BULK_MAX_RETRIES
+
+        with self.assertRaises(BulkWriteException) as context:
+            self.es_proxy.delete_document(data=['id1', 'id2'], index=TABLE_INDEX)
+
+        self.assertEqual([(failure['id'], failure['status'], failure['error_type'])
+                          for failure in context.exception.failures],
+                         [('id1', 400, 'mapper_parsing_exception'), ('id2', 429, 'es_rejected_execution_exception')])
+        self.assertEqual(mock_elasticsearch.bulk.call_count, ElasticsearchProxy.BULK_MAX_RETRIES + 1)
+
+    def test_create_document_during_alias_swap(self) -> None:
+        mock_elasticsearch = self.es_proxy.elasticsearch
+        mock_elasticsearch.indices.get_alias.return_value = {'table_index_1': {}}
+        aliases = {TABLE_INDEX: 'table_index_1'}
+        written: List[str] = []
+
+        def bulk(body: List[Dict[str, Any]]) -> Dict[str, Any]:
+            # databuilder swaps the alias to a new index and deletes the old one while the documents are written
+            aliases[TABLE_INDEX] = 'table_index_2'
+            items = []
+            for action in body[::2]:
+                index = aliases.get(action['index']['_index'], action['index']['_index'])
+                written.append(index)
+                items.append({'index': {'_index': index, '_id': action['index']['_id'], 'status': 201}})
+            return {'errors': False, 'items': items}
+
+        mock_elasticsearch.bulk.side_effect = bulk
+
+        self.es_proxy.create_document(data=[self.mock_result3], index=TABLE_INDEX)
+
+        # elasticsearch resolved the alias, instead of auto-creating the deleted index
+        self.assertEqual(written, ['table_index_2'])
+
+    def test_alias_resolution_is_cached(self) -> None:
+        mock_elasticsearch = self.es_proxy.elasticsearch
+        mock_elasticsearch.indices.get_alias.return_value = {'table_index_1': {}}
+        mock_elasticsearch.bulk.return_value = {'errors': False, 'items': []}
+
+        self.es_proxy.delete_document(data=['id1'], index=TABLE_INDEX)
+        self.es_proxy.delete_document(data=['id2'], index=TABLE_INDEX)
+
+        mock_elasticsearch.indices.get_alias.assert_called_once_with(index=TABLE_INDEX)
+
+    def test_alias_is_resolved_again_after_an_alias_error(self) -> None:
+        mock_elasticsearch = self.es_proxy.elasticsearch
+        mock_elasticsearch.indices.get_alias.side_effect = [{'table_index_1': {}},
+                                                            {'table_index_1': {}, 'table_index_2': {}}]
+        error = {'type': 'illegal_argument_exception',
+                 'reason': f'no write index is defined for alias [{TABLE_INDEX}]'}
+        mock_elasticsearch.bulk.side_effect = [
+            {'errors': True, 'items': [{'delete': {'_index': TABLE_INDEX, '_id': 'id1', 'status': 400,
+                                                   'error': error}}]},
+            {'errors': False, 'items': [self._bulk_item('id1')]},
+            {'errors': False, 'items': [self._bulk_item('id1')]},
+            {'errors': False, 'items': [self._bulk_item('id2')]},
+            {'errors': False, 'items': [self._bulk_item('id2')]},
+        ]
+
+        self.es_proxy.delete_document(data=['id1'], index=TABLE_INDEX)
+        self.es_proxy.delete_document(data=['id2'], index=TABLE_INDEX)
+
+        self.assertEqual([call[1]['body'][0]['delete']['_index'] for call in mock_elasticsearch.bulk.call_args_list],
+                         [TABLE_INDEX, 'table_index_1', 'table_index_2', 'table_index_1', 'table_index_2'])
+        self.assertEqual(mock_elasticsearch.indices.get_alias.call_count, 2)
+
+    def test_alias_is_resolved_again_when_its_index_is_gone(self) -> None:
+        mock_elasticsearch = self.es_proxy.elasticsearch
+        mock_elasticsearch.indices.get_alias.side_effect = [{'table_index_1': {}, 'table_index_2': {}},
+                                                            {'table_index_2': {}, 'table_index_3': {}}]
+        mock_elasticsearch.bulk.side_effect = [
+            {'errors': True, 'items': [self._bulk_item('id1', 404, 'index_not_found_exception')]},
+            {'errors': False, 'items': [self._bulk_item('id1')]},
+            {'errors': False, 'items': [self._bulk_item('id1')]},
+        ]
+
+        self.es_proxy.delete_document(data=['id1'], index=TABLE_INDEX)
+
+        self.assertEqual([call[1]['body'][0]['delete']['_index'] for call in mock_elasticsearch.bulk.call_args_list],
+                         ['table_index_1', 'table_index_2', 'table_index_3'])
+
     def test_get_instance_string(self) -> None:
         result = self.es_proxy._get_instance('column', 'value')
         self.assertEqual('value', result)
@@ -0,0 +1,54 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from search_service import create_app, proxy
+from search_service.api.search import SearchAPI
+
+
+class TestProxyClient(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='search_service.config.LocalConfig')
+        self.app.config['PROXY_ENDPOINT'] = 'http://es:9200'
+        self.app.config['PROXY_USER'] = 'elastic'
+        self.app.config['PROXY_PASSWORD'] = 'password'
+        self.app.config['PROXY_CLIENT_KEY'] = None
+        self.app.config['ELASTICSEARCH_MAX_CONNECTIONS'] = 16
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+        self.clients = patch.multiple(proxy, _elasticsearch_client=None, _proxy_client=None)
+        self.clients.start()
+
+    def tearDown(self) -> None:
+        self.clients.stop()
+        self.app_context.pop()
+
+    def test_get_elasticsearch_client(self) -> None:
+        with patch('search_service.proxy.Elasticsearch') as mock_elasticsearch:
+            client = proxy.get_elasticsearch_client()
+
+            self.assertIs(proxy.get_elasticsearch_client(), client)
+            mock_elasticsearch.assert_called_once_with('http://es:9200',
+                                                       http_auth=('elastic', 'password'),
+                                                       maxsize=16,
+                                                       timeout=10.0,
+                                                       max_retries=3,
+                                                       sniff_on_start=False,
+                                                       sniff_on_connection_fail=False,
+                                                       sniffer_timeout=None)
+
+    def test_get_elasticsearch_client_from_config(self) -> None:
+        client = MagicMock()
+        self.app.config['PROXY_CLIENT_KEY'] = client
+
+        self.assertIs(proxy.get_elasticsearch_client(), client)
+
+    def test_client_is_shared_by_all_apis(self) -> None:
+        client = proxy.get_elasticsearch_client()
+
+        self.assertIs(proxy.get_proxy_client().elasticsearch, client)  # type: ignore
+        self.assertIs(SearchAPI().search_proxy.elasticsearch, client)
+        self.assertIs(SearchAPI().search_proxy.elasticsearch, client)
@@ -0,0 +1,151 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+from amundsen_common.models.search import Filter, SearchResponse
+from elasticsearch_dsl.utils import AttrDict
+
+from search_service import config, create_app
+from search_service.proxy import cache
+from search_service.proxy.cache.local_cache import LocalLRUCache
+from search_service.proxy.cache.redis_cache import RedisCache
+from search_service.proxy.elasticsearch import ElasticsearchProxy as LegacyElasticsearchProxy
+from search_service.proxy.es_search_proxy import ElasticsearchProxy, Resource
+
+
+class TestSearchCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='search_service.config.LocalConfig')
+        self.app.config[config.SEARCH_CACHE] = config.SEARCH_CACHES['LOCAL']
+        self.app.config[config.SEARCH_CACHE_KWARGS] = {'max_size': 2}
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        cache._search_cache = None
+        cache._alias_indices.clear()
+
+        self.client = MagicMock()
+        self.client.indices.get_alias.return_value = {'table_index_1': {'aliases': {'table_search_index': {}}}}
+        self.es_proxy = ElasticsearchProxy(client=self.client)
+        self.searches = 0
+
+        def search(**kwargs: object) -> SearchResponse:
+            self.searches += 1
+            return SearchResponse(msg='Success', page_index=kwargs['page_index'], results_per_page=10,
+                                  results={'table': {'results': [], 'total_results': self.searches}},
+                                  status_code=200)
+
+        self._search = patch.object(self.es_proxy, '_search', side_effect=search)
+        self._search.start()
+
+    def tearDown(self) -> None:
+        self._search.stop()
+        cache._search_cache = None
+        cache._alias_indices.clear()
+        self.app_context.pop()
+
+    def _search_tables(self, query_term: str = 'test', page_index: int = 0) -> SearchResponse:
+        return self.es_proxy.search(query_term=query_term,
+                                    page_index=page_index,
+                                    results_per_page=10,
+                                    resource_types=[Resource.TABLE],
+                                    filters=[Filter(name='schema', values=['a', 'b'], operation='OR'),
+                                             Filter(name='tag', values=['c'], operation='AND')])
+
+    def test_cached_search(self) -> None:
+        statsd_client = MagicMock()
+        with patch('search_service.proxy.cache._get_statsd_client', return_value=statsd_client):
+            first = self._search_tables()
+            second = self.es_proxy.search(query_term=' test ',
+                                          page_index=0,
+                                          results_per_page=10,
+                                          resource_types=[Resource.TABLE],
+                                          filters=[Filter(name='tag', values=['c'], operation='AND'),
+                                                   Filter(name='schema', values=['b', 'a'], operation='OR')])
+            self._search_tables(page_index=1)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.searches, 2)
+        self.assertEqual([call[0][0] for call in statsd_client.incr.call_args_list],
+                         ['search.cache_miss', 'search.cache_hit', 'search.cache_miss'])
+        self.client.indices.get_alias.assert_called_once_with(name='table_search_index', ignore=[404])
+
+    def test_cached_as_json(self) -> None:
+        # document fields are read from elasticsearch_dsl hits
+        source = AttrDict({'name': 'foo', 'tags': ['a', 'b'], 'programmatic_descriptions': [{'source': 'c'}]})
+        response = SearchResponse(msg='Success', page_index=0, results_per_page=10,
+                                  results={'table': {'results': [{'name': source['name'], 'tags': source['tags'],
+                                                                  'programmatic_descriptions':
+                                                                      source['programmatic_descriptions']}],
+                                                     'total_results': 1}},
+                                  status_code=200)
+        self._search.stop()
+        self._search = patch.object(self.es_proxy, '_search', return_value=response)
+        self._search.start()
+
+        self._search_tables()
+        value, _ = next(iter(cache.get_search_cache()._values.values()))  # type: ignore
+        self.assertEqual(json.loads(value)['results']['table']['results'][0]['tags'], ['a', 'b'])
+
+        cached = self._search_tables()
+        self.assertEqual(cached, response)
+        self.assertEqual(cached.results['table']['results'][0]['programmatic_descriptions'], [{'source': 'c'}])
+
+    def test_not_cached_without_cache(self) -> None:
+        self.app.config[config.SEARCH_CACHE] = None
+        self._search_tables()
+        self._search_tables()
+        self.assertEqual(self.searches, 2)
+
+    def test_alias_swap_invalidates(self) -> None:
+        self.app.config[config.SEARCH_CACHE_ALIAS_CHECK_SEC] = 0
+        self._search_tables()
+        self._search_tables()
+        self.client.indices.get_alias.return_value = {'table_index_2': {'aliases': {'table_search_index': {}}}}
+        self._search_tables()
+        self.assertEqual(self.searches, 2)
+
+    def test_document_writes_invalidate(self) -> None:
+        self._search_tables()
+        legacy_proxy = LegacyElasticsearchProxy(client=self.client)
+        legacy_proxy.delete_document(data=['id'], index='table_search_index')
+        self._search_tables()
+        self.assertEqual(self.searches, 2)
+
+    def test_backend_failure_searches(self) -> None:
+        with patch.object(LocalLRUCache, 'get', side_effect=Exception('down')):
+            self._search_tables()
+            self._search_tables()
+        self.assertEqual(self.searches, 2)
+
+
+class TestCaches(unittest.TestCase):
+    def test_local_lru_cache(self) -> None:
+        local_cache = LocalLRUCache(max_size=2)
+        local_cache.set('a', b'1', 60)
+        local_cache.set('b', b'2', 60)
+        local_cache.get('a')
+        local_cache.set('c', b'3', 60)
+
+        self.assertEqual(local_cache.get('a'), b'1')
+        self.assertIsNone(local_cache.get('b'))
+
+        local_cache.set('expired', b'4', 0)
+        self.assertIsNone(local_cache.get('expired'))
+        self.assertEqual(local_cache.get_counter('generation'), 0)
+        self.assertEqual(local_cache.incr('generation'), 1)
+        self.assertEqual(local_cache.get_counter('generation'), 1)
+
+    def test_redis_cache(self) -> None:
+        with patch('search_service.proxy.cache.redis_cache.Redis.from_url', return_value=fakeredis.FakeRedis()):
+            redis_cache = RedisCache(url='redis://localhost:6379/0')
+        redis_cache.set('a', b'1', 60)
+
+        self.assertEqual(redis_cache.get('a'), b'1')
+        self.assertIsNone(redis_cache.get('b'))
+        self.assertEqual(redis_cache.get_counter('generation'), 0)
+        self.assertEqual(redis_cache.incr('generation'), 1)
+        self.assertEqual(redis_cache.get_counter('generation'), 1)